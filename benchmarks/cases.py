@@ -0,0 +1,163 @@
+"""
+Benchmark cases for the qplotly hot paths.
+
+Each case is registered with :func:`case` and is a *setup* function taking
+a size and returning a zero-argument callable - the part that is timed.
+Inputs are built during setup so only qplotly's own work is measured.
+Sizes are listed per case; ``quick`` is the subset run by default.
+"""
+
+import numpy as np
+
+import qplotly
+
+CASES = {}
+
+POINTS = [10, 1_000, 100_000, 10_000_000]
+POINTS_QUICK = [10, 1_000, 100_000]
+PANELS = [1, 4, 16, 100, 400]
+PANELS_QUICK = [1, 16, 100]
+TRACES = [1, 10, 100, 1_000, 10_000]
+TRACES_QUICK = [1, 10, 100]
+
+
+def case(name, sizes, quick, unit):
+    """Register a benchmark setup function under *name*."""
+    def register(setup):
+        CASES[name] = dict(setup=setup, sizes=sizes, quick=quick, unit=unit)
+        return setup
+    return register
+
+
+def _signal(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(n, dtype=float), rng.standard_normal(n)
+
+
+def _grid(n):
+    """Side length of a square panel grid holding at least *n* panels."""
+    return int(np.ceil(np.sqrt(n)))
+
+
+# ---- Axes plotting methods ---------------------------------------------------
+
+@case("plot", POINTS, POINTS_QUICK, "points")
+def plot(n):
+    x, y = _signal(n)
+    return lambda: qplotly.figure().plot(x, y, label="y")
+
+
+@case("scatter", POINTS, POINTS_QUICK, "points")
+def scatter(n):
+    x, y = _signal(n)
+    return lambda: qplotly.figure().scatter(x, y, label="y")
+
+
+@case("hist", POINTS, POINTS_QUICK, "points")
+def hist(n):
+    _, y = _signal(n)
+    return lambda: qplotly.figure().hist(y, bins=50)
+
+
+@case("heatmap", POINTS, POINTS_QUICK, "cells")
+def heatmap(n):
+    side = _grid(n)
+    z = np.random.default_rng(0).standard_normal((side, side))
+    return lambda: qplotly.figure().heatmap(z)
+
+
+@case("stem", [10, 100, 1_000, 10_000], [10, 100, 1_000], "points")
+def stem(n):
+    x, y = _signal(n)
+    return lambda: qplotly.figure().stem(x, y)
+
+
+@case("fill_between", POINTS, POINTS_QUICK, "points")
+def fill_between(n):
+    x, y = _signal(n)
+    return lambda: qplotly.figure().fill_between(x, y - 1, y + 1)
+
+
+@case("errorbar", POINTS, POINTS_QUICK, "points")
+def errorbar(n):
+    x, y = _signal(n)
+    err = np.full(n, 0.1)
+    return lambda: qplotly.figure().errorbar(x, y, yerr=err)
+
+
+@case("plot_traces", TRACES, TRACES_QUICK, "traces")
+def plot_traces(n):
+    x, y = _signal(100)
+
+    def run():
+        fig = qplotly.figure()
+        for _ in range(n):
+            fig.plot(x, y)
+    return run
+
+
+@case("channels", [1, 16, 64, 256], [1, 16, 64], "channels")
+def channels(n):
+    rng = np.random.default_rng(0)
+    t = np.arange(60_000) / 1000.0
+    X = rng.standard_normal((t.size, n)).cumsum(axis=0)
+    return lambda: qplotly.figure().channels(t, X)
+
+
+@case("eventplot", [10, 100, 1_000, 10_000], [10, 100, 1_000], "events")
+def eventplot(n):
+    events = np.sort(np.random.default_rng(0).uniform(0, 100, n))
+    return lambda: qplotly.figure().eventplot(events)
+
+
+@case("axvspan", [10, 100, 1_000, 10_000], [10, 100, 1_000], "spans")
+def axvspan(n):
+    edges = np.sort(np.random.default_rng(0).uniform(0, 100, 2 * n))
+    return lambda: qplotly.figure().axvspan(edges[0::2], edges[1::2])
+
+
+@case("texts", [10, 1_000, 20_000, 100_000], [10, 1_000, 20_000], "labels")
+def texts(n):
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 100, n), rng.uniform(0, 100, n)
+    labels = np.arange(n)
+    return lambda: qplotly.figure().texts(x, y, labels, cull=True)
+
+
+# ---- figure construction and finalize ------------------------------------------
+
+@case("subplots", PANELS, PANELS_QUICK, "panels")
+def subplots(n):
+    side = _grid(n)
+    return lambda: qplotly.subplots(side, side)
+
+
+@case("auto_color_scheme", TRACES, TRACES_QUICK, "traces")
+def auto_color_scheme(n):
+    x, y = _signal(100)
+    fig = qplotly.figure()
+    for i in range(n):
+        fig.plot(x, y, label=f"trace {i}")
+    return fig._apply_auto_color_scheme
+
+
+@case("subplot_legends", PANELS, PANELS_QUICK, "panels")
+def subplot_legends(n):
+    side = _grid(n)
+    x, y = _signal(100)
+    fig, _ = qplotly.subplots(side, side)
+    for row in fig._axes_grid:
+        for ax in row:
+            for i in range(3):
+                ax.plot(x, y, label=f"trace {i}")
+            ax.legend()
+    return fig._apply_subplot_legends
+
+
+@case("legend_policy", TRACES, TRACES_QUICK, "traces")
+def legend_policy(n):
+    x, y = _signal(100)
+    fig = qplotly.figure()
+    for i in range(n):
+        fig.plot(x, y, label=f"run {i}", color="black")
+    return fig._apply_legend_policy
@@ -0,0 +1,135 @@
+"""
+Run the qplotly benchmark suite and write machine-readable results.
+
+    python benchmarks/run.py                          # quick sizes, table
+    python benchmarks/run.py --full -o 0.2.0.json     # all sizes, JSON
+    python benchmarks/run.py -k plot -k hist          # selected cases
+    python benchmarks/run.py --compare 0.1.0.json     # ratio vs. a baseline
+
+For every case and size the wall time of the timed callable is taken as the
+best of ``--repeat`` runs (fresh setup each run), and its peak Python/NumPy
+allocation in one further run under :mod:`tracemalloc`.  An untimed
+warm-up run comes first so one-off import costs are not counted.
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cases import CASES  # noqa: E402
+
+
+def measure(setup, size, repeat):
+    """``(best_seconds, median_seconds, peak_bytes)`` for one case/size."""
+    setup(size)()  # warm-up: deferred imports, caches
+    times = []
+    for _ in range(repeat):
+        fn = setup(size)
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        del fn
+    times.sort()
+
+    fn = setup(size)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times[0], times[len(times) // 2], peak
+
+
+def environment():
+    import numpy
+    import plotly
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": numpy.__version__,
+        "plotly": plotly.__version__,
+    }
+
+
+def run(names, full=False, repeat=3, max_size=None):
+    """Yield one result dict per case and size."""
+    for name in names:
+        spec = CASES[name]
+        for size in spec["sizes"] if full else spec["quick"]:
+            if max_size is not None and size > max_size:
+                continue
+            best, median, peak = measure(spec["setup"], size, repeat)
+            yield {
+                "case": name, "size": size, "unit": spec["unit"],
+                "time_s": best, "median_s": median, "peak_bytes": peak,
+            }
+
+
+def _select(patterns):
+    if not patterns:
+        return list(CASES)
+    return [name for name in CASES if any(p in name for p in patterns)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="patterns", action="append",
+                        help="run cases whose name contains this (repeatable)")
+    parser.add_argument("--full", action="store_true",
+                        help="run every size, up to 10^7 points / 400 panels "
+                             "/ 10^4 traces")
+    parser.add_argument("--max-size", type=int, help="skip larger sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", help="write JSON results here")
+    parser.add_argument("--compare", help="JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {(r["case"], r["size"]): r for r in json.load(f)["results"]}
+
+    print(f"{'case':<20}{'size':>10}{'time':>12}{'peak':>12}"
+          + (f"{'vs base':>10}" if baseline else ""))
+    results = []
+    for row in run(_select(args.patterns), args.full, args.repeat, args.max_size):
+        results.append(row)
+        line = (f"{row['case']:<20}{row['size']:>10}"
+                f"{row['time_s'] * 1e3:>10.2f}ms"
+                f"{row['peak_bytes'] / 2**20:>10.2f}MB")
+        base = baseline.get((row["case"], row["size"]))
+        if base:
+            line += f"{row['time_s'] / base['time_s']:>9.2f}x"
+        print(line, flush=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment(), "results": results},
+                      f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Event-loop behaviour of the ``*_async`` export methods.
+
+    python -m pytest benchmarks/test_async_export.py
+    python benchmarks/test_async_export.py        # print loop-lag numbers
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+import qplotly
+from qplotly import _export
+
+POINTS = 100_000
+TRACES = 20
+EXPORTS = 8
+
+
+def big_figure():
+    fig = qplotly.figure()
+    rng = np.random.default_rng(0)
+    for i in range(TRACES):
+        fig.plot(rng.standard_normal(POINTS), label=f"trace {i}")
+    return fig
+
+
+async def loop_lag(work):
+    """Run *work* while a 1 ms heartbeat measures the worst loop stall."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal worst
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - start - 0.001)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)  # heartbeat running before the work starts
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beat
+    return worst, elapsed
+
+
+def test_async_export_keeps_loop_responsive():
+    figs = [big_figure() for _ in range(EXPORTS)]
+
+    async def blocking():
+        for fig in figs:
+            fig.to_json()
+
+    async def offloaded():
+        await asyncio.gather(*(fig.to_json_async() for fig in figs))
+
+    sync_lag, _ = asyncio.run(loop_lag(blocking))
+    async_lag, _ = asyncio.run(loop_lag(offloaded))
+    assert async_lag < sync_lag / 4, (sync_lag, async_lag)
+
+
+def test_concurrency_is_capped():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    fig = qplotly.figure()
+    fig.plot([1, 2, 3])
+    original = qplotly.QFigure.to_json
+
+    def slow_to_json(self, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return original(self, **kwargs)
+
+    figs = [qplotly.figure() for _ in range(4 * _export.EXPORT_WORKERS)]
+    qplotly.QFigure.to_json = slow_to_json
+    try:
+        async def main():
+            await asyncio.gather(*(f.to_json_async() for f in figs))
+        asyncio.run(main())
+    finally:
+        qplotly.QFigure.to_json = original
+    assert peak <= _export.EXPORT_WORKERS
+
+
+def test_timeout_and_cancel_leave_no_file(tmp_path):
+    fig = big_figure()
+    target = tmp_path / "out.html"
+
+    async def timed_out():
+        try:
+            await fig.savefig_async(str(target), timeout=0.001)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    assert asyncio.run(timed_out())
+    # let the background render finish; it must not commit the file
+    with fig._export_lock:
+        pass
+    time.sleep(0.05)
+    assert not target.exists()
+    assert list(tmp_path.iterdir()) == []
+
+    async def completed():
+        await fig.savefig_async(str(target))
+    asyncio.run(completed())
+    assert target.exists()
+    assert [p.name for p in tmp_path.iterdir()] == ["out.html"]
+
+
+if __name__ == "__main__":
+    figs = [big_figure() for _ in range(EXPORTS)]
+
+    async def blocking():
+        for fig in figs:
+            fig.to_json()
+
+    async def offloaded():
+        await asyncio.gather(*(fig.to_json_async() for fig in figs))
+
+    for name, work in (("to_json", blocking), ("to_json_async", offloaded)):
+        lag, elapsed = asyncio.run(loop_lag(work))
+        print(f"{name:<14} total {elapsed:6.2f} s   worst loop stall "
+              f"{lag * 1e3:8.1f} ms")
@@ -0,0 +1,34 @@
+"""
+Keep the benchmark suite runnable: every case at its smallest size.
+
+    python -m pytest benchmarks
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cases import CASES  # noqa: E402
+import run  # noqa: E402
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_case_runs(name):
+    spec = CASES[name]
+    best, median, peak = run.measure(spec["setup"], min(spec["quick"]), repeat=1)
+    assert 0 <= best <= median
+    assert peak >= 0
+
+
+def test_json_output(tmp_path):
+    out = tmp_path / "results.json"
+    run.main(["-k", "hist", "-k", "stem", "--max-size", "10", "--repeat", "1",
+              "-o", str(out)])
+    data = json.loads(out.read_text())
+    assert [(r["case"], r["size"]) for r in data["results"]] == \
+        [("hist", 10), ("stem", 10)]
+    assert data["environment"]["numpy"]
@@ -0,0 +1,60 @@
+"""
+Import-time benchmark for ``import qplotly``.
+
+Runs ``python -X importtime -c "import qplotly"`` in a fresh interpreter and
+checks the cumulative time reported for the package against ``TARGET_MS``,
+and that neither plotly nor NumPy is imported along the way.
+
+    python -m pytest benchmarks/test_import_time.py
+    python benchmarks/test_import_time.py          # print the breakdown
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+# Cumulative budget for ``import qplotly``, in milliseconds.  Generous enough
+# to cover compiling the sources when no bytecode cache is available.
+TARGET_MS = 100
+REPEATS = 5
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def importtime(module="qplotly"):
+    """``{module_name: (self_us, cumulative_us)}`` for one cold import."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, env=env)
+    timings = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def best_import_ms(module="qplotly", repeats=REPEATS):
+    return min(importtime(module)[module][1] for _ in range(repeats)) / 1000
+
+
+def test_import_does_not_load_plotly_or_numpy():
+    loaded = importtime()
+    heavy = [name for name in loaded
+             if name.partition(".")[0] in ("plotly", "numpy", "_plotly_utils")]
+    assert not heavy, f"import qplotly pulled in {heavy[:5]}"
+
+
+def test_import_time_under_target():
+    ms = best_import_ms()
+    assert ms < TARGET_MS, f"import qplotly took {ms:.1f} ms (target {TARGET_MS} ms)"
+
+
+if __name__ == "__main__":
+    timings = importtime()
+    for name, (own, total) in sorted(timings.items(), key=lambda kv: -kv[1][1])[:15]:
+        print(f"{total / 1000:8.2f} ms  {own / 1000:8.2f} ms  {name}")
+    print(f"best of {REPEATS}: {best_import_ms():.2f} ms (target {TARGET_MS} ms)")
@@ -0,0 +1,72 @@
+"""
+Stress test: pyplot-style rendering from many threads and asyncio tasks.
+
+Every worker draws through the module-level API (``qplotly.plot``,
+``title``, ``savefig``...) and checks that its output contains its own
+data and nothing else.
+
+    python -m pytest benchmarks/test_pyplot_threads.py
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import qplotly
+
+WORKERS = 16
+JOBS = 96
+
+
+def render(job):
+    """Draw one figure through the pyplot-style API and return its JSON."""
+    qplotly.plot([0, 1, 2], [job, job + 1, job + 2], label=f"job {job}")
+    qplotly.title(f"report {job}")
+    qplotly.xlabel("x")
+    qplotly.legend()
+    spec = qplotly.gcf().to_json()
+    qplotly.close()
+    return spec
+
+
+def check(job, spec):
+    fig = json.loads(spec)
+    assert len(fig["data"]) == 1, f"job {job} saw {len(fig['data'])} traces"
+    assert fig["data"][0]["name"] == f"job {job}"
+    assert fig["layout"]["title"]["text"] == f"report {job}"
+
+
+def test_thread_pool_pyplot_isolation():
+    with ThreadPoolExecutor(WORKERS) as pool:
+        specs = list(pool.map(render, range(JOBS)))
+    for job, spec in enumerate(specs):
+        check(job, spec)
+
+
+def test_figure_context_restores_outer_figure(tmp_path):
+    outer = qplotly.gcf()
+    with qplotly.figure_context() as inner:
+        assert qplotly.gcf() is inner
+        qplotly.plot([1, 2, 3])
+        qplotly.savefig(str(tmp_path / "inner.html"))
+    assert qplotly.gcf() is outer
+    assert len(outer.plotly_fig.data) == 0
+    qplotly.close()
+
+
+def test_asyncio_tasks_pyplot_isolation():
+    async def task(job):
+        with qplotly.figure_context():
+            qplotly.plot([0, 1, 2], [job, job + 1, job + 2], label=f"job {job}")
+            await asyncio.sleep(0)  # let every other task interleave here
+            qplotly.title(f"report {job}")
+            qplotly.xlabel("x")
+            qplotly.legend()
+            await asyncio.sleep(0)
+            return qplotly.gcf().to_json()
+
+    async def main():
+        return await asyncio.gather(*(task(job) for job in range(JOBS)))
+
+    for job, spec in enumerate(asyncio.run(main())):
+        check(job, spec)
@@ -0,0 +1,59 @@
+"""
+Regressions in inputs the hot paths must keep accepting.
+
+    python -m pytest benchmarks/test_regressions.py
+"""
+
+import numpy as np
+import pytest
+
+import qplotly
+from qplotly import _rc
+
+# Colour names that read as two colour (or marker) codes under the grammar
+REPEATED_CODE_COLORS = sorted(
+    name for name in _rc.CSS_COLORS
+    if len([ch for ch in name if ch in _rc.FMT_COLORS]) > 1
+    or len([ch for ch in name if ch in _rc.FMT_MARKERS]) > 1)
+
+
+@pytest.mark.parametrize("name", REPEATED_CODE_COLORS)
+def test_fmt_colour_name(name):
+    assert _rc.parse_fmt(name) == (name, None, None)
+    fig, ax = qplotly.subplots()
+    ax.plot([0, 1], [0, 1], name)
+    trace = fig._fig.data[0]
+    assert trace.line.color == name
+    assert trace.mode == "lines"
+
+
+def test_fmt_grammar_still_rejects_duplicates():
+    with pytest.raises(ValueError, match="two color symbols"):
+        _rc.parse_fmt("rr")
+
+
+def test_mixed_category_list_keeps_elements():
+    fig, ax = qplotly.subplots()
+    ax.bar(["a", 1, 2.5], [1, 2, 3])
+    assert list(fig._fig.data[0].x) == ["a", 1, 2.5]
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("method", ["heatmap", "pcolormesh", "contour"])
+def test_reduce_all_nan_grid(method):
+    z = np.full((400, 400), np.nan)
+    axis = np.arange(400.0)
+    fig, ax = qplotly.subplots()
+    if method == "heatmap":
+        ax.heatmap(z, max_pixels=100)
+    else:
+        getattr(ax, method)(axis, axis, z, max_pixels=100)
+
+
+@pytest.mark.parametrize("method", ["axhline", "axvline"])
+def test_axline_forwards_keywords(method):
+    fig, ax = qplotly.subplots()
+    getattr(ax, method)(1, alpha=0.4)
+    getattr(ax, method)([1, 2], alpha=0.4)
+    assert fig._fig.layout.shapes[0].opacity == 0.4
+    assert fig._fig.data[0].opacity == 0.4
@@ -21,59 +21,72 @@ Usage:
 
 from __future__ import annotations
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
+import contextlib
+import contextvars
+import os
+import sys
+import threading
+import warnings
+
+from . import _deferred, _profile, _rc
+from ._rc import rc_context, rcdefaults, rcParams
+
+# plotly and NumPy are imported on first use, keeping ``import qplotly`` cheap
+_deferred.defer(
+    globals(),
+    np="numpy",
+    _cache=f"{__name__}._cache",
+    _data=f"{__name__}._data",
+    _export=f"{__name__}._export",
+    _image=f"{__name__}._image",
+    _lazy=f"{__name__}._lazy",
+    _mesh=f"{__name__}._mesh",
+    _payload=f"{__name__}._payload",
+    _reduce=f"{__name__}._reduce",
+    _skeleton=f"{__name__}._skeleton",
+)
+# plotly checks sys.modules for NumPy without importing it, so NumPy must be
+# fully imported before plotly is first used
+_deferred.defer(globals(), requires=("numpy",), go="plotly.graph_objects",
+                _style=f"{__name__}._style", _subplots="plotly.subplots")
 
 
 # ---------- Default color cycle (Plotly's built-in qualitative set) ----------
-DEFAULT_COLORS = [
-    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
-    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
-]
-
-# ---------- Matplotlib-style format string parser ----------
-_FMT_COLORS = {
-    "b": "blue", "g": "green", "r": "red", "c": "cyan",
-    "m": "magenta", "y": "yellow", "k": "black", "w": "white",
-}
+# rcParams["axes.color_cycle"] starts as this list
+DEFAULT_COLORS = _rc.DEFAULT_COLORS
 
-_FMT_MARKERS = {
-    "o": "circle", "s": "square", "^": "triangle-up", "v": "triangle-down",
-    "D": "diamond", "d": "diamond", "+": "cross", "x": "x",
-    "*": "star", "p": "pentagon", "h": "hexagon",
-}
 
-_FMT_LINES = {
-    "-": "solid", "--": "dash", "-.": "dashdot", ":": "dot",
-}
+def _resolve_linewidth(lw=None, linewidth=None):
+    return lw if lw is not None else linewidth
 
 
-def _parse_fmt(fmt: str):
-    """Parse a matplotlib-style format string like 'ro--' into components."""
-    color = None
-    marker = None
-    linestyle = None
+# go.Heatmap arguments imshow() took before it drew a go.Image
+_IMSHOW_HEATMAP_KWARGS = ("colorscale", "zmin", "zmax", "zmid", "zauto",
+                          "showscale", "reversescale", "zsmooth", "xgap",
+                          "ygap", "connectgaps", "hoverongaps", "transpose")
 
-    s = fmt
-    # Try to extract line style first (two-char patterns before one-char)
-    for ls_key in ("--", "-.", ":", "-"):
-        if ls_key in s:
-            linestyle = _FMT_LINES[ls_key]
-            s = s.replace(ls_key, "", 1)
-            break
+# CSS pixels per typographic point (96 dpi / 72)
+_PX_PER_POINT = 96 / 72
 
-    for ch in s:
-        if ch in _FMT_COLORS and color is None:
-            color = _FMT_COLORS[ch]
-        elif ch in _FMT_MARKERS and marker is None:
-            marker = _FMT_MARKERS[ch]
+# errorbar() draws at most this many whiskers (and switches to a band above
+# this many points when errorstyle='auto').
+_ERRORBAR_MAX_BARS = 500
 
-    return color, marker, linestyle
+# Curvilinear pcolormesh meshes up to this many cells are drawn as polygons,
+# binned into this many colour levels; larger ones are resampled to pixels.
+_MESH_POLYGON_CELLS = 2500
+_MESH_POLYGON_LEVELS = 64
+# Legends with more labelled traces than this are collapsed at finalize
+# (see QFigure._apply_legend_policy); Axes.legend(max_entries=) overrides.
+_LEGEND_MAX_ENTRIES = 50
 
 
-def _resolve_linewidth(lw=None, linewidth=None):
-    return lw if lw is not None else linewidth
+# Axes.texts(): matplotlib alignment -> plotly textposition, and the
+# fraction of the label box lying left of / below its anchor point
+_TEXT_HPOSITION = {"left": "right", "center": "center", "right": "left"}
+_TEXT_VPOSITION = {"bottom": "top", "center": "middle", "top": "bottom"}
+_TEXT_HFRACTION = {"left": 0.0, "center": 0.5, "right": 1.0}
+_TEXT_VFRACTION = {"bottom": 0.0, "center": 0.5, "top": 1.0}
 
 
 # ===========================================================================
@@ -93,19 +106,22 @@ class Axes:
 
     # ---- colour cycling ---------------------------------------------------
     def _next_color(self):
-        c = DEFAULT_COLORS[self._color_idx % len(DEFAULT_COLORS)]
+        cycle = rcParams["axes.color_cycle"]
+        c = cycle[self._color_idx % len(cycle)]
         self._color_idx += 1
         return c
 
     # ---- internal helper to add a trace to the correct subplot cell -------
     def _add_trace(self, trace):
         # Only specify row/col for multi-subplot layouts
-        if self._parent._nrows == 1 and self._parent._ncols == 1:
-            self._fig.add_trace(trace)
-        else:
-            self._fig.add_trace(trace, row=self._row, col=self._col)
+        with _profile.stage("add_trace", self._parent):
+            if self._parent._nrows == 1 and self._parent._ncols == 1:
+                self._fig.add_trace(trace)
+            else:
+                self._fig.add_trace(trace, row=self._row, col=self._col)
 
         trace_idx = len(self._fig.data) - 1
+        self._parent._trace_origins[trace_idx] = _trace_origin()
 
         # Track if this trace used automatic coloring
         if getattr(self, '_next_trace_auto_colored', False):
@@ -113,10 +129,55 @@ class Axes:
             self._next_trace_auto_colored = False
 
         # Track traces with legend entries for per-subplot legends
-        if trace.showlegend and trace.name:
+        if getattr(trace, "showlegend", None) and trace.name:
             self._legend_traces.append(trace_idx)
             self._has_legend_entries = True
 
+    def _update_layout(self, **kwargs):
+        self._parent._update_layout(**kwargs)
+
+    def _apply_category_order(self, x=None, y=None):
+        """Keep the dictionary order of categorical x/y inputs on the axes."""
+        for axis_name, values in ((self._xaxis_name(), x),
+                                  (self._yaxis_name(), y)):
+            order = _data.category_order(values) if values is not None else None
+            if order is not None:
+                self._update_layout(**{axis_name: dict(
+                    categoryorder="array", categoryarray=order)})
+
+    def _encode_dates(self, x=None, y=None):
+        """Return *x*, *y* with datetime arrays as epoch milliseconds and
+        set the matching axis to ``type='date'``.
+
+        Numbers travel as compact typed arrays, where plotly would
+        otherwise format every timestamp as an ISO string.
+        """
+        out = []
+        for axis_name, values in ((self._xaxis_name(), x),
+                                  (self._yaxis_name(), y)):
+            ms = _data.epoch_ms(values)
+            if ms is not None:
+                if self._fig.layout[axis_name].type != "date":
+                    self._update_layout(**{axis_name: dict(type="date")})
+                values = ms
+            out.append(values)
+        return out
+
+    def _downcast(self, x, y):
+        """Return float64 *x*, *y* as float32 when
+        ``rcParams['data.precision']`` is ``'float32'``, except on date axes,
+        where epoch milliseconds need float64."""
+        if rcParams["data.precision"] != "float32":
+            return x, y
+        out = []
+        for axis_name, values in ((self._xaxis_name(), x),
+                                  (self._yaxis_name(), y)):
+            if (isinstance(values, np.ndarray) and values.dtype == np.float64
+                    and self._fig.layout[axis_name].type != "date"):
+                values = values.astype(np.float32)
+            out.append(values)
+        return out
+
     # ---- axis id helpers (for multi-subplot layouts) ----------------------
     def _xaxis_name(self):
         idx = self._parent._subplot_index(self._row, self._col)
@@ -126,89 +187,296 @@ class Axes:
         idx = self._parent._subplot_index(self._row, self._col)
         return "yaxis" if idx == 1 else f"yaxis{idx}"
 
+    def _panel_pixels(self):
+        """Approximate on-screen (width, height) of this panel in pixels."""
+        layout = self._fig.layout
+        xdomain = layout[self._xaxis_name()].domain or (0, 1)
+        ydomain = layout[self._yaxis_name()].domain or (0, 1)
+        width = (layout.width or 700) * (xdomain[1] - xdomain[0])
+        height = (layout.height or 450) * (ydomain[1] - ydomain[0])
+        return max(int(width), 1), max(int(height), 1)
+
     # ======================= plotting methods ==============================
 
     def plot(self, *args, label=None, color=None, linewidth=None, lw=None,
              linestyle=None, ls=None, marker=None, markersize=None, ms=None,
-             alpha=None, fmt=None, **kwargs):
+             alpha=None, fmt=None, data=None, x=None, y=None, **kwargs):
         """Line plot (like ``matplotlib.axes.Axes.plot``).
 
         Supports positional args:
             plot(y)
             plot(x, y)
             plot(x, y, 'r--')
+            plot('t', 'a', data=df)              # columns of *data*
+            plot(data=df, x='t', y=['a', 'b'])   # one line per column
+
+        pandas/polars Series, Arrow arrays and xarray DataArrays are taken
+        directly; ``plot(series)`` uses its index (or first coordinate) as x.
+
+        ``np.memmap`` arrays and :func:`npy` references are lazy: nothing is
+        read until the figure is finalized, when the data is streamed in
+        chunks and min/max-decimated to the panel's pixel width.
         """
+        # --- keyword / data= forms -----------------------------------------
+        if data is not None and isinstance(y, (list, tuple)):
+            labels = label if isinstance(label, (list, tuple)) else [label] * len(y)
+            for column, column_label in zip(y, labels):
+                self.plot(*args, label=column if column_label is None else column_label,
+                          color=color, linewidth=linewidth, lw=lw,
+                          linestyle=linestyle, ls=ls, marker=marker,
+                          markersize=markersize, ms=ms, alpha=alpha, fmt=fmt,
+                          data=data, x=x, y=column, **kwargs)
+            return self
+        if y is not None:
+            args = ((y,) if x is None else (x, y)) + args
+        elif x is not None:
+            raise TypeError("plot() got x= without y=")
+        args = tuple(_data.lookup(data, a) for a in args)
+
         # --- positional arg parsing ----------------------------------------
+        if len(args) == 2 and isinstance(args[1], str):
+            args, fmt = args[:1], args[1]
         if len(args) == 1:
-            y = np.asarray(args[0])
-            x = np.arange(len(y))
+            y = args[0]
+            x = None if _lazy.is_lazy(y) else _data.index_of(y)
         elif len(args) >= 2:
-            x = np.asarray(args[0])
-            y = np.asarray(args[1])
+            x, y = args[0], args[1]
             if len(args) == 3 and isinstance(args[2], str):
                 fmt = args[2]
         else:
             raise TypeError("plot() requires at least 1 positional argument")
+        lazy = None
+        if _lazy.is_lazy(x) or _lazy.is_lazy(y):
+            # Filled in by QFigure._resolve_lazy_traces() at finalize time
+            lazy = (_lazy.as_lazy(x), _lazy.as_lazy(y))
+            x = y = []
+        else:
+            self._apply_category_order(x, y)
+            x, y = self._encode_dates(_data.to_numpy(x), _data.to_numpy(y))
+            x, y = self._downcast(x, y)
 
         # --- format string -------------------------------------------------
         fmt_color, fmt_marker, fmt_linestyle = (None, None, None)
         if fmt:
-            fmt_color, fmt_marker, fmt_linestyle = _parse_fmt(fmt)
+            fmt_color, fmt_marker, fmt_linestyle = _rc.parse_fmt(fmt)
 
         # Track if user specified color (for auto-color scheme)
         user_specified_color = (color is not None or fmt_color is not None)
         self._next_trace_auto_colored = not user_specified_color
 
-        color = color or fmt_color or self._next_color()
-        marker = marker or fmt_marker
-        linestyle = linestyle or ls or fmt_linestyle or "solid"
-        linewidth = _resolve_linewidth(lw, linewidth) or 2
-        markersize = markersize or ms or 6
-
-        # --- build mode string ---------------------------------------------
-        mode = "lines"
-        if marker:
-            mode = "lines+markers"
+        color = _rc.to_color(color or fmt_color) or self._next_color()
+        # Width, dash and marker size default to the "qplotly" template
+        style = _rc.line_style(color, linestyle or ls or fmt_linestyle,
+                               marker or fmt_marker,
+                               _resolve_linewidth(lw, linewidth),
+                               markersize or ms)
 
         trace = go.Scatter(
-            x=x, y=y, mode=mode, name=label,
-            line=dict(color=color, width=linewidth, dash=linestyle),
-            marker=dict(symbol=marker, size=markersize, color=color),
+            x=x, y=y, mode=style.mode, name=label,
+            line=style.line, marker=style.marker,
             opacity=alpha,
             showlegend=label is not None,
             **kwargs,
         )
         self._add_trace(trace)
+        if lazy is not None:
+            self._parent._lazy_traces.append(
+                (len(self._fig.data) - 1, self) + lazy)
+        if label:
+            self._has_legend_entries = True
+        return self
+
+    def plot_stream(self, chunks, fs=None, t0=0.0, pixels=2000, label=None,
+                    color=None, linewidth=None, lw=None, alpha=None,
+                    **kwargs):
+        """Plot a signal too long to hold in memory, in a single pass.
+
+        Args:
+            chunks: An iterable of 1-D array chunks (consumed once, in
+                order), or a whole signal - array, ``np.memmap``,
+                :func:`npy` reference or ``.npy`` path - read in chunks
+            fs: Sample rate; x is ``t0 + i / fs``.  ``None`` plots against
+                the sample index
+            t0: Time of the first sample
+            pixels: Target horizontal resolution.  Samples are folded into
+                between *pixels* and ``2 * pixels`` buckets whatever the
+                signal length, so memory use is fixed
+
+        Draws the per-bucket min/max envelope as a filled band and the
+        per-bucket mean as a line.
+        """
+        if isinstance(chunks, (str, os.PathLike)):
+            chunks = _lazy.LazyArray(chunks)
+        if isinstance(chunks, _lazy.LazyArray) or _lazy.is_lazy(chunks):
+            chunks = (c for _, c in _lazy.as_lazy(chunks).chunks())
+        elif hasattr(chunks, "__array__"):  # ndarray, Series, DataArray
+            chunks = (c for _, c in _lazy.iter_chunks(_data.to_numpy(chunks)))
+
+        envelope = _reduce.StreamEnvelope(pixels)
+        start = 0
+        for chunk in chunks:
+            chunk = _data.to_numpy(chunk).ravel()
+            envelope.add(start, chunk)
+            start += chunk.size
+        first, last, lo, hi, mean = envelope.envelope()
+        x = (first + last) / 2.0
+        if fs is not None:
+            x = t0 + x / fs
+        lo[~np.isfinite(lo)] = np.nan
+        hi[~np.isfinite(hi)] = np.nan
+
+        color = color or self._next_color()
+        self._add_trace(go.Scatter(
+            x=np.concatenate([x, x[::-1]]),
+            y=np.concatenate([hi, lo[::-1]]),
+            mode="lines", fill="toself", line=dict(width=0),
+            fillcolor=_rgba(color, 0.25 if alpha is None else 0.25 * alpha),
+            showlegend=False, hoverinfo="skip",
+        ))
+        self._add_trace(go.Scatter(
+            x=x, y=mean, mode="lines", name=label,
+            line=dict(color=color, width=_resolve_linewidth(lw, linewidth) or 1),
+            opacity=alpha,
+            showlegend=label is not None,
+            **kwargs,
+        ))
+        if label:
+            self._has_legend_entries = True
+        return self
+
+    def channels(self, t, X, labels=None, spacing="auto", normalize=True,
+                 decimate=True, pixels=None, label=None, color=None,
+                 linewidth=None, lw=None, alpha=None, **kwargs):
+        """Stacked multi-channel traces sharing one time axis, as a single
+        WebGL trace.
+
+        Args:
+            t: Sample times, length ``n``.  ``None`` uses the DataFrame
+                index / first DataArray coordinate, else ``0..n-1``
+            X: ``(n, channels)`` array, DataFrame or DataArray (a
+                ``(channels, n)`` array is transposed)
+            labels: Channel names for the y tick labels (default: the
+                DataFrame columns / DataArray coordinate, else ``0, 1, ...``)
+            spacing: Distance between channel baselines in normalized
+                units; ``'auto'`` keeps 98% of samples clear of neighbours
+            normalize: Scale each channel to unit standard deviation
+                (channels are always centred on their mean)
+            decimate: Min/max-decimate each channel to the panel's pixel
+                width (or *pixels* columns) when it has more samples
+
+        Channel 0 is drawn on top.  Channels are joined with NaN gaps into
+        one ``Scattergl`` trace, so hundreds of channels stay responsive.
+        """
+        index = columns = None
+        if _data.is_labeled(X):
+            columns, index = _data.labels_2d(X)
+        X = np.asarray(_data.to_numpy(X), dtype=float)
+        if X.ndim == 1:
+            X = X[:, None]
+        t = index if t is None else _data.to_numpy(t)
+        if t is not None and X.shape[0] != len(t) and X.shape[1] == len(t):
+            X = X.T
+        n, count = X.shape
+        if t is None:
+            t = np.arange(n)
+        t, _ = self._encode_dates(x=t)
+        if labels is None:
+            labels = columns if columns is not None else range(count)
+        labels = [str(name) for name in labels]
+
+        with np.errstate(invalid="ignore", divide="ignore"), \
+                warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN channels
+            Z = X - np.nanmean(X, axis=0)
+            if normalize:
+                scale = np.nanstd(Z, axis=0)
+                Z /= np.where((scale > 0) & np.isfinite(scale), scale, 1.0)
+            if spacing == "auto":
+                spacing = 2 * np.nanpercentile(np.abs(Z), 99)
+        if not np.isfinite(spacing) or spacing <= 0:
+            spacing = 1.0
+        offsets = (count - 1 - np.arange(count)) * spacing
+
+        # NaN between channels breaks the line; non-numeric t needs None
+        gap = (np.array([np.nan]) if t.dtype.kind in "iufb"
+               else np.array([None], dtype=object))
+        pixels = pixels or self._panel_pixels()[0]
+        if decimate and n > 4 * pixels:
+            xs, ys = [], []
+            for k in range(count):
+                m4 = _reduce.M4(n, pixels)
+                m4.add(0, Z[:, k])
+                idx, values = m4.result()
+                xs += [t[idx], gap]
+                ys += [values + offsets[k], [np.nan]]
+            x = np.concatenate(xs)
+            y = np.concatenate(ys)
+        else:
+            # (n + 1, count) with a NaN row, read channel by channel
+            x = np.tile(np.concatenate([t, gap]), count)
+            y = np.vstack([Z + offsets, np.full((1, count), np.nan)]).ravel(order="F")
+
+        color = color or self._next_color()
+        self._add_trace(go.Scattergl(
+            x=x, y=y.astype(np.float32), mode="lines", name=label,
+            line=dict(color=color, width=_resolve_linewidth(lw, linewidth) or 1),
+            opacity=alpha, hoverinfo="x",
+            showlegend=label is not None,
+            **kwargs,
+        ))
+        self._update_layout(**{self._yaxis_name(): dict(
+            tickmode="array", tickvals=offsets, ticktext=labels)})
         if label:
             self._has_legend_entries = True
         return self
 
     def scatter(self, x, y, s=None, c=None, label=None, marker=None,
                 alpha=None, cmap=None, colorbar=False, edgecolors=None,
-                linewidths=None, **kwargs):
-        """Scatter plot."""
-        x = np.asarray(x)
-        y = np.asarray(y)
+                linewidths=None, rasterize=False, data=None, **kwargs):
+        """Scatter plot.
+
+        *x*, *y*, *s* and *c* may name columns of *data*.
+
+        With ``rasterize=True`` the points are aggregated into an image
+        instead of drawn as markers; see :meth:`density_scatter`, which
+        receives *c*, *cmap*, *colorbar* and any extra keyword arguments.
+        """
+        x, y, s, c = (_data.lookup(data, a) for a in (x, y, s, c))
+        if s is not None and np.ndim(s):
+            s = _data.to_numpy(s)
+        if c is not None and not isinstance(c, (str, tuple)):
+            c = _data.to_numpy(c)
+        if rasterize:
+            values = c if isinstance(c, (list, np.ndarray)) else None
+            return self.density_scatter(x, y, c=values, cmap=cmap,
+                                        colorbar=colorbar, **kwargs)
+        self._apply_category_order(x, y)
+        x, y = self._encode_dates(_data.to_numpy(x), _data.to_numpy(y))
+        x, y = self._downcast(x, y)
         size = s if s is not None else 8
 
         # Track if user specified color (for auto-color scheme)
         user_specified_color = (c is not None)
         self._next_trace_auto_colored = not user_specified_color
 
-        color = c if c is not None else self._next_color()
+        color = _rc.to_color(c) if c is not None else self._next_color()
+        symbol = _rc.symbol(marker) if marker else "circle"
 
         marker_dict = dict(
             size=size,
             color=color,
-            symbol=_FMT_MARKERS.get(marker, marker) if marker else "circle",
+            symbol=symbol,
             opacity=alpha,
         )
 
         if edgecolors is not None:
             marker_dict["line"] = dict(
-                color=edgecolors,
+                color=_rc.to_color(edgecolors),
                 width=linewidths if linewidths else 1,
             )
+        elif symbol in _rc.THIN_SYMBOLS:
+            # stroke-only symbols are drawn with the marker line
+            marker_dict["line"] = dict(color=color, width=linewidths or 1)
 
         # If color is an array and a colormap is requested
         if isinstance(color, (list, np.ndarray)) and cmap:
@@ -227,9 +495,92 @@ class Axes:
             self._has_legend_entries = True
         return self
 
+    def density_scatter(self, x, y, c=None, how=None, shade="eq_hist",
+                        cmap=None, colorbar=True, size=None, xlim=None,
+                        ylim=None, compression="lossless", data=None,
+                        **kwargs):
+        """Rasterized scatter plot for very large point clouds.
+
+        Points are binned into a canvas-sized grid with ``np.bincount`` and
+        drawn as one compressed image, so the figure size does not depend on
+        the number of points.  Empty cells are transparent.
+
+        Args:
+            x, y: Point coordinates
+            c: Optional per-point values
+            how: 'count' (points per cell), 'mean' or 'max' of *c*.
+                Defaults to 'mean' when *c* is given, else 'count'.
+            shade: 'linear', 'log' or 'eq_hist' (histogram equalization)
+            cmap: Colormap name. Defaults to 'Viridis'.
+            colorbar: Whether to show a colorbar
+            size: Canvas ``(width, height)`` in cells; defaults to the
+                panel's screen size
+            xlim, ylim: Data ranges to aggregate (default: data extent)
+            compression: 'lossless' (PNG) or 'lossy' (WebP)
+            data: Optional table whose columns *x*, *y* and *c* may name
+        """
+        x, y, c = (_data.lookup(data, a) for a in (x, y, c))
+        x = np.asarray(_data.to_numpy(x), dtype=float)
+        y = np.asarray(_data.to_numpy(y), dtype=float)
+        c = _data.to_numpy(c)
+        if how is None:
+            how = "count" if c is None else "mean"
+        if cmap is None:
+            cmap = 'Viridis'
+        width, height = size or self._panel_pixels()
+        if xlim is None:
+            xlim = (np.nanmin(x), np.nanmax(x))
+        if ylim is None:
+            ylim = (np.nanmin(y), np.nanmax(y))
+
+        grid = _reduce.bin_points(x, y, width, height, xlim, ylim, c=c,
+                                  how=how)
+        norm, to_value = _image.shade(grid, shade)
+        img = _image.apply_lut(norm, _image.colorscale_lut(cmap), 0.0, 1.0)
+
+        dx = (xlim[1] - xlim[0]) / width or 1.0
+        dy = (ylim[1] - ylim[0]) / height or 1.0
+        self._add_trace(go.Image(
+            source=_image.to_data_uri(img, compression=compression),
+            x0=xlim[0] + dx / 2, dx=dx, y0=ylim[0] + dy / 2, dy=dy,
+            **kwargs,
+        ))
+        # Image traces reverse y and lock the aspect ratio by default
+        self._update_layout(**{
+            self._xaxis_name(): dict(autorange=True),
+            self._yaxis_name(): dict(autorange=True),
+        })
+        self.set_aspect("auto")
+
+        if colorbar:
+            ticks = np.linspace(0, 1, 6)
+            self._add_trace(go.Scatter(
+                x=[None], y=[None], mode="markers",
+                marker=dict(
+                    colorscale=cmap, cmin=0, cmax=1, showscale=True,
+                    colorbar=dict(
+                        title=dict(text=how, side="right"),
+                        tickvals=ticks,
+                        ticktext=[f"{v:.3g}" for v in to_value(ticks)],
+                    ),
+                ),
+                showlegend=False, hoverinfo="skip",
+            ))
+        return self
+
     def bar(self, x, height, width=None, bottom=None, label=None, color=None,
-            edgecolor=None, alpha=None, orientation="v", **kwargs):
-        """Bar chart."""
+            edgecolor=None, alpha=None, orientation="v", data=None, **kwargs):
+        """Bar chart. *x* and *height* may name columns of *data*."""
+        x, height = _data.lookup(data, x), _data.lookup(data, height)
+        if orientation == "v":
+            self._apply_category_order(x=x)
+        else:
+            self._apply_category_order(y=x)
+        x, height = _data.to_numpy(x), _data.to_numpy(height)
+        if orientation == "v":
+            x, height = self._encode_dates(x, height)
+        else:
+            height, x = self._encode_dates(height, x)
         color = color or self._next_color()
         marker_dict = dict(color=color, opacity=alpha)
         if edgecolor:
@@ -257,9 +608,12 @@ class Axes:
                         orientation="h", **kwargs)
 
     def hist(self, x, bins=None, range=None, density=False, label=None,
-             color=None, alpha=None, edgecolor=None, histtype="bar", **kwargs):
-        """Histogram."""
-        x = np.asarray(x)
+             color=None, alpha=None, edgecolor=None, histtype="bar", data=None,
+             **kwargs):
+        """Histogram. *x* may name a column of *data*."""
+        x = _data.lookup(data, x)
+        self._apply_category_order(x=x)
+        x, _ = self._encode_dates(x=_data.to_numpy(x))
         color = color or self._next_color()
         marker_dict = dict(color=color, opacity=alpha)
         if edgecolor:
@@ -293,11 +647,12 @@ class Axes:
         return self
 
     def fill_between(self, x, y1, y2=0, label=None, color=None, alpha=0.3,
-                     **kwargs):
-        """Filled area between *y1* and *y2*."""
-        x = np.asarray(x)
-        y1 = np.asarray(y1)
-        y2 = np.full_like(y1, y2) if np.ndim(y2) == 0 else np.asarray(y2)
+                     data=None, **kwargs):
+        """Filled area between *y1* and *y2* (which may name columns of *data*)."""
+        x, y1, y2 = (_data.lookup(data, a) for a in (x, y1, y2))
+        x, _ = self._encode_dates(x=_data.to_numpy(x))
+        y1 = _data.to_numpy(y1)
+        y2 = np.full_like(y1, y2) if np.ndim(y2) == 0 else _data.to_numpy(y2)
         color = color or self._next_color()
 
         # Upper bound
@@ -321,51 +676,98 @@ class Axes:
 
     def errorbar(self, x, y, yerr=None, xerr=None, label=None, color=None,
                  linewidth=None, lw=None, marker=None, markersize=None,
-                 ms=None, alpha=None, capsize=None, **kwargs):
-        """Line plot with error bars."""
-        x = np.asarray(x)
-        y = np.asarray(y)
-        color = color or self._next_color()
-        linewidth = _resolve_linewidth(lw, linewidth) or 2
-        markersize = markersize or ms or 6
-        mode = "lines+markers" if marker else "lines"
-
-        error_y = None
-        error_x = None
-        if yerr is not None:
-            yerr = np.asarray(yerr)
-            if yerr.ndim == 2:
-                error_y = dict(type="data", symmetric=False,
-                               arrayminus=yerr[0], array=yerr[1], visible=True)
-            else:
-                error_y = dict(type="data", array=yerr, visible=True)
-        if xerr is not None:
-            xerr = np.asarray(xerr)
-            if xerr.ndim == 2:
-                error_x = dict(type="data", symmetric=False,
-                               arrayminus=xerr[0], array=xerr[1], visible=True)
-            else:
-                error_x = dict(type="data", array=xerr, visible=True)
+                 ms=None, alpha=None, capsize=None, errorstyle="auto",
+                 errorevery=None, fmt=None, data=None, **kwargs):
+        """Line plot with error bars. *x*, *y*, *yerr*, *xerr* may name
+        columns of *data*.
+
+        Args:
+            fmt: matplotlib format string for the line, as in :meth:`plot`
+                (``'o'`` draws markers only)
+            yerr, xerr: Scalar, ``(N,)`` symmetric or ``(2, N)`` [lower, upper]
+            capsize: Cap size in points, as in matplotlib: each cap reaches
+                *capsize* to either side of its bar (so is ``2 * capsize``
+                long).  Converted to pixels for plotly's ``width``, which
+                is likewise the cap's reach to each side.
+            errorstyle: 'bars' (whiskers), 'band' (one filled envelope around
+                the line for *yerr*) or 'auto' (bars up to
+                ``_ERRORBAR_MAX_BARS`` points, band above)
+            errorevery: Draw whiskers for every N-th point only.  Defaults
+                to a stride that keeps at most ``_ERRORBAR_MAX_BARS``
+                whiskers; the line itself always keeps every point.
+        """
+        x, y, yerr, xerr = (_data.lookup(data, a) for a in (x, y, yerr, xerr))
+        x, y = self._encode_dates(_data.to_numpy(x), _data.to_numpy(y))
+        x, y = self._downcast(x, y)
+        if yerr is not None and np.ndim(yerr) == 1:
+            yerr = _data.to_numpy(yerr)
+        if xerr is not None and np.ndim(xerr) == 1:
+            xerr = _data.to_numpy(xerr)
+        fmt_color, fmt_marker, fmt_linestyle = (
+            _rc.parse_fmt(fmt) if fmt else (None, None, None))
+        color = _rc.to_color(color or fmt_color) or self._next_color()
+        style = _rc.line_style(color, fmt_linestyle, marker or fmt_marker,
+                               _resolve_linewidth(lw, linewidth),
+                               markersize or ms)
+
+        n = len(y)
+        if errorstyle == "auto":
+            errorstyle = "bars" if n <= _ERRORBAR_MAX_BARS else "band"
+        if errorstyle not in ("bars", "band"):
+            raise ValueError(f"errorstyle must be 'bars', 'band' or 'auto', "
+                             f"got {errorstyle!r}")
+        stride = errorevery or max(-(-n // _ERRORBAR_MAX_BARS), 1)
+
+        def error_dict(err, idx):
+            lower, upper = _split_err(err, n)
+            error = dict(type="data", array=upper[idx], visible=True)
+            if lower is not upper:
+                error.update(symmetric=False, arrayminus=lower[idx])
+            if capsize is not None:
+                error["width"] = capsize * _PX_PER_POINT
+            return error
+
+        if errorstyle == "band" and yerr is not None:
+            lower, upper = _split_err(yerr, n)
+            self._add_trace(go.Scatter(
+                x=np.concatenate([x, x[::-1]]),
+                y=np.concatenate([y + upper, (y - lower)[::-1]]),
+                mode="lines", fill="toself", line=dict(width=0),
+                fillcolor=_rgba(color, 0.25 if alpha is None else 0.25 * alpha),
+                showlegend=False, hoverinfo="skip",
+            ))
+            yerr = None
 
+        # Whiskers ride on the line trace unless they need thinning
+        whiskers = slice(None, None, stride)
+        on_line = stride == 1
         trace = go.Scatter(
-            x=x, y=y, mode=mode, name=label,
-            line=dict(color=color, width=linewidth),
-            marker=dict(symbol=_FMT_MARKERS.get(marker, marker) if marker else "circle",
-                        size=markersize, color=color),
-            error_y=error_y, error_x=error_x,
+            x=x, y=y, mode=style.mode, name=label,
+            line=style.line, marker=style.marker,
+            error_y=error_dict(yerr, whiskers) if on_line and yerr is not None else None,
+            error_x=error_dict(xerr, whiskers) if on_line and xerr is not None else None,
             opacity=alpha,
             showlegend=label is not None,
             **kwargs,
         )
         self._add_trace(trace)
+
+        if not on_line and (yerr is not None or xerr is not None):
+            self._add_trace(go.Scatter(
+                x=x[whiskers], y=y[whiskers], mode="markers",
+                marker=dict(size=0, color=color),
+                error_y=error_dict(yerr, whiskers) if yerr is not None else None,
+                error_x=error_dict(xerr, whiskers) if xerr is not None else None,
+                opacity=alpha, showlegend=False, hoverinfo="skip",
+            ))
         if label:
             self._has_legend_entries = True
         return self
 
-    def stem(self, x, y, label=None, color=None, **kwargs):
-        """Stem plot."""
-        x = np.asarray(x)
-        y = np.asarray(y)
+    def stem(self, x, y, label=None, color=None, data=None, **kwargs):
+        """Stem plot. *x* and *y* may name columns of *data*."""
+        x, y = _data.lookup(data, x), _data.lookup(data, y)
+        x, y = self._encode_dates(_data.to_numpy(x), _data.to_numpy(y))
         color = color or self._next_color()
 
         for xi, yi in zip(x, y):
@@ -386,6 +788,7 @@ class Axes:
     def pie(self, sizes, labels=None, colors=None, autopct=None,
             startangle=None, explode=None, **kwargs):
         """Pie chart."""
+        sizes, labels = _data.to_numpy(sizes), _data.to_numpy(labels)
         pull = explode if explode is not None else None
         trace = go.Pie(
             values=sizes, labels=labels,
@@ -399,8 +802,23 @@ class Axes:
         return self
 
     def heatmap(self, data, xticklabels=None, yticklabels=None, cmap=None,
-                colorbar=True, vmin=None, vmax=None, **kwargs):
-        """Heatmap / imshow style plot."""
+                colorbar=True, vmin=None, vmax=None, max_pixels=None,
+                reduce="mean", **kwargs):
+        """Heatmap / imshow style plot.
+
+        *max_pixels* (``'auto'`` for the panel's screen size, a ``(width,
+        height)`` pair or a total cell count) block-reduces oversized *data*
+        with *reduce* (``'mean'``, ``'max'``, ``'min'`` or ``'first'``);
+        colour limits still come from the full-resolution data.
+        """
+        if _data.is_labeled(data):
+            # DataFrame columns/index or DataArray coordinates label the axes
+            x_labels, y_labels = _data.labels_2d(data)
+            xticklabels = x_labels if xticklabels is None else xticklabels
+            yticklabels = y_labels if yticklabels is None else yticklabels
+            data = _data.to_numpy(data)
+        data, xticklabels, yticklabels, vmin, vmax = self._reduce_grid(
+            data, xticklabels, yticklabels, max_pixels, reduce, vmin, vmax)
         trace = go.Heatmap(
             z=data, x=xticklabels, y=yticklabels,
             colorscale=cmap,
@@ -412,13 +830,134 @@ class Axes:
         return self
 
     def imshow(self, data, cmap=None, vmin=None, vmax=None, aspect=None,
-               **kwargs):
-        """Display an image/2-D array (delegates to heatmap)."""
-        return self.heatmap(data, cmap=cmap, vmin=vmin, vmax=vmax, **kwargs)
+               origin="upper", extent=None, compression="lossless",
+               quality=90, colorbar=True, **kwargs):
+        """Display an image or 2-D array (like ``matplotlib.axes.Axes.imshow``).
+
+        The image is sent to the browser as a single compressed ``go.Image``
+        source instead of one JSON number per pixel.  RGB(A) arrays (uint8,
+        or floats in ``[0, 1]``) are encoded as-is; scalar arrays are
+        colour-mapped through a lookup table of *cmap* between *vmin* and
+        *vmax*, with NaNs left transparent.
+
+        Args:
+            data: ``(M, N)`` scalar, ``(M, N, 3)`` RGB or ``(M, N, 4)`` RGBA array
+            cmap: Colormap for scalar data. Defaults to 'Plasma'.
+            vmin: Data value mapped to the bottom of the colormap (default: min)
+            vmax: Data value mapped to the top of the colormap (default: max)
+            aspect: 'equal' (default), 'auto' or a number (y/x scale ratio)
+            origin: 'upper' (row 0 at the top) or 'lower'
+            extent: ``(left, right, bottom, top)`` in data coordinates
+            compression: 'lossless' (PNG) or 'lossy' (WebP, needs Pillow)
+            quality: Lossy encoder quality (0-100)
+            colorbar: Whether to show a colorbar for scalar data, or a
+                dict of plotly colorbar settings
+
+        Other keyword arguments go to ``go.Image``.  ``go.Heatmap``
+        arguments accepted when imshow drew a heatmap are translated where
+        an image has an equivalent (``colorscale``, ``zmin``/``zmax``,
+        ``showscale``, ``reversescale``, ``zsmooth``) and otherwise dropped
+        with a warning.
+        """
+        legacy = {k: kwargs.pop(k) for k in _IMSHOW_HEATMAP_KWARGS
+                  if k in kwargs}
+        if legacy:
+            cmap = legacy.get("colorscale") if cmap is None else cmap
+            vmin = legacy.get("zmin") if vmin is None else vmin
+            vmax = legacy.get("zmax") if vmax is None else vmax
+            colorbar = colorbar and legacy.get("showscale", True)
+            if legacy.get("zsmooth"):
+                kwargs["zsmooth"] = "fast"  # the only Image smoothing
+            dropped = sorted(set(legacy) - {"colorscale", "zmin", "zmax",
+                                            "showscale", "reversescale",
+                                            "zsmooth"})
+            if dropped:
+                warnings.warn(f"imshow() draws a go.Image, which has no "
+                              f"{', '.join(dropped)}; ignored", stacklevel=2)
+        reverse = bool(legacy.get("reversescale"))
+
+        data = _data.to_numpy(data)
+        if data.ndim == 3 and data.shape[-1] in (3, 4):
+            img = _image.to_uint8(data)
+            scalar = False
+        elif data.ndim == 2:
+            if cmap is None:
+                cmap = 'Plasma'
+            finite = data[np.isfinite(data)]
+            if vmin is None:
+                vmin = float(finite.min()) if finite.size else 0.0
+            if vmax is None:
+                vmax = float(finite.max()) if finite.size else 1.0
+            lut = _image.colorscale_lut(cmap)
+            img = _image.apply_lut(data, lut[::-1] if reverse else lut,
+                                   vmin, vmax)
+            scalar = True
+        else:
+            raise ValueError(
+                "imshow() expects an (M, N), (M, N, 3) or (M, N, 4) array, "
+                f"got shape {data.shape}")
+
+        if origin not in ("upper", "lower"):
+            raise ValueError(f"origin must be 'upper' or 'lower', got {origin!r}")
+
+        # Pixel geometry, following matplotlib's extent convention
+        nrows, ncols = img.shape[:2]
+        if extent is None:
+            extent = (-0.5, ncols - 0.5, nrows - 0.5, -0.5)
+            if origin == "lower":
+                extent = (-0.5, ncols - 0.5, -0.5, nrows - 0.5)
+        left, right, bottom, top = extent
+        # Column 0 lies at *left*; row 0 at *top* for origin='upper', else
+        # at *bottom*.  go.Image needs positive steps from its first pixel,
+        # so rows/columns running towards smaller coordinates are flipped.
+        first_y, last_y = (top, bottom) if origin == "upper" else (bottom, top)
+        if right < left:
+            img = img[:, ::-1]
+        if last_y < first_y:
+            img = img[::-1]
+        dx = abs(right - left) / ncols
+        dy = abs(last_y - first_y) / nrows
+
+        self._add_trace(go.Image(
+            source=_image.to_data_uri(np.ascontiguousarray(img),
+                                      compression=compression,
+                                      quality=quality),
+            x0=min(left, right) + dx / 2, dx=dx,
+            y0=min(bottom, top) + dy / 2, dy=dy,
+            **kwargs,
+        ))
+
+        # Image traces reverse the y-axis by default; state the direction
+        # implied by the extent explicitly in both directions.
+        self._update_layout(**{
+            self._xaxis_name(): dict(
+                autorange="reversed" if left > right else True),
+            self._yaxis_name(): dict(
+                autorange="reversed" if bottom > top else True),
+        })
+        self.set_aspect("equal" if aspect is None else aspect)
+
+        if scalar and colorbar:
+            # Invisible scatter carrying the colorscale, as in QFigure.colorbar
+            self._add_trace(go.Scatter(
+                x=[None], y=[None], mode="markers",
+                marker=dict(colorscale=cmap, cmin=vmin, cmax=vmax,
+                            reversescale=reverse or None, showscale=True,
+                            colorbar=colorbar if isinstance(colorbar, dict)
+                            else None),
+                showlegend=False, hoverinfo="skip",
+            ))
+        return self
 
     def contour(self, x, y, z, levels=None, cmap=None, filled=False,
-                colorbar=True, **kwargs):
-        """Contour plot."""
+                colorbar=True, vmin=None, vmax=None, max_pixels=None,
+                reduce="mean", **kwargs):
+        """Contour plot.
+
+        *max_pixels* / *reduce* block-reduce oversized *z* as in
+        :meth:`heatmap`; levels and colour limits use the full-resolution data.
+        """
+        x, y, z = (_data.to_numpy(a) for a in (x, y, z))
         contours_kw = {}
         if levels is not None:
             if isinstance(levels, int):
@@ -427,10 +966,13 @@ class Axes:
             else:
                 contours_kw = dict(start=levels[0], end=levels[-1],
                                    size=levels[1] - levels[0])
+        z, x, y, vmin, vmax = self._reduce_grid(
+            z, x, y, max_pixels, reduce, vmin, vmax)
         trace = go.Contour(
             x=np.asarray(x), y=np.asarray(y), z=np.asarray(z),
             contours=contours_kw,
             colorscale=cmap,
+            zmin=vmin, zmax=vmax,
             showscale=colorbar,
             contours_coloring="heatmap" if filled else "lines",
             **kwargs,
@@ -445,9 +987,15 @@ class Axes:
                             colorbar=colorbar, **kwargs)
 
     def pcolormesh(self, x, y, z, cmap=None, vmin=None, vmax=None,
-                   shading='auto', colorbar=True, **kwargs):
+                   shading='auto', colorbar=True, method='auto',
+                   max_pixels=None, reduce='mean', **kwargs):
         """Pseudocolor plot of a 2D array (like matplotlib's pcolormesh).
 
+        Rectilinear grids (1-D *x*/*y*, or 2-D meshgrids) become a single
+        ``go.Heatmap``.  Curvilinear 2-D grids are either resampled onto a
+        regular grid at the panel's screen resolution or, for small meshes,
+        drawn as filled polygons grouped into colour levels.
+
         Args:
             x: 1D or 2D array of x coordinates
             y: 1D or 2D array of y coordinates
@@ -455,82 +1003,369 @@ class Axes:
             cmap: Colormap name (e.g., 'Viridis', 'Plasma', 'RdBu'). Defaults to 'Plasma'.
             vmin: Minimum value for colorscale
             vmax: Maximum value for colorscale
-            shading: 'auto', 'flat', or 'gouraud' (for compatibility, mostly ignored)
+            shading: 'flat' (x/y are cell edges, one larger than z),
+                'nearest' (x/y are cell centres), 'gouraud' (x/y are nodes,
+                colours interpolated between them) or 'auto' ('flat' when
+                x/y are one larger than z, else 'nearest')
             colorbar: Whether to show colorbar
+            method: Curvilinear rendering: 'resample', 'polygons' or 'auto'
+                (polygons up to ``_MESH_POLYGON_CELLS`` cells)
+            max_pixels: Block-reduce rectilinear grids to this size (see
+                :meth:`heatmap`); curvilinear meshes are always resampled
+                to the panel's screen resolution
+            reduce: 'mean', 'max', 'min' or 'first'
         """
-        x = np.asarray(x)
-        y = np.asarray(y)
-        z = np.asarray(z)
+        x = np.asarray(_data.to_numpy(x), dtype=float)
+        y = np.asarray(_data.to_numpy(y), dtype=float)
+        z = _data.to_numpy(z)
 
         # Default to Plasma colormap
         if cmap is None:
             cmap = 'Plasma'
 
-        # Handle 1D x and y arrays (most common case)
+        nrows, ncols = z.shape
+        if shading == 'auto':
+            edges = (x.shape[-1] == ncols + 1 and y.shape[0] == nrows + 1)
+            shading = 'flat' if edges else 'nearest'
+        if shading not in ('flat', 'nearest', 'gouraud'):
+            raise ValueError(f"Unknown shading {shading!r}; expected 'auto', "
+                             "'flat', 'nearest' or 'gouraud'")
+        if shading == 'flat':
+            if x.shape[-1] != ncols + 1 or y.shape[0] != nrows + 1:
+                raise ValueError(
+                    f"shading='flat' needs x/y one larger than z {z.shape}; "
+                    "use shading='nearest' for cell-centred coordinates")
+        elif x.shape[-1] != ncols or y.shape[0] != nrows:
+            raise ValueError(f"shading={shading!r} needs x/y the same size "
+                             f"as z {z.shape}")
+
+        # A 2-D meshgrid is just a rectilinear grid in disguise
+        if x.ndim == 2 or y.ndim == 2:
+            X, Y = np.broadcast_arrays(x if x.ndim == 2 else x[None, :],
+                                       y if y.ndim == 2 else y[:, None])
+            axes_1d = _mesh.rectilinear_axes(X, Y)
+            if axes_1d is not None:
+                x, y = axes_1d
+
         if x.ndim == 1 and y.ndim == 1:
-            # Plotly Heatmap expects x and y as 1D arrays
+            z, x, y, vmin, vmax = self._reduce_grid(
+                z, x, y, max_pixels, reduce, vmin, vmax)
+            # Plotly Heatmap takes either centres or (len + 1) edges directly
             trace = go.Heatmap(
                 x=x, y=y, z=z,
                 colorscale=cmap,
                 zmin=vmin, zmax=vmax,
+                zsmooth='best' if shading == 'gouraud' else False,
                 showscale=colorbar,
                 hovertemplate='x: %{x}<br>y: %{y}<br>z: %{z}<extra></extra>',
                 **kwargs,
             )
-        else:
-            # For 2D x and y, flatten or use first row/column
-            if x.ndim == 2:
-                x = x[0, :]  # Use first row
-            if y.ndim == 2:
-                y = y[:, 0]  # Use first column
-            trace = go.Heatmap(
-                x=x, y=y, z=z,
+            self._add_trace(trace)
+            return self
+
+        # ---- curvilinear mesh ---------------------------------------------
+        if shading == 'nearest':
+            X = _mesh.centers_to_corners(X)
+            Y = _mesh.centers_to_corners(Y)
+        finite = z[np.isfinite(z)]
+        if vmin is None:
+            vmin = float(finite.min()) if finite.size else 0.0
+        if vmax is None:
+            vmax = float(finite.max()) if finite.size else 1.0
+
+        if method == 'auto':
+            small = z.size <= _MESH_POLYGON_CELLS and shading != 'gouraud'
+            method = 'polygons' if small else 'resample'
+
+        if method == 'resample':
+            width, height = self._panel_pixels()
+            xc, yc, grid = _mesh.resample(X, Y, z, width, height,
+                                          gouraud=shading == 'gouraud')
+            self._add_trace(go.Heatmap(
+                x=xc, y=yc, z=grid.astype(np.float32),
                 colorscale=cmap,
                 zmin=vmin, zmax=vmax,
                 showscale=colorbar,
                 hovertemplate='x: %{x}<br>y: %{y}<br>z: %{z}<extra></extra>',
                 **kwargs,
-            )
-
-        self._add_trace(trace)
+            ))
+        elif method == 'polygons':
+            if shading == 'gouraud':
+                raise ValueError("method='polygons' cannot draw "
+                                 "shading='gouraud'; use method='resample'")
+            levels = _MESH_POLYGON_LEVELS
+            lut = _image.colorscale_lut(cmap, levels)
+            for lev, xs, ys in _mesh.polygons(X, Y, z, vmin, vmax, levels):
+                color = "rgb({},{},{})".format(*lut[lev])
+                self._add_trace(go.Scatter(
+                    x=xs, y=ys, mode="lines", fill="toself",
+                    fillcolor=color, line=dict(color=color, width=0.5),
+                    showlegend=False, hoverinfo="skip",
+                ))
+            if colorbar:
+                # Invisible scatter carrying the colorscale, as in imshow
+                self._add_trace(go.Scatter(
+                    x=[None], y=[None], mode="markers",
+                    marker=dict(colorscale=cmap, cmin=vmin, cmax=vmax,
+                                showscale=True),
+                    showlegend=False, hoverinfo="skip",
+                ))
+        else:
+            raise ValueError(f"Unknown method {method!r}; expected 'auto', "
+                             "'resample' or 'polygons'")
         return self
 
+    def _reduce_grid(self, z, x, y, max_pixels, reduce, vmin, vmax):
+        """Block-reduce *z* and its coordinates to fit *max_pixels*.
+
+        Returns ``(z, x, y, vmin, vmax)``; inputs are passed through
+        untouched when no reduction is needed.  Missing colour limits are
+        taken from the full-resolution *z* so reduction never shifts them.
+        """
+        if max_pixels is None:
+            return z, x, y, vmin, vmax
+        z = np.asarray(z)
+        if max_pixels == "auto":
+            max_pixels = self._panel_pixels()
+        fy, fx = _reduce.block_factors(z.shape, max_pixels)
+        if fy == 1 and fx == 1:
+            return z, x, y, vmin, vmax
+
+        # an all-NaN z has no limits to keep (and nanmin would warn)
+        if (vmin is None or vmax is None) and np.isfinite(z).any():
+            with np.errstate(invalid="ignore"):
+                lo, hi = np.nanmin(z), np.nanmax(z)
+            vmin = lo if vmin is None else vmin
+            vmax = hi if vmax is None else vmax
+
+        nrows, ncols = z.shape
+        coord_how = "first" if reduce == "first" else "mean"
+        if np.ndim(x) == 2:
+            x = _reduce.block_reduce(np.asarray(x, dtype=float), fy, fx,
+                                     coord_how)
+        else:
+            x = _reduce.reduce_coords(x, ncols, fx, reduce)
+        if np.ndim(y) == 2:
+            y = _reduce.block_reduce(np.asarray(y, dtype=float), fy, fx,
+                                     coord_how)
+        else:
+            y = _reduce.reduce_coords(y, nrows, fy, reduce)
+        return _reduce.block_reduce(z, fy, fx, reduce), x, y, vmin, vmax
+
     # ---- annotation helpers -----------------------------------------------
 
     def axhline(self, y=0, color="black", linestyle="solid", linewidth=1,
-                label=None, **kwargs):
-        """Horizontal line across the axes."""
+                label=None, xmin=0, xmax=1, **kwargs):
+        """Horizontal line across the axes, from axes fraction *xmin* to
+        *xmax*.
+
+        An array of *y* draws all the lines as one trace (see
+        :meth:`hlines`); *label* then names its legend entry.  Other
+        keywords go to the trace, or for a scalar *y* to ``add_hline``.
+        """
+        if np.ndim(y) > 0:
+            _, y = self._encode_dates(y=_data.to_numpy(y))
+            return self._segments(xmin, y, xmax, y, color, label=label,
+                                  linewidth=linewidth, linestyle=linestyle,
+                                  fraction="x", **kwargs)
+        kwargs.setdefault("opacity", kwargs.pop("alpha", None))
         self._fig.add_hline(
-            y=y, line_dash=linestyle, line_color=color, line_width=linewidth,
-            row=self._row, col=self._col,
-            annotation_text=label,
+            y=y, line_dash=_rc.dash(linestyle), line_color=_rc.to_color(color),
+            line_width=linewidth,
+            x0=xmin, x1=xmax, row=self._row, col=self._col,
+            annotation_text=label, **kwargs,
         )
         return self
 
     def axvline(self, x=0, color="black", linestyle="solid", linewidth=1,
-                label=None, **kwargs):
-        """Vertical line across the axes."""
+                label=None, ymin=0, ymax=1, **kwargs):
+        """Vertical line across the axes, from axes fraction *ymin* to
+        *ymax*.
+
+        An array of *x* draws all the lines as one trace (see
+        :meth:`vlines`); *label* then names its legend entry.  Other
+        keywords go to the trace, or for a scalar *x* to ``add_vline``.
+        """
+        if np.ndim(x) > 0:
+            x, _ = self._encode_dates(x=_data.to_numpy(x))
+            return self._segments(x, ymin, x, ymax, color, label=label,
+                                  linewidth=linewidth, linestyle=linestyle,
+                                  fraction="y", **kwargs)
+        kwargs.setdefault("opacity", kwargs.pop("alpha", None))
         self._fig.add_vline(
-            x=x, line_dash=linestyle, line_color=color, line_width=linewidth,
-            row=self._row, col=self._col,
-            annotation_text=label,
+            x=x, line_dash=_rc.dash(linestyle), line_color=_rc.to_color(color),
+            line_width=linewidth,
+            y0=ymin, y1=ymax, row=self._row, col=self._col,
+            annotation_text=label, **kwargs,
         )
         return self
 
-    def axhspan(self, ymin, ymax, color="gray", alpha=0.3, **kwargs):
+    def axhspan(self, ymin, ymax, color="gray", alpha=0.3, label=None,
+                **kwargs):
+        """Horizontal band across the axes.  Arrays of *ymin*/*ymax* draw
+        every band as one filled trace."""
+        if np.ndim(ymin) > 0 or np.ndim(ymax) > 0:
+            _, ymin = self._encode_dates(y=_data.to_numpy(ymin))
+            _, ymax = self._encode_dates(y=_data.to_numpy(ymax))
+            return self._spans(ymin, ymax, "y", color, alpha, label, **kwargs)
         self._fig.add_hrect(
             y0=ymin, y1=ymax, fillcolor=color, opacity=alpha,
-            line_width=0, row=self._row, col=self._col,
+            line_width=0, row=self._row, col=self._col, **kwargs,
         )
         return self
 
-    def axvspan(self, xmin, xmax, color="gray", alpha=0.3, **kwargs):
+    def axvspan(self, xmin, xmax, color="gray", alpha=0.3, label=None,
+                **kwargs):
+        """Vertical band across the axes.  Arrays of *xmin*/*xmax* draw
+        every band as one filled trace."""
+        if np.ndim(xmin) > 0 or np.ndim(xmax) > 0:
+            xmin, _ = self._encode_dates(x=_data.to_numpy(xmin))
+            xmax, _ = self._encode_dates(x=_data.to_numpy(xmax))
+            return self._spans(xmin, xmax, "x", color, alpha, label, **kwargs)
         self._fig.add_vrect(
             x0=xmin, x1=xmax, fillcolor=color, opacity=alpha,
-            line_width=0, row=self._row, col=self._col,
+            line_width=0, row=self._row, col=self._col, **kwargs,
         )
         return self
 
+    def vlines(self, x, ymin, ymax, colors=None, linestyles="solid",
+               label=None, linewidth=None, lw=None, alpha=None, data=None,
+               **kwargs):
+        """Vertical lines at each *x* from *ymin* to *ymax* (like
+        ``matplotlib.axes.Axes.vlines``), drawn as one NaN-separated trace
+        per distinct colour.  *ymin*/*ymax* may be scalars; any of the
+        arrays may name columns of *data*."""
+        x, ymin, ymax = (_data.lookup(data, a) for a in (x, ymin, ymax))
+        x, ymin = self._encode_dates(_data.to_numpy(x), _data.to_numpy(ymin))
+        _, ymax = self._encode_dates(y=_data.to_numpy(ymax))
+        return self._segments(x, ymin, x, ymax, colors, label=label,
+                              linewidth=_resolve_linewidth(lw, linewidth),
+                              linestyle=linestyles, alpha=alpha, **kwargs)
+
+    def hlines(self, y, xmin, xmax, colors=None, linestyles="solid",
+               label=None, linewidth=None, lw=None, alpha=None, data=None,
+               **kwargs):
+        """Horizontal lines at each *y* from *xmin* to *xmax* (like
+        ``matplotlib.axes.Axes.hlines``); see :meth:`vlines`."""
+        y, xmin, xmax = (_data.lookup(data, a) for a in (y, xmin, xmax))
+        xmin, y = self._encode_dates(_data.to_numpy(xmin), _data.to_numpy(y))
+        xmax, _ = self._encode_dates(x=_data.to_numpy(xmax))
+        return self._segments(xmin, y, xmax, y, colors, label=label,
+                              linewidth=_resolve_linewidth(lw, linewidth),
+                              linestyle=linestyles, alpha=alpha, **kwargs)
+
+    def eventplot(self, positions, orientation="horizontal", lineoffsets=1,
+                  linelengths=1, linewidths=None, colors=None,
+                  linestyles="solid", label=None, alpha=None, **kwargs):
+        """Spike raster (like ``matplotlib.axes.Axes.eventplot``).
+
+        *positions* is one sequence of event positions or a sequence of
+        them, one row each.  Row ``i`` is drawn at ``lineoffsets[i]`` with
+        ticks ``linelengths[i]`` long in colour ``colors[i]``; each may also
+        be a single value for all rows.  All ticks of one colour form a
+        single NaN-separated trace.
+        """
+        first = next(iter(positions), None)
+        rows = [positions] if np.ndim(first) == 0 else list(positions)
+        n = len(rows)
+        offsets = np.broadcast_to(np.asarray(lineoffsets, dtype=float), (n,))
+        lengths = np.broadcast_to(np.asarray(linelengths, dtype=float), (n,))
+        if colors is None:
+            colors = self._next_color()
+        colors = np.broadcast_to(np.asarray(colors, dtype=object), (n,))
+
+        horizontal = orientation == "horizontal"
+        events = []
+        for row in rows:
+            row = _data.to_numpy(row)
+            if horizontal:
+                row, _ = self._encode_dates(x=row)
+            else:
+                _, row = self._encode_dates(y=row)
+            events.append(np.asarray(row, dtype=float).ravel())
+        counts = [len(row) for row in events]
+        pos = np.concatenate(events) if events else np.empty(0)
+        lo = np.repeat(offsets - lengths / 2, counts)
+        hi = np.repeat(offsets + lengths / 2, counts)
+        color = np.repeat(colors, counts)
+        if horizontal:
+            return self._segments(pos, lo, pos, hi, color, label=label,
+                                  linewidth=linewidths, linestyle=linestyles,
+                                  alpha=alpha, **kwargs)
+        return self._segments(lo, pos, hi, pos, color, label=label,
+                              linewidth=linewidths, linestyle=linestyles,
+                              alpha=alpha, **kwargs)
+
+    def _segments(self, x0, y0, x1, y1, colors, label=None, linewidth=None,
+                  linestyle=None, alpha=None, fraction=None, **kwargs):
+        """Draw the segments ``(x0, y0)-(x1, y1)`` (broadcast together) as
+        one NaN-separated line trace per distinct colour.
+
+        With *fraction* ``'x'`` or ``'y'`` those coordinates are axes
+        fractions, placed on the panel's fraction axis (see
+        :meth:`QFigure._fraction_axis`), so the lines span the axes whatever
+        its data range.
+        """
+        x0, y0, x1, y1 = np.broadcast_arrays(
+            *(np.asarray(a, dtype=float).ravel() for a in (x0, y0, x1, y1)))
+        if colors is None:
+            colors = self._next_color()
+        colors = np.broadcast_to(np.asarray(colors, dtype=object), x0.shape)
+        dash = _rc.dash(linestyle)
+        xref, yref = self._trace_refs()
+        if fraction == "x":
+            xref = self._parent._fraction_axis(self, "x")
+            kwargs.setdefault("hoverinfo", "y")
+        elif fraction == "y":
+            yref = self._parent._fraction_axis(self, "y")
+            kwargs.setdefault("hoverinfo", "x")
+
+        groups = dict.fromkeys(colors.tolist())
+        for i, color in enumerate(groups):
+            keep = colors == color if len(groups) > 1 else slice(None)
+            self._add_trace(go.Scatter(
+                x=_interleave(x0[keep], x1[keep]),
+                y=_interleave(y0[keep], y1[keep]),
+                mode="lines", name=label,
+                line=dict(color=_rc.to_color(color), width=linewidth,
+                          dash=dash),
+                opacity=alpha,
+                showlegend=label is not None and i == 0,
+                **kwargs,
+            ))
+            self._fig.data[-1].update(xaxis=xref, yaxis=yref)
+        if label:
+            self._has_legend_entries = True
+        return self
+
+    def _spans(self, lo, hi, axis, color, alpha, label=None, **kwargs):
+        """Draw the bands ``lo[i]..hi[i]`` along *axis* ('x' or 'y'),
+        spanning the other direction, as one filled trace of
+        NaN-separated rectangles."""
+        lo, hi = np.broadcast_arrays(np.asarray(lo, dtype=float).ravel(),
+                                     np.asarray(hi, dtype=float).ravel())
+        n = lo.size
+        along = np.column_stack([lo, hi, hi, lo, lo, np.full(n, np.nan)])
+        across = np.tile([0, 0, 1, 1, 0, np.nan], (n, 1))
+        xref, yref = self._trace_refs()
+        if axis == "x":
+            x, y = along, across
+            yref = self._parent._fraction_axis(self, "y")
+        else:
+            x, y = across, along
+            xref = self._parent._fraction_axis(self, "x")
+        self._add_trace(go.Scatter(
+            x=x.ravel(), y=y.ravel(), mode="lines",
+            fill="toself", fillcolor=_rgba(_rc.to_color(color), alpha),
+            line=dict(width=0), hoverinfo="skip", name=label,
+            showlegend=label is not None,
+            **kwargs,
+        ))
+        self._fig.data[-1].update(xaxis=xref, yaxis=yref)
+        if label:
+            self._has_legend_entries = True
+        return self
+
     def text(self, x, y, s, fontsize=12, color="black", ha="left",
              va="bottom", **kwargs):
         """Add text annotation at data coordinates."""
@@ -546,6 +1381,104 @@ class Axes:
         )
         return self
 
+    def texts(self, x, y, labels, fontsize=12, color="black", ha="left",
+              va="bottom", cull=False, priority=None, xlim=None, ylim=None,
+              gl="auto", label=None, data=None, **kwargs):
+        """Many text labels at data coordinates as one ``mode='text'``
+        trace, where :meth:`text` adds a layout annotation per label.
+
+        Args:
+            x, y: Label positions
+            labels: Label strings (numbers are converted)
+            fontsize, color: Scalars or one value per label
+            ha, va: Alignment of each label relative to its point, as in
+                :meth:`text`
+            cull: Drop labels whose estimated box overlaps an earlier kept
+                one at the panel's screen size.  Computed once for the
+                initial view; zooming in does not bring labels back.
+            priority: Optional per-label weights; with *cull*, higher ones
+                are placed first (default: input order)
+            xlim, ylim: View used for culling (default: the axis range if
+                set, else the data extent)
+            gl: Use ``Scattergl``: True, False or 'auto' (more than
+                ``rcParams['gl.threshold']`` labels after culling)
+            label: Legend entry for the trace
+            data: Optional table whose columns *x*, *y*, *labels*,
+                *fontsize*, *color* and *priority* may name
+        """
+        x, y, labels, fontsize, color, priority = (
+            _data.lookup(data, a)
+            for a in (x, y, labels, fontsize, color, priority))
+        x, y = self._encode_dates(_data.to_numpy(x), _data.to_numpy(y))
+        x, y = np.asarray(x), np.asarray(y)
+        labels = np.asarray(_data.to_numpy(labels)).astype(str)
+        per_label = {}
+        if np.ndim(fontsize) > 0:
+            per_label["size"] = np.asarray(_data.to_numpy(fontsize))
+        if not isinstance(color, str) and np.ndim(color) > 0:
+            per_label["color"] = np.asarray(_data.to_numpy(color), dtype=object)
+
+        if cull and labels.size:
+            keep = self._uncluttered(x, y, labels, fontsize, ha, va,
+                                     priority, xlim, ylim)
+            x, y, labels = x[keep], y[keep], labels[keep]
+            per_label = {k: v[keep] for k, v in per_label.items()}
+
+        if gl == "auto":
+            gl = labels.size > rcParams["gl.threshold"]
+        position = (f"{_TEXT_VPOSITION.get(va, 'top')} "
+                    f"{_TEXT_HPOSITION.get(ha, 'right')}")
+        textfont = dict(size=fontsize, color=color)
+        textfont.update(per_label)
+        self._add_trace((go.Scattergl if gl else go.Scatter)(
+            x=x, y=y, text=labels, mode="text", textposition=position,
+            textfont=textfont, hoverinfo="text", name=label,
+            showlegend=label is not None,
+            **kwargs,
+        ))
+        if label:
+            self._has_legend_entries = True
+        return self
+
+    def _uncluttered(self, x, y, labels, fontsize, ha, va, priority, xlim,
+                     ylim):
+        """Mask of the labels :meth:`texts` keeps when culling overlaps."""
+        width, height = self._panel_pixels()
+        px, py = [], []
+        for values, axis_name, lim, pixels in (
+                (x, self._xaxis_name(), xlim, width),
+                (y, self._yaxis_name(), ylim, height)):
+            values = np.asarray(values, dtype=float)
+            axis = self._fig.layout[axis_name]
+            log = axis.type == "log"
+            if log:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    values = np.log10(values)
+            if lim is None and axis.range is not None:
+                lim = axis.range  # plotly stores log ranges as exponents
+            elif lim is not None and log:
+                lim = np.log10(lim)
+            if lim is None:
+                finite = values[np.isfinite(values)]
+                lim = (finite.min(), finite.max()) if finite.size else (0, 1)
+            lo, hi = float(lim[0]), float(lim[1])
+            scale = pixels / (hi - lo) if hi != lo else 0.0
+            px.append((values - lo) * scale)
+        px, py = px
+
+        # Box estimate: 0.6 em per character, 1.2 em line height
+        size = np.asarray(fontsize, dtype=float)
+        w = 0.6 * size * np.char.str_len(labels)
+        h = 1.2 * size
+        left = px - w * _TEXT_HFRACTION.get(ha, 0.0)
+        bottom = py - h * _TEXT_VFRACTION.get(va, 0.0)
+        order = None
+        if priority is not None:
+            order = np.argsort(-np.asarray(_data.to_numpy(priority),
+                                           dtype=float), kind="stable")
+        return _reduce.cull_overlaps(left, bottom, left + w, bottom + h,
+                                     order)
+
     def annotate(self, text, xy, xytext=None, arrowprops=None, fontsize=12,
                  color="black", **kwargs):
         """Annotate a point with optional arrow."""
@@ -578,14 +1511,14 @@ class Axes:
 
     def xlabel(self, label, fontsize=None, **kwargs):
         font = dict(size=fontsize) if fontsize else None
-        self._fig.update_layout(**{
+        self._update_layout(**{
             self._xaxis_name(): dict(title=dict(text=label, font=font))
         })
         return self
 
     def ylabel(self, label, fontsize=None, **kwargs):
         font = dict(size=fontsize) if fontsize else None
-        self._fig.update_layout(**{
+        self._update_layout(**{
             self._yaxis_name(): dict(title=dict(text=label, font=font))
         })
         return self
@@ -593,7 +1526,7 @@ class Axes:
     def title(self, label, fontsize=None, **kwargs):
         if self._parent._nrows == 1 and self._parent._ncols == 1:
             font = dict(size=fontsize) if fontsize else None
-            self._fig.update_layout(title=dict(
+            self._update_layout(title=dict(
                 text=label,
                 font=font,
                 x=0.5,           # Center title
@@ -629,8 +1562,8 @@ class Axes:
             lo, hi = args[0]
         else:
             lo, hi = args
-        self._fig.update_layout(**{
-            self._xaxis_name(): dict(range=[lo, hi])
+        self._update_layout(**{
+            self._xaxis_name(): dict(range=[lo, hi], autorange=False)
         })
         return self
 
@@ -640,15 +1573,15 @@ class Axes:
             lo, hi = args[0]
         else:
             lo, hi = args
-        self._fig.update_layout(**{
-            self._yaxis_name(): dict(range=[lo, hi])
+        self._update_layout(**{
+            self._yaxis_name(): dict(range=[lo, hi], autorange=False)
         })
         return self
 
     def xscale(self, scale):
         """Set x-axis scale: 'linear' or 'log'."""
         scale_type = "log" if scale == "log" else "linear"
-        self._fig.update_layout(**{
+        self._update_layout(**{
             self._xaxis_name(): dict(type=scale_type)
         })
         return self
@@ -656,7 +1589,7 @@ class Axes:
     def yscale(self, scale):
         """Set y-axis scale: 'linear' or 'log'."""
         scale_type = "log" if scale == "log" else "linear"
-        self._fig.update_layout(**{
+        self._update_layout(**{
             self._yaxis_name(): dict(type=scale_type)
         })
         return self
@@ -671,7 +1604,7 @@ class Axes:
             update["tickangle"] = -rotation
         if fontsize is not None:
             update["tickfont"] = dict(size=fontsize)
-        self._fig.update_layout(**{self._xaxis_name(): update})
+        self._update_layout(**{self._xaxis_name(): update})
         return self
 
     def yticks(self, ticks=None, labels=None, rotation=None, fontsize=None):
@@ -684,25 +1617,25 @@ class Axes:
             update["tickangle"] = -rotation
         if fontsize is not None:
             update["tickfont"] = dict(size=fontsize)
-        self._fig.update_layout(**{self._yaxis_name(): update})
+        self._update_layout(**{self._yaxis_name(): update})
         return self
 
     def grid(self, visible=True, which="major", axis="both", **kwargs):
         """Toggle grid lines."""
         show = visible
         if axis in ("both", "x"):
-            self._fig.update_layout(**{
+            self._update_layout(**{
                 self._xaxis_name(): dict(showgrid=show)
             })
         if axis in ("both", "y"):
-            self._fig.update_layout(**{
+            self._update_layout(**{
                 self._yaxis_name(): dict(showgrid=show)
             })
         return self
 
     def legend(self, show=True, loc=None, fontsize=None, frameon=True,
                fancybox=True, shadow=False, framealpha=None, facecolor=None,
-               edgecolor=None, **kwargs):
+               edgecolor=None, max_entries=_LEGEND_MAX_ENTRIES, **kwargs):
         """Show / configure the legend.
 
         Args:
@@ -718,6 +1651,10 @@ class Axes:
             framealpha: Frame transparency (0-1), default 1.0 (opaque)
             facecolor: Background color, default 'white'
             edgecolor: Border color, default 'black'
+            max_entries: With more labelled traces than this, the legend
+                     is collapsed into at most *max_entries* group entries
+                     (or a colorbar for auto-coloured sweeps) when the
+                     figure is shown or saved.  ``None`` never collapses.
         """
         # Store legend config for this axes
         self._legend_config = {
@@ -729,6 +1666,7 @@ class Axes:
             'framealpha': framealpha,
             'facecolor': facecolor,
             'edgecolor': edgecolor,
+            'max_entries': max_entries,
             'kwargs': kwargs
         }
 
@@ -744,6 +1682,12 @@ class Axes:
 
     def _apply_single_legend(self):
         """Apply legend for single-plot figures (standard Plotly legend)."""
+        self._update_layout(legend=self._legend_layout())
+        return self
+
+    def _legend_layout(self, xdomain=(0, 1), ydomain=(0, 1)):
+        """Plotly legend dict for this axes' legend config, positioned by
+        ``loc`` inside the paper-coordinate domain *xdomain* x *ydomain*."""
         config = self._legend_config
 
         # Default matplotlib-like styling: opaque white box with black border
@@ -786,26 +1730,34 @@ class Axes:
         }
 
         if config['loc'] in _loc_map:
-            legend_kw.update(_loc_map[config['loc']])
+            loc = dict(_loc_map[config['loc']])
+            loc["x"] = xdomain[0] + (xdomain[1] - xdomain[0]) * loc["x"]
+            loc["y"] = ydomain[0] + (ydomain[1] - ydomain[0]) * loc["y"]
+            legend_kw.update(loc)
 
         legend_kw.update(config['kwargs'])
-        self._fig.update_layout(legend=legend_kw)
-        return self
+        return legend_kw
 
     def invert_xaxis(self):
-        self._fig.update_layout(**{self._xaxis_name(): dict(autorange="reversed")})
+        self._update_layout(**{self._xaxis_name(): dict(autorange="reversed")})
         return self
 
     def invert_yaxis(self):
-        self._fig.update_layout(**{self._yaxis_name(): dict(autorange="reversed")})
+        self._update_layout(**{self._yaxis_name(): dict(autorange="reversed")})
         return self
 
     def set_aspect(self, aspect):
-        """Rough aspect-ratio control."""
+        """Aspect-ratio control: 'equal', 'auto' or a y/x scale ratio."""
         if aspect == "equal":
-            self._fig.update_layout(**{
+            aspect = 1
+        if aspect == "auto":
+            self._update_layout(**{
+                self._yaxis_name(): dict(scaleanchor=False)
+            })
+        else:
+            self._update_layout(**{
                 self._yaxis_name(): dict(scaleanchor=self._xref(),
-                                         scaleratio=1)
+                                         scaleratio=aspect)
             })
         return self
 
@@ -814,6 +1766,31 @@ class Axes:
         ax2 = _TwinAxes(self._parent, self._row, self._col, secondary_y=True)
         return ax2
 
+    # ---- clearing ---------------------------------------------------------
+
+    def clear(self):
+        """Remove this axes' traces, annotations, shapes and legend and
+        restart its colour cycle (like ``matplotlib.axes.Axes.cla``).
+
+        The axis layout - labels, limits, scales, ticks - is kept, so the
+        panel can be refilled without rebuilding the figure.
+        """
+        self._parent._clear_axes([self])
+        return self
+
+    cla = clear
+
+    def _trace_refs(self):
+        """``(xaxis, yaxis)`` ids of the traces drawn in this axes."""
+        return self._xref(), self._yref()
+
+    def _reset(self):
+        """Forget per-axes trace and legend state."""
+        self._color_idx = 0
+        self._has_legend_entries = False
+        self._legend_traces = []
+        self.__dict__.pop('_legend_config', None)
+
 
 # ===========================================================================
 #  _TwinAxes  — lightweight secondary-y support
@@ -825,7 +1802,7 @@ class _TwinAxes(Axes):
         super().__init__(parent, row, col)
         self._secondary_y = secondary_y
         # Enable a secondary y-axis in the layout
-        self._fig.update_layout(
+        self._update_layout(
             **{
                 "yaxis2": dict(
                     overlaying="y",
@@ -835,13 +1812,18 @@ class _TwinAxes(Axes):
             }
         )
 
+    def _trace_refs(self):
+        return self._xref(), "y2"
+
     def _add_trace(self, trace):
         trace.yaxis = "y2"
-        self._fig.add_trace(trace)
+        with _profile.stage("add_trace", self._parent):
+            self._fig.add_trace(trace)
+        self._parent._trace_origins[len(self._fig.data) - 1] = _trace_origin()
 
     def ylabel(self, label, fontsize=None, **kwargs):
         font = dict(size=fontsize) if fontsize else None
-        self._fig.update_layout(yaxis2=dict(title=dict(text=label, font=font)))
+        self._update_layout(yaxis2=dict(title=dict(text=label, font=font)))
         return self
 
 
@@ -855,6 +1837,7 @@ class QFigure:
     to an internal default :class:`Axes`.
     """
 
+    @_profile.timed("QFigure.__init__")
     def __init__(self, fig=None, nrows=1, ncols=1, figsize=None,
                  subplot_titles=None, sharex=False, sharey=False,
                  **make_subplots_kwargs):
@@ -863,35 +1846,39 @@ class QFigure:
 
         if fig is not None:
             self._fig = fig
-        elif nrows == 1 and ncols == 1:
-            self._fig = go.Figure()
+            self._build_layout(figsize)
         else:
-            shared_x = "all" if sharex else None
-            shared_y = "all" if sharey else None
-            self._fig = make_subplots(
-                rows=nrows, cols=ncols,
-                subplot_titles=subplot_titles,
-                shared_xaxes=shared_x,
-                shared_yaxes=shared_y,
-                **make_subplots_kwargs,
-            )
-
-        if figsize:
-            w, h = figsize
-            self._fig.update_layout(width=w * 100, height=h * 100)
-
-        # Apply default matplotlib-like styling
-        self._apply_default_style()
+            self._new_figure(figsize, subplot_titles, sharex, sharey,
+                             make_subplots_kwargs)
 
         # Track auto-colored traces for smart color scheme application
         # Store tuples of (trace_idx, axes) to enable per-subplot coloring
         self._auto_colored_trace_indices = []
 
+        # trace_idx -> "method() at file:line" of the call that added it
+        self._trace_origins = {}
+
+        # Serializes the *_async exports of this figure
+        self._export_lock = threading.Lock()
+
         # Colorbar tracking for automatic colorbar support
         self._colorbar_values = None  # Values to map to colors
         self._colorbar_label = None   # Label for colorbar
         self._colorbar_colors = None  # Hex colors used
         self._colorbar_added = False  # Track if colorbar already added
+        self._colorbar_trace = None   # Index of the colorbar's dummy trace
+
+        # trace_idx -> (showlegend, legendgroup) before the legend policy
+        # hid it, and indices of the legend-only traces it added
+        self._legend_virtualized = {}
+        self._legend_proxies = []
+
+        # Panel x/y axis id -> id of its hidden [0, 1] fraction axis
+        self._fraction_axes = {}
+
+        # (trace_idx, axes, x_source, y_source) for plot() calls whose data
+        # is read and decimated at finalize time
+        self._lazy_traces = []
 
         # Default single axes
         self._default_ax = Axes(self, 1, 1)
@@ -902,50 +1889,85 @@ class QFigure:
             for r in range(nrows)
         ]
 
-    # ---- default styling --------------------------------------------------
-    def _apply_default_style(self):
-        """Apply matplotlib-like default styling."""
-        # Default layout settings
-        layout_updates = dict(
-            plot_bgcolor='white',      # White background for plot area
-            paper_bgcolor='white',     # White background for entire figure
-            font=dict(
-                family='Computer Modern, CMU Serif, serif',  # CMR10-like font
-                size=12,
-                color='black'
-            ),
-        )
+    # ---- construction -----------------------------------------------------
+    def _build_layout(self, figsize):
+        """Size and style ``self._fig`` and snapshot the resulting layout."""
+        if figsize:
+            w, h = figsize
+            self._update_layout(width=w * 100, height=h * 100)
 
-        # Apply to all xaxis and yaxis
-        for i in range(1, self._nrows * self._ncols + 1):
-            xaxis_name = f"xaxis{i}" if i > 1 else "xaxis"
-            yaxis_name = f"yaxis{i}" if i > 1 else "yaxis"
-
-            axis_style = dict(
-                showline=True,           # Show axis border (frame)
-                linewidth=2,             # Thicker frame line (like matplotlib)
-                linecolor='black',
-                mirror=True,             # Show frame on all sides
-                showgrid=True,           # Show grid
-                gridwidth=0.5,           # Thinner grid lines than frame
-                gridcolor='rgba(0, 0, 0, 0.5)',  # Black with 50% opacity
-                zeroline=False,          # Don't emphasize zero line
-                ticks='outside',         # Ticks extend outside plot frame
-                ticklen=5,               # Length of tick marks
-                tickwidth=1.5,           # Tick thickness
-                tickcolor='black',
-            )
+        # Apply default matplotlib-like styling
+        self._apply_default_style()
+
+        # Layout as constructed, restored by clf(keep_layout=False)
+        self._layout_skeleton = self._fig.layout.to_plotly_json()
+
+    def _new_figure(self, figsize, subplot_titles, sharex, sharey,
+                    make_subplots_kwargs):
+        """Create ``self._fig``, from the cached layout skeleton for these
+        arguments if there is one (see :func:`skeleton_cache_info`)."""
+        n = self._nrows * self._ncols
+        titles = list(subplot_titles or ())[:n]
 
-            layout_updates[xaxis_name] = axis_style.copy()
-            layout_updates[yaxis_name] = axis_style.copy()
+        def build():
+            if n == 1:
+                self._fig = go.Figure()
+            else:
+                with _profile.stage("make_subplots", self):
+                    self._fig = _subplots.make_subplots(
+                        rows=self._nrows, cols=self._ncols,
+                        subplot_titles=subplot_titles,
+                        shared_xaxes="all" if sharex else None,
+                        shared_yaxes="all" if sharey else None,
+                        **make_subplots_kwargs,
+                    )
+            self._build_layout(figsize)
+            return (self._layout_skeleton,
+                    self._fig.__dict__.get("_grid_ref"),
+                    self._fig.__dict__.get("_grid_str"))
+
+        try:
+            key = (self._nrows, self._ncols, bool(sharex), bool(sharey),
+                   tuple(figsize) if figsize else None,
+                   tuple(bool(t) for t in titles),
+                   _skeleton.freeze(make_subplots_kwargs), _style.key())
+        except TypeError:  # unhashable make_subplots arguments
+            build()
+            return
+        self._fig = None
+        layout, grid_ref, grid_str = _skeleton.get(key, build)
+        if self._fig is not None:
+            return  # built just now
+        if any(titles):
+            # make_subplots adds one annotation per non-empty title, in order
+            texts = [t for t in titles if t]
+            annotations = layout["annotations"]
+            layout = dict(layout, annotations=[
+                dict(a, text=t) for a, t in zip(annotations, texts)
+            ] + annotations[len(texts):])
+        with _profile.stage("copy_skeleton", self):
+            self._fig = go.Figure(layout=layout)
+        if grid_ref is not None:
+            self._fig.__dict__["_grid_ref"] = grid_ref
+            self._fig.__dict__["_grid_str"] = grid_str
+        self._layout_skeleton = layout
+
+    # ---- default styling --------------------------------------------------
+    @_profile.timed("QFigure._apply_default_style")
+    def _apply_default_style(self):
+        """Apply matplotlib-like default styling.
 
-        self._fig.update_layout(**layout_updates)
+        The style is the shared ``"qplotly"`` template, so it is serialized
+        once per figure rather than once per axis and per trace.
+        """
+        self._update_layout(template=_style.template())
 
+    @_profile.timed("QFigure._apply_tight_layout")
     def _apply_tight_layout(self):
         """Apply tight layout (matplotlib-style) by reducing margins."""
         # Matplotlib tight_layout reduces whitespace around plots
         # In Plotly, this is achieved by setting smaller margins
-        self._fig.update_layout(
+        self._update_layout(
             margin=dict(l=60, r=30, t=80, b=60)  # left, right, top, bottom
         )
 
@@ -977,26 +1999,31 @@ class QFigure:
 
     def suptitle(self, title, fontsize=None, **kwargs):
         font = dict(size=fontsize) if fontsize else None
-        self._fig.update_layout(title=dict(text=title, font=font))
+        self._update_layout(title=dict(text=title, font=font))
         return self
 
     def tight_layout(self):
         """No-op for API compatibility (Plotly auto-manages margins)."""
-        self._fig.update_layout(margin=dict(l=60, r=40, t=60, b=60))
+        self._update_layout(margin=dict(l=60, r=40, t=60, b=60))
         return self
 
     def set_template(self, template):
         """Set a Plotly template: 'plotly', 'plotly_dark', 'ggplot2', etc."""
-        self._fig.update_layout(template=template)
+        self._update_layout(template=template)
         return self
 
     def update_layout(self, **kwargs):
         """Pass-through to the underlying Plotly figure layout."""
-        self._fig.update_layout(**kwargs)
+        self._update_layout(**kwargs)
         return self
 
+    def _update_layout(self, **kwargs):
+        with _profile.stage("update_layout", self):
+            self._fig.update_layout(**kwargs)
+
     # ---- auto color scheme ------------------------------------------------
 
+    @_profile.timed("QFigure._apply_auto_color_scheme")
     def _apply_auto_color_scheme(self):
         """Apply nipy_spectral colormap per subplot.
 
@@ -1059,111 +2086,280 @@ class QFigure:
                     except (AttributeError, TypeError):
                         pass
 
-    # ---- subplot legends --------------------------------------------------
+    # ---- clearing ---------------------------------------------------------
 
-    def _apply_subplot_legends(self):
-        """Apply per-subplot legends (matplotlib-style)."""
-        if self._nrows == 1 and self._ncols == 1:
-            return  # Single plot uses standard legend
+    def clf(self, keep_layout=True):
+        """Clear the figure for reuse (like ``matplotlib.pyplot.clf``).
 
-        # Hide the global Plotly legend for subplots
-        self._fig.update_layout(showlegend=False)
+        Removes every trace, the annotations and shapes drawn in axes, the
+        legends and the auto-colour and colorbar state.  With *keep_layout*
+        the styled layout - axis labels, limits, titles, size, template - is
+        kept; otherwise it is restored to how it was right after the figure
+        was constructed.  Either way the subplot grid is not rebuilt.
+        """
+        self._fig.data = []
+        if keep_layout:
+            self._clear_layout_items(None)
+            if self._nrows == 1 and self._ncols == 1:
+                self._fig.layout.legend = None
+        else:
+            self._fig.layout = self._layout_skeleton
+            self._fraction_axes = {}
+        self._trace_origins = {}
+        self._auto_colored_trace_indices = []
+        self._lazy_traces = []
+        self._colorbar_values = None
+        self._colorbar_label = None
+        self._colorbar_colors = None
+        self._colorbar_added = False
+        self._colorbar_trace = None
+        self._legend_virtualized = {}
+        self._legend_proxies = []
+        for ax in self._all_axes():
+            ax._reset()
+        return self
 
-        # For each subplot, create a custom legend box
+    def _all_axes(self):
+        yield self._default_ax
         for row_axes in self._axes_grid:
-            for ax in (row_axes if isinstance(row_axes, list) else [row_axes]):
-                if not hasattr(ax, '_legend_config') or not ax._has_legend_entries:
-                    continue
+            yield from row_axes
+
+    def _clear_axes(self, axes):
+        """Clear *axes* (see :meth:`Axes.clear`)."""
+        refs = set()
+        for ax in axes:
+            x, y = ax._trace_refs()
+            refs |= {(x, y), (self._fraction_axes.get(ax._xref()), y),
+                     (x, self._fraction_axes.get(ax._yref()))}
+        self._remove_traces({
+            i for i, trace in enumerate(self._fig.data)
+            if i != self._colorbar_trace
+            and (getattr(trace, "xaxis", None) or "x",
+                 getattr(trace, "yaxis", None) or "y") in refs})
+        self._clear_layout_items({ref for pair in refs for ref in pair})
+        if self._nrows == 1 and self._ncols == 1:
+            self._fig.layout.legend = None
+        for ax in axes:
+            ax._reset()
 
-                config = ax._legend_config
-                if not config['show']:
-                    continue
+    def _fraction_axis(self, ax, which):
+        """Id of a hidden axis fixed to [0, 1] and overlaying *ax*'s
+        *which* ('x' or 'y') axis, created on first use.
 
-                # Get subplot domain
-                subplot_idx = self._subplot_index(ax._row, ax._col)
-                xaxis_name = f"xaxis{subplot_idx}" if subplot_idx > 1 else "xaxis"
-                yaxis_name = f"yaxis{subplot_idx}" if subplot_idx > 1 else "yaxis"
-
-                xaxis = self._fig.layout[xaxis_name]
-                yaxis = self._fig.layout[yaxis_name]
-
-                # Get domain (normalized coordinates)
-                xdomain = xaxis.domain if xaxis.domain else [0, 1]
-                ydomain = yaxis.domain if yaxis.domain else [0, 1]
-
-                # Calculate legend position within subplot
-                loc = config['loc']
-                loc_coords = {
-                    "upper right":   (0.98, 0.98, "right", "top"),
-                    "upper left":    (0.02, 0.98, "left", "top"),
-                    "lower left":    (0.02, 0.02, "left", "bottom"),
-                    "lower right":   (0.98, 0.02, "right", "bottom"),
-                    "right":         (0.98, 0.5, "right", "middle"),
-                    "center left":   (0.02, 0.5, "left", "middle"),
-                    "center right":  (0.98, 0.5, "right", "middle"),
-                    "lower center":  (0.5, 0.02, "center", "bottom"),
-                    "upper center":  (0.5, 0.98, "center", "top"),
-                    "center":        (0.5, 0.5, "center", "middle"),
-                    "best":          (0.98, 0.98, "right", "top"),
-                }.get(loc, (0.98, 0.98, "right", "top"))
-
-                x_frac, y_frac, xanchor, yanchor = loc_coords
-
-                # Convert to paper coordinates
-                x_paper = xdomain[0] + (xdomain[1] - xdomain[0]) * x_frac
-                y_paper = ydomain[0] + (ydomain[1] - ydomain[0]) * y_frac
-
-                # Get traces for this subplot
-                legend_items = []
-                for trace_idx in ax._legend_traces:
-                    if trace_idx < len(self._fig.data):
-                        trace = self._fig.data[trace_idx]
-                        if trace.showlegend and trace.name:
-                            color = 'black'
-                            if hasattr(trace, 'line') and trace.line and hasattr(trace.line, 'color'):
-                                color = trace.line.color
-                            elif hasattr(trace, 'marker') and trace.marker and hasattr(trace.marker, 'color'):
-                                color = trace.marker.color or 'black'
-                            legend_items.append((trace.name, color))
-
-                if not legend_items:
-                    continue
+        Traces placed on it are positioned in axes-fraction coordinates in
+        that direction, so axis-spanning lines and bands stay one trace
+        instead of one layout shape each.
+        """
+        base = ax._xref() if which == "x" else ax._yref()
+        ref = self._fraction_axes.get(base)
+        if ref is None:
+            # Number it past every axis the layout already has - all grid
+            # cells (make_subplots creates xaxis/yaxis 1..nrows*ncols) and
+            # earlier overlays - so a real cell's axis is never reused.  The
+            # floor of 3 keeps yaxis2 free for twinx() on a single panel.
+            used = [int(name[5:] or 1) for name in self._fig.layout
+                    if name[:5] in ("xaxis", "yaxis")]
+            number = max(used + [2]) + 1
+            anchor = ax._yref() if which == "x" else ax._xref()
+            self._update_layout(**{f"{which}axis{number}": dict(
+                overlaying=base, anchor=anchor, range=[0, 1],
+                fixedrange=True, visible=False)})
+            ref = self._fraction_axes[base] = f"{which}{number}"
+        return ref
+
+    def _clear_layout_items(self, refs):
+        """Drop annotations and shapes positioned on the axis ids *refs*
+        (``None``: on any axis).  Paper-only items such as subplot titles
+        stay."""
+        def on_axes(item):
+            ids = {(ref or "paper").split(" ")[0] for ref in (item.xref, item.yref)}
+            ids.discard("paper")
+            return bool(ids) and (refs is None or ids <= refs)
+
+        layout = self._fig.layout
+        for name in ("annotations", "shapes"):
+            items = layout[name]
+            if any(on_axes(item) for item in items):
+                layout[name] = [item for item in items if not on_axes(item)]
+
+    def _remove_traces(self, drop):
+        """Delete the traces at indices *drop*, renumbering every index the
+        figure and its axes keep (origins, auto-colour, lazy sources,
+        legend entries, colorbar, legend policy)."""
+        if not drop:
+            return
+        data = self._fig.data
+        keep = [i for i in range(len(data)) if i not in drop]
+        new_index = {old: new for new, old in enumerate(keep)}
+        self._fig.data = [data[i] for i in keep]
+        self._trace_origins = {new_index[i]: origin
+                               for i, origin in self._trace_origins.items()
+                               if i in new_index}
+        self._auto_colored_trace_indices = [
+            (new_index[i], ax) for i, ax in self._auto_colored_trace_indices
+            if i in new_index]
+        self._lazy_traces = [(new_index[i], *rest)
+                             for i, *rest in self._lazy_traces
+                             if i in new_index]
+        for ax in self._all_axes():
+            ax._legend_traces = [new_index[i] for i in ax._legend_traces
+                                 if i in new_index]
+        if self._colorbar_trace is not None:
+            self._colorbar_trace = new_index[self._colorbar_trace]
+        self._legend_virtualized = {new_index[i]: state for i, state
+                                    in self._legend_virtualized.items()
+                                    if i in new_index}
+        self._legend_proxies = [new_index[i] for i in self._legend_proxies
+                                if i in new_index]
 
-                # Create legend annotation with rounded rectangle
-                self._create_legend_annotation(
-                    legend_items, x_paper, y_paper, xanchor, yanchor, config
-                )
+    # ---- subplot legends --------------------------------------------------
 
-    def _create_legend_annotation(self, items, x, y, xanchor, yanchor, config):
-        """Create a legend annotation with rounded rectangle background."""
-        fontsize = config['fontsize'] or 12
-        facecolor = config['facecolor'] or 'white'
-        edgecolor = config['edgecolor'] or 'black'
-        frameon = config['frameon']
-        fancybox = config['fancybox']
-        framealpha = config['framealpha'] if config['framealpha'] is not None else 1.0
+    @_profile.timed("QFigure._apply_subplot_legends")
+    def _apply_subplot_legends(self):
+        """Apply per-subplot legends (matplotlib-style).
 
-        # Build legend text
-        legend_text = "<br>".join([f"<span style='color:{color}'>\u25A0</span> {name}"
-                                   for name, color in items])
+        Each subplot whose axes called :meth:`Axes.legend` gets its own
+        native plotly legend (``legend2``, ``legend3``, ...) placed inside
+        its domain, and its traces are pointed at it.  Traces of the other
+        subplots stay in the default ``legend``, which is hidden.
+        """
+        if self._nrows == 1 and self._ncols == 1:
+            return  # Single plot uses standard legend
 
-        # Add annotation for text
-        self._fig.add_annotation(
-            x=x, y=y,
-            xref="paper", yref="paper",
-            text=legend_text,
-            showarrow=False,
-            xanchor=xanchor,
-            yanchor=yanchor,
-            font=dict(size=fontsize),
-            bgcolor=f"rgba(255,255,255,{framealpha})" if facecolor == 'white' else facecolor,
-            bordercolor=edgecolor if frameon else "rgba(0,0,0,0)",
-            borderwidth=1 if frameon else 0,
-            borderpad=6,
-        )
+        layout = self._fig.layout
+        updates = dict(showlegend=True, legend=dict(visible=False))
+        n_traces = len(self._fig.data)
+        for row_axes in self._axes_grid:
+            for ax in row_axes:
+                config = getattr(ax, '_legend_config', None)
+                shown = (config is not None and config['show']
+                         and ax._has_legend_entries)
+                name = f"legend{self._subplot_index(ax._row, ax._col) + 1}"
+                if shown:
+                    xdomain = layout[ax._xaxis_name()].domain or (0, 1)
+                    ydomain = layout[ax._yaxis_name()].domain or (0, 1)
+                    updates[name] = ax._legend_layout(xdomain, ydomain)
+                elif name in layout:
+                    # Shown by an earlier finalize, switched off since
+                    updates[name] = dict(visible=False)
+                for trace_idx in ax._legend_traces:
+                    if trace_idx < n_traces:
+                        self._fig.data[trace_idx].legend = name if shown else None
+        self._update_layout(**updates)
+
+    # ---- legend virtualization -------------------------------------------
+
+    @_profile.timed("QFigure._apply_legend_policy")
+    def _apply_legend_policy(self):
+        """Collapse legends with more than ``max_entries`` labelled traces.
+
+        If the traces were coloured by the automatic colormap, they leave
+        the legend and a continuous :meth:`colorbar` stands for them.
+        Otherwise consecutive traces are put in legend groups of equal size,
+        each listed once as "first ... last" by a data-less legend-only
+        trace; clicking it toggles the group.  Hover labels keep every
+        trace's own name either way.
+        """
+        self._restore_legend_entries()
+        if self._nrows == 1 and self._ncols == 1:
+            scopes = [self._default_ax]
+        else:
+            # only legends enabled with Axes.legend() are visible
+            scopes = [ax for row_axes in self._axes_grid for ax in row_axes
+                      if hasattr(ax, '_legend_config')]
+        data = self._fig.data
+        auto_colored = {i for i, _ in self._auto_colored_trace_indices}
+        proxies = []
+        for ax in scopes:
+            config = getattr(ax, '_legend_config', None)
+            if config is not None and not config['show']:
+                continue
+            max_entries = (config['max_entries'] if config is not None
+                           else _LEGEND_MAX_ENTRIES)
+            entries = [i for i in ax._legend_traces
+                       if i < len(data) and data[i].showlegend]
+            if max_entries is None or len(entries) <= max_entries:
+                continue
+            for i in entries:
+                self._legend_virtualized[i] = (data[i].showlegend,
+                                               data[i].legendgroup)
+                data[i].showlegend = False
+            if (self._colorbar_colors is not None
+                    and len(self._colorbar_colors) == len(entries)
+                    and auto_colored.issuperset(entries)):
+                self.colorbar()
+                continue
+            size = -(-len(entries) // max(max_entries, 1))
+            for start in range(0, len(entries), size):
+                group = entries[start:start + size]
+                group_id = f"qplotly-legend-{group[0]}"
+                for i in group:
+                    data[i].legendgroup = group_id
+                first, last = data[group[0]], data[group[-1]]
+                if not hasattr(first, "xaxis"):
+                    continue  # no x/y to draw a legend-only proxy with
+                proxy = dict(
+                    type=first.type, x=[None], y=[None],
+                    name=f"{first.name} \u2026 {last.name}",
+                    legendgroup=group_id, legend=first.legend,
+                    xaxis=first.xaxis, yaxis=first.yaxis,
+                    showlegend=True, hoverinfo="skip",
+                )
+                for key in ("mode", "line", "marker", "fill", "fillcolor"):
+                    if key in first and first[key] is not None:
+                        proxy[key] = first[key]
+                proxies.append(proxy)
+        if proxies:
+            start = len(data)
+            self._fig.add_traces(proxies)
+            self._legend_proxies = list(range(start, len(self._fig.data)))
+
+    def _restore_legend_entries(self):
+        """Undo :meth:`_apply_legend_policy` (it runs on every finalize)."""
+        self._remove_traces(set(self._legend_proxies))
+        data = self._fig.data
+        for i, (showlegend, group) in self._legend_virtualized.items():
+            data[i].showlegend = showlegend
+            data[i].legendgroup = group
+        self._legend_virtualized = {}
+
+    # ---- lazy trace sources -----------------------------------------------
+
+    @_profile.timed("QFigure._resolve_lazy_traces")
+    def _resolve_lazy_traces(self):
+        """Read pending lazy sources in bounded chunks and keep only their
+        min/max-decimated samples (about four per pixel column)."""
+        for trace_idx, ax, x_src, y_src in self._lazy_traces:
+            width, _ = ax._panel_pixels()
+            m4 = _reduce.M4(len(y_src), width)
+            if isinstance(y_src, _lazy.LazyArray):
+                chunks = y_src.chunks()
+            else:
+                chunks = _lazy.iter_chunks(_data.to_numpy(y_src))
+            for start, values in chunks:
+                m4.add(start, values)
+            idx, values = m4.result()
+            if x_src is None:
+                x = idx
+            elif isinstance(x_src, _lazy.LazyArray):
+                x = x_src.take(idx)
+            else:
+                x = _data.to_numpy(x_src)[idx]
+            x, _ = ax._encode_dates(x=x)
+            self._fig.data[trace_idx].update(x=x, y=values)
+        self._lazy_traces = []
 
     # ---- display / export -------------------------------------------------
 
+    def _finalize(self, tight_layout=True):
+        """Steps applied before the figure is shown or saved."""
+        self._resolve_lazy_traces()
+        self._apply_auto_color_scheme()
+        self._apply_subplot_legends()
+        self._apply_legend_policy()
+        if tight_layout:
+            self._apply_tight_layout()
+
     def show(self, renderer=None, tight_layout=True, **kwargs):
         """Show the figure.
 
@@ -1176,13 +2372,12 @@ class QFigure:
         **kwargs : dict
             Additional arguments passed to plotly show()
         """
-        self._apply_auto_color_scheme()
-        self._apply_subplot_legends()
-        if tight_layout:
-            self._apply_tight_layout()
-        self._fig.show(renderer=renderer, **kwargs)
+        self._finalize(tight_layout)
+        with _profile.stage("show", self):
+            self._fig.show(renderer=renderer, **kwargs)
 
-    def savefig(self, filename, width=None, height=None, scale=None, tight_layout=True, **kwargs):
+    def savefig(self, filename, width=None, height=None, scale=None,
+                tight_layout=True, cache=None, **kwargs):
         """Save to file (png, jpg, svg, pdf, html, json).
 
         Raster formats require ``kaleido`` (``pip install -U kaleido``).
@@ -1199,27 +2394,141 @@ class QFigure:
             Scaling factor
         tight_layout : bool, default True
             If True, automatically adjust margins (matplotlib-style)
+        cache : RenderCache or False, optional
+            Render cache to use; defaults to the one set with
+            :func:`set_render_cache`.  ``False`` bypasses it.  On a hit the
+            stored file is copied (or linked) to *filename* instead of
+            rendering.
         **kwargs : dict
             Additional arguments
         """
-        self._apply_auto_color_scheme()
-        self._apply_subplot_legends()
-        if tight_layout:
-            self._apply_tight_layout()
+        self._finalize(tight_layout)
+        if cache is None:
+            cache = _cache.default()
+        if not cache:
+            self._write(filename, width, height, scale, **kwargs)
+            return self
+
+        ext = os.path.splitext(filename)[1].lower()
+        with _profile.stage("cache_key", self):
+            key = cache.key([trace.to_plotly_json() for trace in self._fig.data],
+                            self._fig.layout.to_plotly_json(), ext,
+                            width=width, height=height, scale=scale, **kwargs)
+        if not cache.fetch(key, ext, filename):
+            cache.store(key, ext, filename, lambda path: self._write(
+                path, width, height, scale, **kwargs))
+        return self
+
+    def _write(self, filename, width=None, height=None, scale=None, **kwargs):
+        """Write the (finalized) figure, choosing the writer by extension."""
         if filename.endswith(".html"):
-            self._fig.write_html(filename, **kwargs)
+            with _profile.stage("serialize", self):
+                self._fig.write_html(filename, **kwargs)
         elif filename.endswith(".json"):
-            self._fig.write_json(filename, **kwargs)
+            with _profile.stage("serialize", self):
+                self._fig.write_json(filename, **kwargs)
         else:
-            self._fig.write_image(filename, width=width, height=height,
-                                  scale=scale, **kwargs)
-        return self
+            with _profile.stage("write_image", self):
+                self._fig.write_image(filename, width=width, height=height,
+                                      scale=scale, **kwargs)
 
     def to_html(self, **kwargs):
-        return self._fig.to_html(**kwargs)
+        self._resolve_lazy_traces()
+        with _profile.stage("serialize", self):
+            return self._fig.to_html(**kwargs)
 
     def to_json(self, **kwargs):
-        return self._fig.to_json(**kwargs)
+        self._resolve_lazy_traces()
+        with _profile.stage("serialize", self):
+            return self._fig.to_json(**kwargs)
+
+    # ---- asyncio export ---------------------------------------------------
+
+    async def savefig_async(self, filename, width=None, height=None,
+                            scale=None, tight_layout=True, timeout=None,
+                            executor=None, **kwargs):
+        """:meth:`savefig` without blocking the event loop.
+
+        Finalizing, serialization and rendering run on a bounded thread
+        pool (``_export.EXPORT_WORKERS`` threads, or *executor*).  The file
+        is written to a temporary name and moved into place on success, so
+        a timed-out or cancelled save never leaves a partial file.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait before raising ``asyncio.TimeoutError``
+        executor : concurrent.futures.Executor, optional
+            Run on this executor instead of the shared export pool
+        """
+        output = _export.AtomicOutput(filename)
+
+        def job():
+            try:
+                with self._export_lock:
+                    self.savefig(output.path, width=width, height=height,
+                                 scale=scale, tight_layout=tight_layout,
+                                 **kwargs)
+                output.commit()
+            finally:
+                output.discard()
+
+        try:
+            await _export.run(job, timeout, executor)
+        except BaseException:  # timeout or cancellation
+            output.cancel()
+            raise
+        return self
+
+    async def to_html_async(self, timeout=None, executor=None, **kwargs):
+        """:meth:`to_html` on the export pool (see :meth:`savefig_async`)."""
+        def job():
+            with self._export_lock:
+                return self.to_html(**kwargs)
+        return await _export.run(job, timeout, executor)
+
+    async def to_json_async(self, timeout=None, executor=None, **kwargs):
+        """:meth:`to_json` on the export pool (see :meth:`savefig_async`)."""
+        def job():
+            with self._export_lock:
+                return self.to_json(**kwargs)
+        return await _export.run(job, timeout, executor)
+
+    def payload_report(self, top=10, tight_layout=True):
+        """Estimate the serialized size of the finalized figure.
+
+        Parameters
+        ----------
+        top : int, default 10
+            Number of largest traces listed under ``'offenders'``
+        tight_layout : bool, default True
+            Finalize as ``savefig(..., tight_layout=...)`` would
+
+        Returns
+        -------
+        report : dict
+            ``total``, ``layout`` (with per-key sizes: ``annotations``,
+            ``template``, ...), ``traces``, ``subplots`` (keyed ``'x2y2'``),
+            ``fields`` (``'x'``, ``'marker.color'``, ``'error_y.array'``,
+            ...) and ``offenders``.  Every entry has ``bytes`` (what plotly
+            serializes now), ``json_bytes`` (no typed arrays) and
+            ``typed_bytes`` (all numeric arrays as typed arrays); traces
+            also carry the ``origin`` call that created them.  ``str()``
+            or ``.table()`` gives a readable summary.
+
+        Sizes are estimated from dtypes and samples rather than by
+        serializing, so this is cheap enough for CI size budgets::
+
+            assert fig.payload_report()['total']['bytes'] < 5_000_000
+        """
+        self._finalize(tight_layout)
+        return _payload.build_report(
+            [trace.to_plotly_json() for trace in self._fig.data],
+            self._fig.layout.to_plotly_json(),
+            self._trace_origins,
+            typed_arrays=_payload.typed_encodes_arrays(),
+            top=top,
+        )
 
     # ---- colorbar support -------------------------------------------------
 
@@ -1438,7 +2747,10 @@ class QFigure:
             showlegend=False,
             hoverinfo='skip'
         )
-        self._fig.add_trace(dummy_trace)
+        with _profile.stage("add_trace", self):
+            self._fig.add_trace(dummy_trace)
+        self._colorbar_trace = len(self._fig.data) - 1
+        self._trace_origins[self._colorbar_trace] = _trace_origin()
         self._colorbar_added = True
 
         return self
@@ -1446,9 +2758,21 @@ class QFigure:
     @property
     def plotly_fig(self):
         """Access the underlying ``plotly.graph_objects.Figure``."""
+        self._resolve_lazy_traces()
         return self._fig
 
 
+# Time the public Axes / QFigure API under qplotly.profile()
+for _cls in (Axes, _TwinAxes, QFigure):
+    for _name, _attr in list(vars(_cls).items()):
+        # coroutines are covered by the sync methods they run
+        if (not _name.startswith("_") and not _name.endswith("_async")
+                and callable(_attr)):
+            _label = "Axes" if issubclass(_cls, Axes) else _cls.__name__
+            setattr(_cls, _name, _profile.timed(f"{_label}.{_name}")(_attr))
+del _cls, _name, _attr, _label
+
+
 # ===========================================================================
 #  Module-level convenience functions (matplotlib.pyplot style)
 # ===========================================================================
@@ -1458,6 +2782,78 @@ def figure(figsize=None, **kwargs) -> QFigure:
     return QFigure(figsize=figsize, **kwargs)
 
 
+def profile(chrome_trace=None) -> _profile.Profile:
+    """Time qplotly's internal stages for the code in a ``with`` block.
+
+    >>> with qplotly.profile() as p:
+    ...     fig, ax = qplotly.subplots(2, 2)
+    ...     ax[0][0].plot(x, y)
+    ...     fig.savefig('out.html')
+    >>> print(p.table())          # or p.report() for a dict
+
+    Public ``Axes``/``QFigure`` methods, input conversion, ``add_trace``/
+    ``update_layout`` calls, finalize steps and serialization are recorded
+    per figure, with call counts and self time.  If *chrome_trace* is a
+    path, the events are written there as Chrome trace-event JSON on exit.
+    Outside a ``profile`` block the instrumentation costs one global check.
+    """
+    return _profile.Profile(chrome_trace)
+
+
+def set_render_cache(directory=None, max_bytes=512 << 20, hardlink=False):
+    """Enable (or with no *directory*, disable) the savefig render cache.
+
+    *directory* may also be a ready :class:`RenderCache`.  Identical
+    figures saved with the same format and options are then rendered once
+    and copied from the cache afterwards.  Returns the active cache.
+
+    >>> cache = qplotly.set_render_cache('/var/cache/qplotly', max_bytes=2**30)
+    >>> cache.stats()['hit_rate']
+    """
+    if directory is None or isinstance(directory, _cache.RenderCache):
+        cache = directory
+    else:
+        cache = _cache.RenderCache(directory, max_bytes, hardlink)
+    _cache.set_default(cache)
+    return cache
+
+
+def skeleton_cache_info():
+    """Hit/miss counters of the subplot layout cache.
+
+    Figures created with the same ``nrows``, ``ncols``, ``sharex``,
+    ``sharey``, ``figsize``, subplot title positions and ``make_subplots``
+    arguments start from a copy of a cached layout instead of re-running
+    ``make_subplots`` and the default styling.  Returns a dict with
+    ``hits``, ``misses``, ``hit_rate``, ``size`` and ``maxsize``.
+    """
+    return _skeleton.info()
+
+
+def style_cache_info():
+    """Hit/miss counters of the format-string and line-style caches.
+
+    ``plot``, ``errorbar`` and ``scatter`` resolve a format string and
+    style keywords (see :data:`rcParams`) through LRU caches, so repeated
+    styles skip parsing and style construction.  Returns
+    ``{'parse_fmt': {...}, 'line_style': {...}}`` with each cache's
+    ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+    """
+    return _rc.cache_info()
+
+
+def npy(path, index=None) -> _lazy.LazyArray:
+    """Reference a 1-D ``.npy`` file as a lazy trace source.
+
+    Only the header is read now; :meth:`Axes.plot` defers reading the data
+    (optionally restricted by *index*, e.g. a ``slice``) until the figure is
+    shown or saved, then streams it in chunks through min/max decimation.
+
+    >>> ax.plot(qplotly.npy('rec.npy', slice(0, 10**9)))
+    """
+    return _lazy.LazyArray(path, index)
+
+
 def subplots(nrows=1, ncols=1, figsize=None, subplot_titles=None,
              sharex=False, sharey=False, **kwargs):
     """Create a figure with a grid of subplots.
@@ -1489,6 +2885,47 @@ _NAMED_COLORS = {
 }
 
 
+def _trace_origin():
+    """``'method() at file:line'`` for the outermost qplotly call on the
+    stack and the user code that made it."""
+    package = os.path.dirname(__file__)
+    frame = sys._getframe(1)
+    method = None
+    while frame is not None:
+        code = frame.f_code
+        if not code.co_filename.startswith(package):
+            break
+        if not code.co_name.startswith("_") and code.co_name != "wrapper":
+            method = code.co_name
+        frame = frame.f_back
+    if frame is None:
+        return f"{method}()" if method else None
+    location = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+    return f"{method}() at {location}" if method else location
+
+
+def _split_err(err, n):
+    """Normalize an errorbar spec to ``(lower, upper)`` length-*n* arrays.
+
+    Symmetric errors return the same array twice.
+    """
+    err = np.asarray(err, dtype=float)
+    if err.ndim == 0:
+        err = np.full(n, float(err))
+    if err.ndim == 2:
+        return err[0], err[1]
+    return err, err
+
+
+def _interleave(a, b):
+    """``[a0, b0, nan, a1, b1, nan, ...]`` - segment endpoints in the form
+    one line trace draws as separate segments."""
+    out = np.full(3 * len(a), np.nan)
+    out[0::3] = a
+    out[1::3] = b
+    return out
+
+
 def _rgba(color: str, alpha: float) -> str:
     """Convert a colour string (hex or named) to an rgba() string."""
     if color.startswith("#") and len(color) == 7:
@@ -1508,15 +2945,36 @@ def _rgba(color: str, alpha: float) -> str:
 #  Quick-access module-level plotting (stateful, pyplot-style)
 # ===========================================================================
 
-_current_figure: QFigure | None = None
+# Per thread and per asyncio task, so concurrent callers never share a figure
+_current_figure = contextvars.ContextVar("qplotly_current_figure",
+                                         default=None)
 
 
 def gcf() -> QFigure:
     """Get the current figure (create one if needed)."""
-    global _current_figure
-    if _current_figure is None:
-        _current_figure = figure()
-    return _current_figure
+    fig = _current_figure.get()
+    if fig is None:
+        fig = figure()
+        _current_figure.set(fig)
+    return fig
+
+
+@contextlib.contextmanager
+def figure_context(fig=None, **kwargs):
+    """Make *fig* (or a new ``figure(**kwargs)``) the current figure for
+    the duration of a ``with`` block, then restore the previous one.
+
+    >>> with qplotly.figure_context() as fig:
+    ...     qplotly.plot(x, y)
+    ...     qplotly.savefig('out.html')
+    """
+    if fig is None:
+        fig = figure(**kwargs)
+    token = _current_figure.set(fig)
+    try:
+        yield fig
+    finally:
+        _current_figure.reset(token)
 
 
 def gca() -> Axes:
@@ -1568,10 +3026,17 @@ def grid(*args, **kwargs):
     return gcf().grid(*args, **kwargs)
 
 
+def cla():
+    return gca().cla()
+
+
+def clf(keep_layout=True):
+    return gcf().clf(keep_layout=keep_layout)
+
+
 def show(**kwargs):
     gcf().show(**kwargs)
-    global _current_figure
-    _current_figure = None  # reset after show, like plt.show()
+    _current_figure.set(None)  # reset after show, like plt.show()
 
 
 def savefig(*args, **kwargs):
@@ -1579,5 +3044,13 @@ def savefig(*args, **kwargs):
 
 
 def close():
-    global _current_figure
-    _current_figure = None
+    _current_figure.set(None)
+
+
+def __getattr__(name):
+    # PEP 562: names that used to be imported eagerly at module level
+    if name == "make_subplots":
+        return _subplots.make_subplots
+    if name == "RenderCache":
+        return _cache.RenderCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
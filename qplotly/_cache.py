@@ -0,0 +1,224 @@
+"""
+Content-addressed on-disk cache for :meth:`qplotly.QFigure.savefig`.
+
+The key is a hash of the finalized figure (array buffers are hashed
+directly, never via JSON), the output format, size, scale and writer
+options, and the plotly/kaleido versions.  Entries live in
+``<directory>/<key[:2]>/<key><ext>``.
+
+Writers render into ``<directory>/tmp`` and publish with ``os.replace``,
+which is atomic, so concurrent processes producing the same entry can only
+ever replace it with identical bytes, and readers never see a partial file.
+A hit refreshes the entry's mtime; when the directory grows past
+*max_bytes*, the least recently used entries are deleted.  A reader that
+loses a race with eviction simply treats the lookup as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+
+import numpy as np
+
+_default = None
+
+
+def default():
+    """The cache set with :func:`qplotly.set_render_cache`, or None."""
+    return _default
+
+
+def set_default(cache):
+    global _default
+    _default = cache
+
+
+def _update(h, obj):
+    """Feed a canonical encoding of a ``to_plotly_json()`` value to *h*."""
+    if isinstance(obj, dict):
+        h.update(b"{")
+        for key in sorted(obj):
+            _update(h, key)
+            _update(h, obj[key])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for value in obj:
+            _update(h, value)
+        h.update(b"]")
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "O":
+            _update(h, obj.tolist())
+        else:
+            h.update(f"<{obj.dtype.str}{obj.shape}>".encode())
+            h.update(np.ascontiguousarray(obj).reshape(-1).view(np.uint8))
+    else:
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+
+
+def _versions():
+    import plotly
+    try:
+        from importlib.metadata import version
+        kaleido = version("kaleido")
+    except Exception:  # not installed, or no metadata
+        kaleido = None
+    return plotly.__version__, kaleido
+
+
+class RenderCache:
+    """Size-bounded LRU directory of rendered figures.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike
+        Cache location (created if missing); may be shared by processes
+    max_bytes : int, default 512 MiB
+        Total size above which least recently used entries are evicted
+    hardlink : bool, default False
+        Hard-link hits into place instead of copying them.  Faster, but the
+        output then shares its inode with the cache entry, so it must not
+        be modified in place.
+    """
+
+    def __init__(self, directory, max_bytes=512 << 20, hardlink=False):
+        self.directory = os.fspath(directory)
+        self.max_bytes = int(max_bytes)
+        self.hardlink = hardlink
+        os.makedirs(os.path.join(self.directory, "tmp"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._versions = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def __repr__(self):
+        return f"RenderCache({self.directory!r}, max_bytes={self.max_bytes})"
+
+    # ---- keys ---------------------------------------------------------------
+
+    def key(self, traces, layout, ext, **options):
+        """Hex digest for the given figure parts, extension and options."""
+        if self._versions is None:
+            self._versions = _versions()
+        h = hashlib.blake2b(digest_size=20)
+        _update(h, [ext, self._versions, options])
+        _update(h, layout)
+        for trace in traces:
+            _update(h, trace)
+        return h.hexdigest()
+
+    def _path(self, key, ext):
+        return os.path.join(self.directory, key[:2], key + ext)
+
+    # ---- lookup / store -----------------------------------------------------
+
+    def fetch(self, key, ext, filename):
+        """Place a cached render at *filename*; False on a miss."""
+        start = time.perf_counter()
+        entry = self._path(key, ext)
+        try:
+            os.utime(entry)  # LRU: mark as recently used
+            self._place(entry, filename)
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            self.hits += 1
+            self.hit_seconds += time.perf_counter() - start
+        return True
+
+    def store(self, key, ext, filename, render):
+        """Call ``render(path)`` and publish the result under *key* and at
+        *filename*."""
+        start = time.perf_counter()
+        tmp = os.path.join(self.directory, "tmp", f"{uuid.uuid4().hex}{ext}")
+        try:
+            render(tmp)
+            entry = self._path(key, ext)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            os.replace(tmp, entry)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        try:
+            self._place(entry, filename)
+        except FileNotFoundError:  # evicted by another process meanwhile
+            render(filename)
+        with self._lock:
+            self.misses += 1
+            self.miss_seconds += time.perf_counter() - start
+        self.evict()
+
+    def _place(self, entry, filename):
+        if self.hardlink:
+            tmp = f"{filename}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                os.link(entry, tmp)
+            except OSError as exc:
+                if isinstance(exc, FileNotFoundError):
+                    raise
+                shutil.copyfile(entry, tmp)  # other filesystem, no links
+            os.replace(tmp, filename)
+        else:
+            shutil.copyfile(entry, filename)
+
+    # ---- eviction / metrics -------------------------------------------------
+
+    def _entries(self):
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir() or sub.name == "tmp":
+                continue
+            for entry in os.scandir(sub.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield entry.path, stat.st_size, stat.st_mtime
+
+    def evict(self):
+        """Delete least recently used entries until under *max_bytes*."""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        """Hit/miss counters for this process plus the current disk usage."""
+        entries = list(self._entries())
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "hit_seconds": self.hit_seconds,
+            "miss_seconds": self.miss_seconds,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
@@ -0,0 +1,187 @@
+"""
+Input adapters: pandas, polars, pyarrow and xarray objects -> NumPy.
+
+None of these libraries is imported here; objects are recognised by the
+module that defines their type, so each adapter only runs when the caller
+already has that library loaded.  Buffers are taken without copying where
+the dtype allows (numeric and datetime columns without nulls).
+"""
+
+from __future__ import annotations
+
+import datetime
+
+import numpy as np
+
+from . import _profile
+
+
+def _library(obj):
+    return type(obj).__module__.partition(".")[0]
+
+
+@_profile.timed("to_numpy", method=False)
+def to_numpy(obj):
+    """Convert a plotting input to a NumPy array, zero-copy where possible.
+
+    Categoricals (pandas ``category``, Arrow dictionary arrays, polars
+    ``Categorical``) are decoded to an object array of labels; missing values
+    become ``None``.  Timezone-aware timestamps become naive wall-clock
+    ``datetime64``.  Anything else goes through ``np.asarray``, except that
+    a list mixing strings and numbers becomes an object array, keeping each
+    element as given.
+    """
+    if obj is None or isinstance(obj, np.ndarray):
+        return obj
+    library = _library(obj)
+    if library == "pandas":
+        return _pandas_to_numpy(obj)
+    if library == "pyarrow":
+        return _arrow_to_numpy(obj)
+    if library == "polars":
+        if hasattr(obj, "columns"):  # DataFrame
+            return obj.to_numpy()
+        return _arrow_to_numpy(obj.to_arrow())
+    if library == "xarray":
+        return np.asarray(obj.values)
+    values = np.asarray(obj)
+    if values.dtype.kind in "US" and isinstance(obj, (list, tuple)):
+        # np.asarray would turn ['a', 1, 2.5] into ['a', '1', '2.5']
+        mixed = np.asarray(obj, dtype=object)
+        if not all(isinstance(v, (str, bytes)) for v in mixed.flat):
+            return mixed
+    return values
+
+
+def _pandas_to_numpy(obj):
+    if obj.ndim == 2:  # DataFrame
+        return obj.to_numpy()
+    dtype = obj.dtype
+    if getattr(dtype, "name", None) == "category":
+        cat = obj.array
+        return _decode(np.asarray(cat.categories), np.asarray(cat.codes))
+    if getattr(dtype, "tz", None) is not None:
+        return np.asarray(obj.array.tz_localize(None))
+    if not isinstance(dtype, np.dtype) and dtype.kind in "iufb":
+        # nullable extension dtypes (Int64, Float64, boolean)
+        return obj.to_numpy(dtype=float, na_value=np.nan)
+    return obj.to_numpy()
+
+
+def _arrow_to_numpy(arr):
+    import pyarrow as pa
+
+    if isinstance(arr, pa.ChunkedArray):
+        if arr.num_chunks != 1 and pa.types.is_dictionary(arr.type):
+            arr = arr.unify_dictionaries()
+        arr = arr.chunk(0) if arr.num_chunks == 1 else arr.combine_chunks()
+    if pa.types.is_dictionary(arr.type):
+        indices = arr.indices
+        codes = indices.fill_null(0).to_numpy(zero_copy_only=False)
+        labels = _decode(_arrow_to_numpy(arr.dictionary), codes)
+        if indices.null_count:
+            labels[indices.is_null().to_numpy(zero_copy_only=False)] = None
+        return labels
+    if pa.types.is_timestamp(arr.type) and arr.type.tz is not None:
+        import pyarrow.compute as pc
+        arr = pc.local_timestamp(arr)
+    return arr.to_numpy(zero_copy_only=False)
+
+
+def _decode(categories, codes):
+    """Labels for integer *codes* into *categories* (negative means missing)."""
+    labels = np.asarray(categories, dtype=object)[codes]
+    if codes.dtype.kind == "i":
+        labels[codes < 0] = None
+    return labels
+
+
+def category_order(obj):
+    """The category labels of a categorical input, in dictionary order.
+
+    Returns None for anything that is not categorical.
+    """
+    library = _library(obj)
+    if library == "pandas" and getattr(obj.dtype, "name", None) == "category":
+        return list(obj.array.categories)
+    if library == "polars" and str(obj.dtype).startswith(("Categorical", "Enum")):
+        obj, library = obj.to_arrow(), "pyarrow"
+    if library == "pyarrow":
+        import pyarrow as pa
+        if pa.types.is_dictionary(obj.type):
+            if isinstance(obj, pa.ChunkedArray):
+                if not obj.num_chunks:
+                    return []
+                obj = obj.unify_dictionaries().chunk(0)
+            return obj.dictionary.to_pylist()
+    return None
+
+
+def epoch_ms(values):
+    """Milliseconds since the Unix epoch (float64, NaT -> NaN) for datetime
+    input, or None for anything else.
+
+    Takes ``datetime64`` arrays of any unit and object arrays of
+    ``datetime``/``date`` objects; timezone-aware objects keep their
+    wall-clock time, as :func:`to_numpy` does.  float64 milliseconds are
+    exact to the microsecond within about 285 years of 1970.
+    """
+    if not isinstance(values, np.ndarray):
+        return None
+    if values.dtype.kind == "O":
+        first = next((v for v in values.flat if v is not None), None)
+        if not isinstance(first, datetime.date):
+            return None
+        values = np.array([v.replace(tzinfo=None) if getattr(v, "tzinfo", None)
+                           else v for v in values.flat],
+                          dtype="datetime64[us]").reshape(values.shape)
+    if values.dtype.kind != "M":
+        return None
+    unit, count = np.datetime_data(values.dtype)
+    per_ms = np.timedelta64(1, "ms") / np.timedelta64(count, unit)
+    ms = values.view(np.int64) / per_ms
+    ms[np.isnat(values)] = np.nan
+    return ms
+
+
+def index_of(obj):
+    """Default x values for ``plot(y)``: a Series index, the first xarray
+    coordinate, or ``0..n-1``."""
+    library = _library(obj)
+    if library == "pandas" and obj.ndim == 1:
+        return to_numpy(obj.index)
+    if library == "xarray":
+        return coords(obj)[0]
+    return np.arange(len(obj))
+
+
+def coords(obj):
+    """Coordinate arrays for each dimension of an xarray ``DataArray``
+    (``0..n-1`` for dimensions without a coordinate)."""
+    return [np.asarray(obj.coords[dim].values) if dim in obj.coords
+            else np.arange(size) for dim, size in zip(obj.dims, obj.shape)]
+
+
+def is_labeled(obj):
+    """True for inputs that carry their own axis labels (pandas 2-D frames,
+    xarray arrays)."""
+    library = _library(obj)
+    return (library == "xarray" and hasattr(obj, "dims")) or \
+        (library == "pandas" and getattr(obj, "ndim", 0) == 2)
+
+
+def labels_2d(obj):
+    """``(x, y)`` tick labels for a 2-D DataFrame or DataArray."""
+    if _library(obj) == "pandas":
+        return to_numpy(obj.columns), to_numpy(obj.index)
+    y, x = coords(obj)
+    return x, y
+
+
+def lookup(data, key):
+    """Resolve *key* as a column of *data* (DataFrame, Arrow/polars table,
+    xarray Dataset or mapping); other values are returned unchanged."""
+    if data is None or not isinstance(key, str):
+        return key
+    names = getattr(data, "column_names", data)  # pyarrow.Table
+    return data[key] if key in names else key
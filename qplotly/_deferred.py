@@ -0,0 +1,54 @@
+"""
+Deferred imports for the heavy dependencies of :mod:`qplotly`.
+
+``plotly.graph_objects`` and NumPy account for nearly all of the time taken
+by ``import qplotly``.  A :class:`DeferredModule` stands in for a module
+name in a namespace and imports the real module on first attribute access,
+then rebinds the name so later lookups go straight to the module.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+
+# Serializes first loads, so one thread never sees a module another thread
+# is still initializing
+_lock = threading.RLock()
+
+
+class DeferredModule:
+    """Placeholder for module *name*, bound as *alias* in *namespace*.
+
+    Modules in *requires* are imported first.
+    """
+
+    def __init__(self, name, namespace, alias, requires=()):
+        self._name = name
+        self._namespace = namespace
+        self._alias = alias
+        self._requires = requires
+
+    def _load(self):
+        with _lock:
+            for name in self._requires:
+                importlib.import_module(name)
+            module = importlib.import_module(self._name)
+            if self._namespace.get(self._alias) is self:
+                self._namespace[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return f"<deferred module {self._name!r}>"
+
+
+def defer(namespace, requires=(), **modules):
+    """Bind ``alias=module_name`` pairs in *namespace* as deferred modules."""
+    for alias, name in modules.items():
+        namespace[alias] = DeferredModule(name, namespace, alias, requires)
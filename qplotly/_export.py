@@ -0,0 +1,75 @@
+"""
+Off-loop execution for the ``*_async`` export methods of :class:`QFigure`.
+
+Exports run on a small shared thread pool, so however many coroutines are
+waiting, at most ``EXPORT_WORKERS`` serializations/renders run at once and
+the event loop itself never blocks on them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent exports on the shared pool
+EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def executor():
+    """The shared export pool (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(EXPORT_WORKERS,
+                                           thread_name_prefix="qplotly-export")
+        return _executor
+
+
+async def run(job, timeout=None, pool=None):
+    """Run ``job()`` on *pool* (default: the shared pool) and await it.
+
+    On timeout or cancellation a job that has not started is dropped; one
+    already running finishes in the background and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(pool or executor(), job)
+    return await asyncio.wait_for(future, timeout)
+
+
+class AtomicOutput:
+    """Write to a temporary sibling of *filename*, then move it into place
+    with :meth:`commit` unless :meth:`cancel` was called first."""
+
+    def __init__(self, filename):
+        filename = os.fspath(filename)
+        directory, name = os.path.split(os.path.abspath(filename))
+        # keep the extension: it selects the output format
+        self.path = os.path.join(
+            directory, f".{name}.{uuid.uuid4().hex[:8]}{os.path.splitext(name)[1]}")
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    def commit(self):
+        with self._lock:
+            if self._cancelled:
+                self.discard()
+                return False
+            os.replace(self.path, self.filename)
+            return True
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+
+    def discard(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
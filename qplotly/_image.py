@@ -0,0 +1,168 @@
+"""
+Raster image helpers: colour lookup tables and compressed data-URI encoding.
+
+Used by :meth:`qplotly.Axes.imshow` so that large images travel to the
+browser as a single PNG/WebP string instead of one JSON number per pixel.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import struct
+import warnings
+import zlib
+
+import numpy as np
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}  # channels -> PNG colour type
+
+
+def colorscale_lut(cmap, n=256):
+    """Sample a Plotly colorscale (name or ``[[pos, color], ...]``) into an
+    ``(n, 3)`` uint8 lookup table."""
+    import plotly.colors as pc
+
+    scale = pc.get_colorscale(cmap) if isinstance(cmap, str) else cmap
+    rgb = pc.sample_colorscale(scale, np.linspace(0.0, 1.0, n),
+                               colortype="tuple")
+    # sample_colorscale returns 0-1 floats for hex scales, 0-255 for rgb()
+    rgb = np.asarray(rgb, dtype=float)
+    if rgb.max() <= 1.0:
+        rgb = rgb * 255.0
+    return np.clip(np.rint(rgb), 0, 255).astype(np.uint8)
+
+
+def apply_lut(z, lut, vmin, vmax):
+    """Colour-map a 2-D scalar array through *lut*.
+
+    Returns an ``(M, N, 3)`` uint8 array, or ``(M, N, 4)`` with non-finite
+    pixels fully transparent when *z* contains NaN/inf.
+    """
+    z = np.asarray(z, dtype=float)
+    span = float(vmax) - float(vmin)
+    scale = (len(lut) - 1) / span if span > 0 else 0.0
+    finite = np.isfinite(z)
+    idx = np.where(finite, (z - vmin) * scale, 0.0)
+    np.clip(idx, 0, len(lut) - 1, out=idx)
+    rgb = lut[idx.astype(np.intp)]
+    if finite.all():
+        return rgb
+    alpha = np.where(finite, 255, 0).astype(np.uint8)
+    return np.concatenate([rgb, alpha[..., None]], axis=-1)
+
+
+def to_uint8(img):
+    """Convert an RGB(A) array to uint8 (floats are taken to be in [0, 1])."""
+    img = np.asarray(img)
+    if img.dtype == np.uint8:
+        return img
+    if np.issubdtype(img.dtype, np.floating):
+        img = np.nan_to_num(img, nan=0.0) * 255.0
+        return np.clip(np.rint(img), 0, 255).astype(np.uint8)
+    return np.clip(img, 0, 255).astype(np.uint8)
+
+
+def encode_png(img, level=6):
+    """Encode an ``(M, N)``, ``(M, N, 3)`` or ``(M, N, 4)`` uint8 array as PNG.
+
+    Pure NumPy + zlib; every row uses the PNG "Up" filter, computed for the
+    whole image in one vectorized subtraction.
+    """
+    img = np.ascontiguousarray(img, dtype=np.uint8)
+    height, width = img.shape[:2]
+    channels = 1 if img.ndim == 2 else img.shape[2]
+    rows = img.reshape(height, width * channels)
+
+    filtered = np.empty((height, width * channels + 1), dtype=np.uint8)
+    filtered[:, 0] = 2  # "Up" filter
+    filtered[0, 1:] = rows[0]
+    np.subtract(rows[1:], rows[:-1], out=filtered[1:, 1:])
+
+    def chunk(tag, payload):
+        return (struct.pack(">I", len(payload)) + tag + payload
+                + struct.pack(">I", zlib.crc32(tag + payload) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", width, height, 8,
+                         _PNG_COLOR_TYPES[channels], 0, 0, 0)
+    return b"".join([
+        _PNG_SIGNATURE,
+        chunk(b"IHDR", header),
+        chunk(b"IDAT", zlib.compress(filtered.tobytes(), level)),
+        chunk(b"IEND", b""),
+    ])
+
+
+def encode_webp(img, quality=90):
+    """Encode a uint8 RGB(A) array as lossy WebP (requires Pillow)."""
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.fromarray(np.ascontiguousarray(img)).save(
+        buf, format="WEBP", quality=int(quality))
+    return buf.getvalue()
+
+
+def to_data_uri(img, compression="lossless", quality=90):
+    """Encode a uint8 image as a ``data:image/...;base64`` URI.
+
+    *compression* is ``'lossless'`` (PNG) or ``'lossy'`` (WebP at
+    *quality*).  Lossy encoding falls back to PNG when Pillow is missing.
+    """
+    if compression not in ("lossless", "lossy"):
+        raise ValueError(
+            f"compression must be 'lossless' or 'lossy', got {compression!r}")
+    if compression == "lossy":
+        try:
+            payload = encode_webp(img, quality)
+            mime = "image/webp"
+        except ImportError:
+            warnings.warn("Lossy image compression requires Pillow; "
+                          "falling back to lossless PNG.")
+            compression = "lossless"
+    if compression == "lossless":
+        payload = encode_png(img)
+        mime = "image/png"
+    return f"data:{mime};base64," + base64.b64encode(payload).decode("ascii")
+
+
+def shade(grid, how="linear", vmin=None, vmax=None):
+    """Normalize *grid* to ``[0, 1]`` for colour mapping.
+
+    *how* is ``'linear'``, ``'log'`` (values <= 0 dropped) or ``'eq_hist'``
+    (histogram equalization over the finite cells).  Returns the normalized
+    grid (NaN where *grid* has no value) and a function mapping normalized
+    positions back to data values, for labelling a colorbar.
+    """
+    grid = np.asarray(grid, dtype=float)
+    finite = np.isfinite(grid)
+    if how == "log":
+        finite &= grid > 0
+    vals = grid[finite]
+    out = np.full(grid.shape, np.nan)
+    if not vals.size:
+        return out, lambda t: np.asarray(t, dtype=float)
+    lo = vals.min() if vmin is None else vmin
+    hi = vals.max() if vmax is None else vmax
+
+    if how == "linear":
+        span = (hi - lo) or 1.0
+        out[finite] = np.clip((vals - lo) / span, 0, 1)
+        return out, lambda t: lo + np.asarray(t) * span
+    if how == "log":
+        llo, lhi = np.log10(lo), np.log10(hi)
+        span = (lhi - llo) or 1.0
+        out[finite] = np.clip((np.log10(vals) - llo) / span, 0, 1)
+        return out, lambda t: 10 ** (llo + np.asarray(t) * span)
+    if how == "eq_hist":
+        uniq, inverse, counts = np.unique(vals, return_inverse=True,
+                                          return_counts=True)
+        cdf = np.cumsum(counts) / vals.size
+        if uniq.size > 1:
+            cdf = (cdf - cdf[0]) / (1 - cdf[0])
+        out[finite] = cdf[inverse]
+        return out, lambda t: uniq[np.clip(np.searchsorted(cdf, t), 0,
+                                           uniq.size - 1)]
+    raise ValueError(f"shade must be 'linear', 'log' or 'eq_hist', got {how!r}")
@@ -0,0 +1,80 @@
+"""
+Deferred array sources for out-of-memory inputs.
+
+A :class:`LazyArray` wraps a ``.npy`` path or an ``np.memmap``.  Plotting
+methods that understand it only record the reference; the data is read at
+finalize time in bounded chunks and reduced before it reaches the figure.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+
+# Elements read per chunk when streaming a lazy source
+CHUNK_SIZE = 1 << 22
+
+
+class LazyArray:
+    """A 1-D array read on demand from a ``.npy`` file or ``np.memmap``.
+
+    Only the header is read on construction (to learn the length).  Use
+    :func:`qplotly.npy` to create one from a path.
+    """
+
+    def __init__(self, source, index=None):
+        if isinstance(source, (str, os.PathLike)):
+            source = os.fspath(source)
+        self._source = source
+        self._index = index
+        view = self._open()
+        if view.ndim != 1:
+            raise ValueError(f"lazy sources must be 1-D, got shape {view.shape}")
+        self.shape = view.shape
+        self.dtype = view.dtype
+
+    def _open(self):
+        """A memory-mapped view of the (indexed) source; reads no data."""
+        if isinstance(self._source, str):
+            view = np.load(self._source, mmap_mode="r")
+        else:
+            view = self._source
+        return view if self._index is None else view[self._index]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        # Fallback for code paths without chunked support: read everything
+        return np.asarray(self._open(), dtype=dtype)
+
+    def __repr__(self):
+        source = self._source if isinstance(self._source, str) else "memmap"
+        return f"LazyArray({source!r}, len={len(self)}, dtype={self.dtype})"
+
+    def chunks(self, size=CHUNK_SIZE):
+        """Yield ``(start, values)`` pairs of at most *size* elements."""
+        yield from iter_chunks(self._open(), size)
+
+    def take(self, indices):
+        """Read only the elements at (sorted) *indices*."""
+        return np.asarray(self._open()[indices])
+
+
+def is_lazy(obj):
+    """True for inputs that should be read at finalize time."""
+    return isinstance(obj, (LazyArray, np.memmap))
+
+
+def as_lazy(obj):
+    """Wrap an ``np.memmap`` as a :class:`LazyArray` (others unchanged)."""
+    return LazyArray(obj) if isinstance(obj, np.memmap) else obj
+
+
+def iter_chunks(values, size=CHUNK_SIZE):
+    """Yield ``(start, chunk)`` slices of any sliceable 1-D array, each
+    materialized as an in-memory copy of at most *size* elements."""
+    for start in range(0, len(values), size):
+        yield start, np.array(values[start:start + size])
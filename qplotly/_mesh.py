@@ -0,0 +1,163 @@
+"""
+Quadrilateral-mesh helpers for :meth:`qplotly.Axes.pcolormesh`.
+
+Curvilinear meshes (2-D ``X``/``Y`` that are not a simple meshgrid) cannot be
+drawn by ``go.Heatmap``.  They are either resampled onto a regular pixel grid
+(large meshes) or emitted as NaN-separated filled polygons grouped by colour
+level (small meshes).  Everything here is vectorized NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+# Upper bound on the number of bilinear samples held in memory at once
+_RESAMPLE_CHUNK = 4_000_000
+# Largest per-cell supersampling factor (cells bigger than this many pixels
+# across are sampled at this density and may leave sub-pixel gaps)
+_MAX_SUBSAMPLE = 64
+
+
+def centers_to_edges(a):
+    """1-D cell centres -> ``len(a) + 1`` edges at the midpoints."""
+    a = np.asarray(a, dtype=float)
+    if a.size == 1:
+        return np.array([a[0] - 0.5, a[0] + 0.5])
+    mid = 0.5 * (a[:-1] + a[1:])
+    return np.concatenate([[2 * a[0] - mid[0]], mid, [2 * a[-1] - mid[-1]]])
+
+
+def centers_to_corners(a):
+    """2-D node-centred coordinates -> ``(M+1, N+1)`` cell corners.
+
+    Same midpoint extrapolation matplotlib uses for ``shading='nearest'``.
+    """
+    a = np.asarray(a, dtype=float)
+    for axis in (1, 0):
+        if a.shape[axis] == 1:
+            a = np.concatenate([a - 0.5, a + 0.5], axis=axis)
+            continue
+        lo = np.take(a, [0], axis=axis)
+        hi = np.take(a, [-1], axis=axis)
+        first = np.take(a, [1], axis=axis)
+        last = np.take(a, [-2], axis=axis)
+        mid = 0.5 * (np.take(a, np.arange(1, a.shape[axis]), axis=axis)
+                     + np.take(a, np.arange(a.shape[axis] - 1), axis=axis))
+        a = np.concatenate([1.5 * lo - 0.5 * first, mid,
+                            1.5 * hi - 0.5 * last], axis=axis)
+    return a
+
+
+def rectilinear_axes(X, Y):
+    """Return ``(x, y)`` 1-D axes if the 2-D mesh is a plain meshgrid, else None."""
+    if (X == X[:1, :]).all() and (Y == Y[:, :1]).all():
+        return X[0, :], Y[:, 0]
+    return None
+
+
+def _corners(A):
+    """The four corner arrays of every cell, in drawing order."""
+    return A[:-1, :-1], A[:-1, 1:], A[1:, 1:], A[1:, :-1]
+
+
+def resample(X, Y, Z, width, height, gouraud=False):
+    """Rasterize a curvilinear mesh onto a regular ``height x width`` grid.
+
+    *X*, *Y* are ``(M+1, N+1)`` node coordinates.  *Z* holds one value per
+    cell ``(M, N)``, or one per node ``(M+1, N+1)`` when *gouraud* is true,
+    in which case values are bilinearly interpolated inside each cell.
+
+    Each cell is sampled at ``k x k`` points in its own parameter space, with
+    ``k`` chosen per cell from its size in pixels so that no pixel it covers
+    is skipped; samples are averaged per pixel with ``np.bincount``.
+    Pixels no cell covers are NaN.
+
+    Returns ``(xc, yc, grid)`` - pixel-centre axes and the ``(height, width)``
+    grid of values.
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    Z = np.asarray(Z, dtype=float)
+    finite = np.isfinite(X) & np.isfinite(Y)
+    xmin, xmax = X[finite].min(), X[finite].max()
+    ymin, ymax = Y[finite].min(), Y[finite].max()
+    px = (xmax - xmin) / width or 1.0
+    py = (ymax - ymin) / height or 1.0
+
+    cx = np.stack(_corners(X))  # (4, M, N)
+    cy = np.stack(_corners(Y))
+    if gouraud:
+        cz = np.stack(_corners(Z))
+        valid = np.isfinite(cx).all(0) & np.isfinite(cy).all(0)
+    else:
+        valid = np.isfinite(cx).all(0) & np.isfinite(cy).all(0) & np.isfinite(Z)
+
+    # Per-cell supersampling factor, bucketed to powers of two
+    extent = np.maximum((cx.max(0) - cx.min(0)) / px,
+                        (cy.max(0) - cy.min(0)) / py)
+    k_cell = np.clip(np.ceil(2 * np.nan_to_num(extent)), 1, _MAX_SUBSAMPLE)
+    k_cell = 2 ** np.ceil(np.log2(k_cell)).astype(int)
+
+    sums = np.zeros(width * height)
+    counts = np.zeros(width * height)
+    for k in np.unique(k_cell[valid]):
+        ci, cj = np.nonzero(valid & (k_cell == k))
+        t = (np.arange(k) + 0.5) / k
+        u, v = (g.ravel() for g in np.meshgrid(t, t))
+        # bilinear weights for corners 00, 01, 11, 10
+        w = np.stack([(1 - u) * (1 - v), u * (1 - v), u * v, (1 - u) * v])
+        step = max(_RESAMPLE_CHUNK // (k * k), 1)
+        for start in range(0, ci.size, step):
+            i = ci[start:start + step]
+            j = cj[start:start + step]
+            xs = np.einsum("cn,cs->ns", cx[:, i, j], w)
+            ys = np.einsum("cn,cs->ns", cy[:, i, j], w)
+            if gouraud:
+                vals = np.einsum("cn,cs->ns", cz[:, i, j], w)
+            else:
+                vals = np.broadcast_to(Z[i, j][:, None], xs.shape)
+            ix = np.clip(((xs - xmin) / px).astype(np.intp), 0, width - 1)
+            iy = np.clip(((ys - ymin) / py).astype(np.intp), 0, height - 1)
+            lin = (iy * width + ix).ravel()
+            vals = vals.ravel()
+            keep = np.isfinite(vals)
+            sums += np.bincount(lin[keep], weights=vals[keep],
+                                minlength=width * height)
+            counts += np.bincount(lin[keep], minlength=width * height)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = (sums / counts).reshape(height, width)
+    xc = xmin + (np.arange(width) + 0.5) * px
+    yc = ymin + (np.arange(height) + 0.5) * py
+    return xc, yc, grid
+
+
+def polygons(X, Y, Z, vmin, vmax, levels):
+    """Group mesh cells into *levels* colour bins as NaN-separated polygons.
+
+    Yields ``(level, xs, ys)`` for every non-empty bin, where ``xs``/``ys``
+    trace each cell's closed outline followed by a NaN break.
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    Z = np.asarray(Z, dtype=float)
+    c00, c01, c11, c10 = _corners(X)
+    xs = np.stack([c00, c01, c11, c10, c00, np.full_like(c00, np.nan)], -1)
+    c00, c01, c11, c10 = _corners(Y)
+    ys = np.stack([c00, c01, c11, c10, c00, np.full_like(c00, np.nan)], -1)
+    xs = xs.reshape(-1, 6)
+    ys = ys.reshape(-1, 6)
+    z = Z.ravel()
+
+    span = float(vmax) - float(vmin)
+    finite = np.isfinite(z)
+    level = np.full(z.shape, -1)
+    if span > 0:
+        level[finite] = np.clip(((z[finite] - vmin) / span * levels)
+                                .astype(int), 0, levels - 1)
+    else:
+        level[finite] = 0
+    for lev in np.unique(level[level >= 0]):
+        sel = level == lev
+        yield lev, xs[sel].ravel(), ys[sel].ravel()
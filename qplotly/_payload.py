@@ -0,0 +1,227 @@
+"""
+Serialized-size estimates for :meth:`qplotly.QFigure.payload_report`.
+
+Nothing is serialized to JSON: typed-array sizes follow plotly's base64
+encoding (and its int64 downcasting) exactly, and plain-JSON sizes of long
+arrays are extrapolated from an evenly spaced sample.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+
+import numpy as np
+
+# Elements formatted per array when extrapolating plain-JSON sizes
+SAMPLE = 2048
+# Bytes base64-encoded at a time when sizing typed arrays (multiple of 3)
+_B64_CHUNK = 3 << 20
+
+# dtype -> plotly.js typed-array code (bool and 64-bit ints are not encoded)
+_TYPED = {"int8": "i1", "uint8": "u1", "int16": "i2", "uint16": "u2",
+          "int32": "i4", "uint32": "u4", "float32": "f4", "float64": "f8"}
+_DOWNCASTS = {"int64": ("int8", "int16", "int32"),
+              "uint64": ("uint8", "uint16", "uint32")}
+
+
+def typed_encodes_arrays():
+    """plotly >= 6 sends NumPy arrays as base64 typed arrays."""
+    import plotly
+    return int(plotly.__version__.split(".")[0]) >= 6
+
+
+def _default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def dumps_size(obj):
+    """Length of *obj* as compact JSON."""
+    return len(json.dumps(obj, default=_default, separators=(",", ":")))
+
+
+def _typed_dtype(arr):
+    """dtype name plotly would encode *arr* with, or None."""
+    name = arr.dtype.name
+    if name in _DOWNCASTS and arr.size:
+        lo, hi = arr.min(), arr.max()
+        for candidate in _DOWNCASTS[name]:
+            info = np.iinfo(candidate)
+            if info.min <= lo and hi <= info.max:
+                return candidate
+        return None
+    return name if name in _TYPED else None
+
+
+def _typed_size(arr, dtype):
+    """Length of ``{"dtype":..,"bdata":..[,"shape":..]}`` for *arr*.
+
+    The base64 text is generated chunk by chunk only to count the "/"
+    characters, which plotly escapes as ``\\u002f``.
+    """
+    data = memoryview(np.ascontiguousarray(arr, dtype=dtype)).cast("B")
+    slashes = 0
+    for start in range(0, len(data), _B64_CHUNK):
+        slashes += base64.b64encode(data[start:start + _B64_CHUNK]).count(b"/")
+    size = (len('{"dtype":"f8","bdata":""}') + 4 * math.ceil(len(data) / 3)
+            + 5 * slashes)
+    if arr.ndim > 1:
+        size += len(',"shape":""') + len(str(arr.shape)[1:-1])
+    return size
+
+
+def _plain_size(arr):
+    """Estimated length of *arr* as nested JSON lists."""
+    if not arr.size:
+        return 2 * max(math.prod(arr.shape[:-1]), 1)
+    flat = arr.ravel()
+    if flat.size > SAMPLE:
+        flat = flat[np.linspace(0, flat.size - 1, SAMPLE).astype(np.intp)]
+    if flat.dtype.kind == "M":
+        values = [str(v) for v in np.datetime_as_string(flat)]
+    else:
+        values = flat.tolist()
+        if flat.dtype.kind == "f":
+            values = [None if v != v else v for v in values]  # NaN -> null
+    per_item = (dumps_size(values) - 2 + 1) / len(values)  # item + comma
+    brackets = 2 * (math.prod(arr.shape[:-1]) + (arr.ndim > 1))
+    return round(per_item * arr.size) - 1 + brackets
+
+
+def array_sizes(values, typed_arrays=True):
+    """``(bytes, json_bytes, typed_bytes)`` for an array-like field value.
+
+    *json_bytes* is the plain-JSON size, *typed_bytes* the size if numeric
+    data is sent as a typed array, and *bytes* what plotly emits today (typed
+    only for NumPy arrays, and only when *typed_arrays*).
+    """
+    is_ndarray = isinstance(values, np.ndarray)
+    arr = values if is_ndarray else np.asarray(values)
+    if arr.dtype.kind in "OUS" or (not is_ndarray and arr.dtype.kind not in "iufb"):
+        plain = dumps_size(values)
+        return plain, plain, plain
+    plain = _plain_size(arr)
+    dtype = _typed_dtype(arr)
+    typed = _typed_size(arr, dtype) if dtype else plain
+    actual = typed if is_ndarray and typed_arrays and dtype else plain
+    return actual, plain, typed
+
+
+def field_sizes(obj, typed_arrays=True, prefix=""):
+    """``{dotted.path: [bytes, json_bytes, typed_bytes]}`` for every leaf
+    of a ``to_plotly_json()`` dict, each including its ``"key":`` and
+    separator overhead."""
+    out = {}
+    for key, value in obj.items():
+        path = f"{prefix}{key}"
+        overhead = len(key) + 4  # quotes, colon, comma
+        if isinstance(value, dict):
+            out.update(field_sizes(value, typed_arrays, path + "."))
+            # the key and braces of the nested object itself
+            out[path] = [overhead + 2] * 3
+            continue
+        if isinstance(value, np.ndarray) or (
+                isinstance(value, (list, tuple)) and value
+                and not isinstance(value[0], (dict, list, tuple))):
+            sizes = array_sizes(value, typed_arrays)
+        else:
+            size = dumps_size(value)
+            sizes = (size, size, size)
+        out[path] = [s + overhead for s in sizes]
+    return out
+
+
+def _sizes(rows):
+    """Sum ``[bytes, json_bytes, typed_bytes]`` rows into a dict."""
+    acc = [0, 0, 0]
+    for row in rows:
+        for i in range(3):
+            acc[i] += row[i]
+    return dict(zip(("bytes", "json_bytes", "typed_bytes"), acc))
+
+
+class PayloadReport(dict):
+    """Result of :meth:`qplotly.QFigure.payload_report` - a dict with keys
+    ``total``, ``layout``, ``traces``, ``subplots``, ``fields`` and
+    ``offenders`` - plus :meth:`table` for reading it."""
+
+    def table(self):
+        """The report as fixed-width text."""
+        def row(label, s):
+            return (f"{label:<44}{s['bytes'] / 1024:>11.1f}"
+                    f"{s['json_bytes'] / 1024:>11.1f}"
+                    f"{s['typed_bytes'] / 1024:>11.1f}")
+
+        lines = [f"{'':<44}{'KiB':>11}{'json KiB':>11}{'typed KiB':>11}",
+                 row("total", self["total"]),
+                 row("layout", self["layout"])]
+        for key, s in self["layout"]["fields"].items():
+            lines.append(row(f"  layout.{key}", s))
+        lines.append("subplots")
+        for key, s in self["subplots"].items():
+            lines.append(row(f"  {key}", s))
+        lines.append("fields")
+        for key, s in self["fields"].items():
+            lines.append(row(f"  {key}", s))
+        lines.append("largest traces")
+        for t in self["offenders"]:
+            label = f"  #{t['index']} {t['type']} {t['name'] or ''}".rstrip()
+            lines.append(row(label, t))
+            if t["origin"]:
+                lines.append(f"      from {t['origin']}")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table()
+
+
+def _ranked(sizes):
+    return dict(sorted(sizes.items(), key=lambda kv: -kv[1]["bytes"]))
+
+
+def build_report(traces, layout, origins, typed_arrays=True, top=10):
+    """Assemble a :class:`PayloadReport`.
+
+    *traces* are ``to_plotly_json()`` dicts in figure order, *layout* the
+    layout dict and *origins* maps trace index to the call that created it.
+    """
+    trace_rows = []
+    by_subplot = {}
+    by_field = {}
+    for index, trace in enumerate(traces):
+        fields = field_sizes(trace, typed_arrays)
+        subplot = f"{trace.get('xaxis') or 'x'}{trace.get('yaxis') or 'y'}"
+        entry = dict(_sizes(fields.values()), index=index,
+                     type=trace.get("type"), name=trace.get("name"),
+                     subplot=subplot, origin=origins.get(index),
+                     fields=_ranked({k: _sizes([v]) for k, v in fields.items()}))
+        trace_rows.append(entry)
+        by_subplot.setdefault(subplot, []).append(
+            [entry["bytes"], entry["json_bytes"], entry["typed_bytes"]])
+        for key, value in fields.items():
+            by_field.setdefault(key, []).append(value)
+
+    layout_fields = {}
+    for key, value in field_sizes(layout, typed_arrays).items():
+        layout_fields.setdefault(key.partition(".")[0], []).append(value)
+    layout_fields = _ranked({k: _sizes(v) for k, v in layout_fields.items()})
+    layout_total = _sizes([[s["bytes"], s["json_bytes"], s["typed_bytes"]]
+                           for s in layout_fields.values()])
+
+    wrapper = len('{"data":[],"layout":{}}')
+    total = _sizes([[wrapper] * 3, list(layout_total.values())]
+                   + [[t["bytes"], t["json_bytes"], t["typed_bytes"]]
+                      for t in trace_rows])
+    return PayloadReport(
+        total=total,
+        layout=dict(layout_total, fields=layout_fields),
+        traces=trace_rows,
+        subplots=_ranked({k: _sizes(v) for k, v in by_subplot.items()}),
+        fields=_ranked({k: _sizes(v) for k, v in by_field.items()}),
+        offenders=sorted(trace_rows, key=lambda t: -t["bytes"])[:top],
+    )
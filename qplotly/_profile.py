@@ -0,0 +1,214 @@
+"""
+Per-stage timing for :func:`qplotly.profile`.
+
+Instrumented code calls :func:`stage` (a context manager) or is wrapped with
+:func:`timed`.  While no profile is active both reduce to a single global
+check, so the instrumentation can stay in place permanently.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+# The Profile currently collecting, or None
+_active = None
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name, figure=None):
+    """Context manager timing *name* (attributed to *figure*, or to the
+    enclosing stage's figure) when a profile is active."""
+    if _active is None:
+        return _NULL_STAGE
+    return _Stage(_active, name, figure)
+
+
+def timed(name, method=True):
+    """Decorator form of :func:`stage`.  For methods the figure is taken
+    from ``self`` (a QFigure, or an Axes via its ``_parent``)."""
+    def decorate(func):
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            figure = None
+            if method and args:
+                figure = getattr(args[0], "_parent", args[0])
+            with _Stage(_active, name, figure):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__module__ = func.__module__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorate
+
+
+class _Stage:
+    __slots__ = ("profile", "name", "figure", "start", "child")
+
+    def __init__(self, profile, name, figure):
+        self.profile = profile
+        self.name = name
+        self.figure = figure
+
+    def __enter__(self):
+        stack = self.profile._stack()
+        if self.figure is None and stack:
+            self.figure = stack[-1].figure
+        stack.append(self)
+        self.child = 0.0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        duration = end - self.start
+        stack = self.profile._stack()
+        stack.pop()
+        if stack:
+            stack[-1].child += duration
+        self.profile._record(self, duration, duration - self.child)
+        return False
+
+
+class Profile:
+    """Timings collected by :func:`qplotly.profile`.
+
+    Every instrumented call becomes an event ``(stage, figure, thread,
+    start, duration, self_time)``; *self_time* excludes nested stages.
+    Stages are ``Axes.<method>`` and ``QFigure.<method>`` for the public
+    API, plus ``to_numpy`` (input conversion), ``add_trace`` and
+    ``update_layout`` (graph-object validation on the figure),
+    ``make_subplots``, the finalize steps and ``serialize``/``write_image``.
+    Time spent building ``go.*`` trace objects shows up as the self time
+    of the ``Axes`` method that builds them.
+    """
+
+    def __init__(self, chrome_trace=None):
+        self.events = []
+        self._chrome_trace_path = chrome_trace
+        self._figures = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._previous = None
+        self._t0 = None
+        self.wall_s = None
+
+    # ---- collection -------------------------------------------------------
+
+    def __enter__(self):
+        global _active
+        self._previous, _active = _active, self
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        self.wall_s = time.perf_counter() - self._t0
+        _active = self._previous
+        if self._chrome_trace_path is not None:
+            self.chrome_trace(self._chrome_trace_path)
+        return False
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _record(self, stage, duration, self_time):
+        figure = stage.figure
+        with self._lock:
+            label = None
+            if figure is not None:
+                label = self._figures.setdefault(
+                    id(figure), f"figure-{len(self._figures) + 1}")
+            self.events.append((stage.name, label, threading.get_ident(),
+                                stage.start - self._t0, duration, self_time))
+
+    # ---- reporting --------------------------------------------------------
+
+    @staticmethod
+    def _aggregate(events):
+        stats = {}
+        for name, _, _, _, duration, self_time in events:
+            entry = stats.setdefault(name, {"calls": 0, "total_s": 0.0,
+                                            "self_s": 0.0})
+            entry["calls"] += 1
+            entry["total_s"] += duration
+            entry["self_s"] += self_time
+        return dict(sorted(stats.items(), key=lambda kv: -kv[1]["self_s"]))
+
+    def report(self):
+        """Aggregated timings as a dict::
+
+            {"wall_s": ..., "ops": {"add_trace": n, "update_layout": m},
+             "stages": {stage: {"calls", "total_s", "self_s"}},
+             "figures": {"figure-1": {stage: {...}}, ...}}
+        """
+        stages = self._aggregate(self.events)
+        figures = {}
+        for label in dict.fromkeys(e[1] for e in self.events if e[1]):
+            figures[label] = self._aggregate(
+                [e for e in self.events if e[1] == label])
+        return {
+            "wall_s": self.wall_s,
+            "ops": {op: stages.get(op, {}).get("calls", 0)
+                    for op in ("add_trace", "update_layout")},
+            "stages": stages,
+            "figures": figures,
+        }
+
+    def table(self):
+        """The per-stage report as a fixed-width text table."""
+        report = self.report()
+        lines = [f"{'stage':<36}{'calls':>8}{'total ms':>12}{'self ms':>12}"]
+        for name, entry in report["stages"].items():
+            lines.append(f"{name:<36}{entry['calls']:>8}"
+                         f"{entry['total_s'] * 1e3:>12.2f}"
+                         f"{entry['self_s'] * 1e3:>12.2f}")
+        ops = report["ops"]
+        lines.append(f"{len(report['figures'])} figure(s), "
+                     f"{ops['add_trace']} add_trace, "
+                     f"{ops['update_layout']} update_layout")
+        if self.wall_s is not None:
+            lines.append(f"wall time {self.wall_s * 1e3:.2f} ms")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table()
+
+    def chrome_trace(self, path=None):
+        """Events in Chrome trace-event format (``chrome://tracing``,
+        Perfetto).  Written to *path* as JSON if given; returned as a dict."""
+        pid = os.getpid()
+        trace = {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {"name": name, "cat": "qplotly", "ph": "X", "pid": pid,
+                 "tid": tid, "ts": start * 1e6, "dur": duration * 1e6,
+                 "args": {"figure": label} if label else {}}
+                for name, label, tid, start, duration, _ in self.events
+            ],
+        }
+        if path is not None:
+            import json
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
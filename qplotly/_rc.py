@@ -0,0 +1,391 @@
+"""
+``qplotly.rcParams`` and the cached style resolution built on it.
+
+Plotting methods turn a matplotlib format string and style keywords into
+plotly ``mode``/``line``/``marker`` values.  Both steps are pure functions of
+their arguments and of ``rcParams``, so they are memoized in LRU caches
+(:func:`parse_fmt`, :func:`line_style`) that are emptied whenever a
+parameter changes: a repeated style costs one dictionary lookup, with no
+parsing and no dict construction.
+
+Only the standard library is imported here, so ``import qplotly`` stays
+cheap.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+import re
+
+# Plotly's qualitative colours, the default colour cycle (``C0``-``C9``)
+DEFAULT_COLORS = [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+]
+
+# ---- format-string grammar ----------------------------------------------------
+# matplotlib's: at most one each of colour, marker and line style, any order
+
+FMT_COLORS = {
+    "b": "blue", "g": "green", "r": "red", "c": "cyan",
+    "m": "magenta", "y": "yellow", "k": "black", "w": "white",
+}
+
+# CSS colour names, which plotly accepts; tried on the whole format string
+# before the grammar, so that 'green' is not read as 'g', 'r', 'e'...
+CSS_COLORS = frozenset("""
+    aliceblue antiquewhite aqua aquamarine azure beige bisque black
+    blanchedalmond blue blueviolet brown burlywood cadetblue chartreuse
+    chocolate coral cornflowerblue cornsilk crimson cyan darkblue
+    darkcyan darkgoldenrod darkgray darkgreen darkgrey darkkhaki
+    darkmagenta darkolivegreen darkorange darkorchid darkred darksalmon
+    darkseagreen darkslateblue darkslategray darkslategrey darkturquoise
+    darkviolet deeppink deepskyblue dimgray dimgrey dodgerblue firebrick
+    floralwhite forestgreen fuchsia gainsboro ghostwhite gold goldenrod
+    gray green greenyellow grey honeydew hotpink indianred indigo ivory
+    khaki lavender lavenderblush lawngreen lemonchiffon lightblue
+    lightcoral lightcyan lightgoldenrodyellow lightgray lightgreen
+    lightgrey lightpink lightsalmon lightseagreen lightskyblue
+    lightslategray lightslategrey lightsteelblue lightyellow lime
+    limegreen linen magenta maroon mediumaquamarine mediumblue
+    mediumorchid mediumpurple mediumseagreen mediumslateblue
+    mediumspringgreen mediumturquoise mediumvioletred midnightblue
+    mintcream mistyrose moccasin navajowhite navy oldlace olive
+    olivedrab orange orangered orchid palegoldenrod palegreen
+    paleturquoise palevioletred papayawhip peachpuff peru pink plum
+    powderblue purple rebeccapurple red rosybrown royalblue saddlebrown
+    salmon sandybrown seagreen seashell sienna silver skyblue slateblue
+    slategray slategrey snow springgreen steelblue tan teal thistle
+    tomato turquoise violet wheat white whitesmoke yellow yellowgreen
+""".split())
+
+FMT_MARKERS = {
+    ".": "circle", ",": "square", "o": "circle",
+    "v": "triangle-down", "^": "triangle-up",
+    "<": "triangle-left", ">": "triangle-right",
+    "1": "y-down", "2": "y-up", "3": "y-left", "4": "y-right",
+    "8": "octagon", "s": "square", "p": "pentagon", "P": "cross",
+    "*": "star", "h": "hexagon", "H": "hexagon2",
+    "+": "cross-thin", "x": "x-thin", "X": "x",
+    "D": "diamond", "d": "diamond-tall", "|": "line-ns", "_": "line-ew",
+}
+
+FMT_LINES = {
+    "-": "solid", "--": "dash", "-.": "dashdot", ":": "dot",
+}
+
+# Line style names matplotlib also accepts as keywords; "None" means no line
+_LINE_NAMES = {"solid": "solid", "dashed": "dash", "dashdot": "dashdot",
+               "dotted": "dot", "None": None, "none": None, " ": None, "": None}
+
+# Marker size relative to lines.markersize ('.' point, ',' pixel)
+_MARKER_SCALE = {".": 0.5, ",": 1 / 6}
+
+# Stroke-only plotly symbols, invisible without a marker line
+THIN_SYMBOLS = {"cross-thin", "x-thin", "y-down", "y-up", "y-left",
+                 "y-right", "line-ns", "line-ew"}
+
+_CYCLE_COLOR = re.compile(r"C(\d+)")
+
+
+# ---- parameters ---------------------------------------------------------------
+
+def _positive(value):
+    value = float(value)
+    if value <= 0:
+        raise ValueError(f"must be positive, got {value}")
+    return value
+
+
+def _count(value):
+    value = int(value)
+    if value < 0:
+        raise ValueError(f"must be non-negative, got {value}")
+    return value
+
+
+def _colors(value):
+    value = [str(c) for c in value]
+    if not value:
+        raise ValueError("colour cycle must not be empty")
+    return value
+
+
+def _precision(value):
+    if value not in ("float64", "float32"):
+        raise ValueError(f"must be 'float64' or 'float32', got {value!r}")
+    return value
+
+
+# name -> (default, validator)
+_PARAMS = {
+    "lines.linewidth": (2.0, _positive),
+    "lines.markersize": (6.0, _positive),
+    "font.family": ("Computer Modern, CMU Serif, serif", str),
+    "font.size": (12.0, _positive),
+    "axes.color_cycle": (DEFAULT_COLORS, _colors),
+    # Axes.texts(gl='auto') draws with WebGL above this many labels
+    "gl.threshold": (5000, _count),
+    # 'float32' halves the payload of float plot/scatter/errorbar values
+    # (date axes stay float64)
+    "data.precision": ("float64", _precision),
+    # Entries of each style resolution cache
+    "style.cache_size": (256, _count),
+}
+
+
+class RcParams(dict):
+    """Validated qplotly settings, in the manner of ``matplotlib.rcParams``.
+
+    Unknown names raise KeyError and invalid values ValueError.  Changing
+    a value empties the style caches; figures created afterwards use it.
+    """
+
+    def __setitem__(self, key, value):
+        if key not in _PARAMS:
+            raise KeyError(f"{key!r} is not a valid rc parameter "
+                           f"(see qplotly.rcParams.keys())")
+        try:
+            value = _PARAMS[key][1](value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"invalid value for rcParams[{key!r}]: "
+                             f"{exc}") from None
+        super().__setitem__(key, value)
+        if key == "style.cache_size":
+            _build_caches()
+        else:
+            _clear_caches()
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        raise TypeError("rcParams does not support setdefault")
+
+    def __delitem__(self, key):
+        raise TypeError("rc parameters cannot be deleted; see rcdefaults()")
+
+    def copy(self):
+        return dict(self)
+
+
+rcParams = RcParams()
+
+
+def rcdefaults():
+    """Restore every rc parameter to its default."""
+    rcParams.update({key: default for key, (default, _) in _PARAMS.items()})
+
+
+@contextlib.contextmanager
+def rc_context(rc=None):
+    """Temporarily change rc parameters; the old values return on exit."""
+    saved = rcParams.copy()
+    try:
+        if rc:
+            rcParams.update(rc)
+        yield rcParams
+    finally:
+        resized = rcParams["style.cache_size"] != saved["style.cache_size"]
+        dict.update(rcParams, saved)
+        if resized:
+            _build_caches()
+        else:
+            _clear_caches()
+
+
+# ---- style resolution ---------------------------------------------------------
+
+def to_color(color):
+    """Resolve matplotlib colour shorthands - ``'C0'``-``'C9'`` (the colour
+    cycle), single letters ``'r'``, ``'k'``, ... and grey levels ``'0.5'``;
+    anything else is returned unchanged."""
+    if not isinstance(color, str):
+        return color
+    if color in FMT_COLORS:
+        return FMT_COLORS[color]
+    match = _CYCLE_COLOR.fullmatch(color)
+    if match:
+        cycle = rcParams["axes.color_cycle"]
+        return cycle[int(match.group(1)) % len(cycle)]
+    try:
+        level = float(color)
+    except ValueError:
+        return color
+    if 0 <= level <= 1:
+        v = round(level * 255)
+        return f"rgb({v},{v},{v})"
+    return color
+
+
+def dash(linestyle):
+    """Plotly ``line.dash`` for a matplotlib or plotly line style (None for
+    no line, as well as for no style given)."""
+    if linestyle is None:
+        return None
+    if linestyle in FMT_LINES:
+        return FMT_LINES[linestyle]
+    return _LINE_NAMES.get(linestyle, linestyle)
+
+
+def symbol(marker):
+    """Plotly marker symbol for a matplotlib marker code or plotly name."""
+    return FMT_MARKERS.get(marker, marker)
+
+
+def _parse_fmt(fmt):
+    """``(color, marker, linestyle)`` codes of a matplotlib format string,
+    e.g. ``'ro--'`` -> ``('r', 'o', '--')``.
+
+    Like matplotlib, a marker without a line style means no line
+    (``linestyle='None'``), and a string that is not in the grammar but is
+    a colour on its own - ``'red'``, ``'#ff0000'``, ``'0.5'`` - sets only
+    the colour.  As matplotlib does with ``to_rgba``, a whole-string colour
+    is recognised before the grammar is tried.
+    """
+    if fmt.lower() in CSS_COLORS or fmt.startswith(("#", "rgb", "hsl")):
+        return fmt, None, None
+    try:
+        return _parse_codes(fmt)
+    except _Unrecognized:
+        if (fmt.isalpha()
+                or _CYCLE_COLOR.fullmatch(fmt) or _is_number(fmt)):
+            return fmt, None, None
+        raise
+
+
+class _Unrecognized(ValueError):
+    pass
+
+
+def _is_number(s):
+    try:
+        float(s)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_codes(fmt):
+    color = marker = linestyle = None
+    i = 0
+    while i < len(fmt):
+        two, ch = fmt[i:i + 2], fmt[i]
+        if two in ("--", "-."):
+            code, kind = two, "linestyle"
+        elif ch == "C" and two[1:].isdigit():
+            code, kind = two, "color"  # like matplotlib, one digit only
+        elif ch in FMT_LINES:
+            code, kind = ch, "linestyle"
+        elif ch in FMT_MARKERS:
+            code, kind = ch, "marker"
+        elif ch in FMT_COLORS:
+            code, kind = ch, "color"
+        else:
+            raise _Unrecognized(f"unrecognized character {ch!r} in format "
+                             f"string {fmt!r}")
+        i += len(code)
+        if kind == "color":
+            if color is not None:
+                raise ValueError(f"illegal format string {fmt!r}: two "
+                                 f"color symbols")
+            color = code
+        elif kind == "marker":
+            if marker is not None:
+                raise ValueError(f"illegal format string {fmt!r}: two "
+                                 f"marker symbols")
+            marker = code
+        else:
+            if linestyle is not None:
+                raise ValueError(f"illegal format string {fmt!r}: two "
+                                 f"linestyle symbols")
+            linestyle = code
+    if marker is not None and linestyle is None:
+        linestyle = "None"
+    return color, marker, linestyle
+
+
+class FrozenDict(dict):
+    """Read-only dict for values shared through the style caches.
+
+    Still a ``dict``, which plotly's validators require; copies are plain
+    dicts, so callers that need to change one can ``dict(style.line)``.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("cached style values are read-only; copy with dict()")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        import copy
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+
+# Resolved Scatter styling, shared between calls: line and marker are
+# FrozenDicts
+LineStyle = collections.namedtuple("LineStyle", "mode line marker")
+
+
+def _line_style(color, linestyle, marker, linewidth, markersize):
+    """Scatter ``mode``, ``line`` and ``marker`` for already-resolved
+    colour and matplotlib line/marker codes.  Width and size are left to the
+    template unless given (or the marker needs them)."""
+    dash_ = dash(linestyle)
+    has_line = linestyle is None or dash_ is not None
+    mode = "lines" if has_line else "markers"
+    line = FrozenDict(color=color, width=linewidth, dash=dash_)
+    marker_dict = None
+    if marker:
+        mode = "lines+markers" if has_line else "markers"
+        symbol_ = symbol(marker)
+        size = markersize
+        if marker in _MARKER_SCALE:
+            size = (size or rcParams["lines.markersize"]) * _MARKER_SCALE[marker]
+        marker_dict = FrozenDict(
+            symbol=symbol_, size=size, color=color,
+            # stroke-only symbols are drawn with the marker line
+            line=FrozenDict(color=color, width=1)
+            if symbol_ in THIN_SYMBOLS else None)
+    return LineStyle(mode, line, marker_dict)
+
+
+parse_fmt = None
+line_style = None
+
+
+def _build_caches():
+    global parse_fmt, line_style
+    size = rcParams["style.cache_size"]
+    parse_fmt = functools.lru_cache(maxsize=size)(_parse_fmt)
+    line_style = functools.lru_cache(maxsize=size)(_line_style)
+
+
+def _clear_caches():
+    if parse_fmt is not None:
+        parse_fmt.cache_clear()
+        line_style.cache_clear()
+
+
+def cache_info():
+    """Hit/miss counters of the format-string and style caches."""
+    return {"parse_fmt": parse_fmt.cache_info()._asdict(),
+            "line_style": line_style.cache_info()._asdict()}
+
+
+for _key, (_default, _validate) in _PARAMS.items():
+    dict.__setitem__(rcParams, _key, _validate(_default))
+_build_caches()
@@ -0,0 +1,330 @@
+"""
+Data-reduction helpers that keep figure payloads proportional to screen
+size rather than input size.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+
+import numpy as np
+
+
+_REDUCERS = {
+    "mean": (np.mean, np.nanmean),
+    "max": (np.max, np.nanmax),
+    "min": (np.min, np.nanmin),
+}
+
+
+def block_factors(shape, max_pixels):
+    """Row/column block sizes ``(fy, fx)`` that fit *shape* into *max_pixels*.
+
+    *max_pixels* is either a total cell budget (int) or a ``(width, height)``
+    pair.  Returns ``(1, 1)`` when the array already fits.
+    """
+    h, w = shape
+    if isinstance(max_pixels, (tuple, list)):
+        width, height = max_pixels
+        return max(math.ceil(h / height), 1), max(math.ceil(w / width), 1)
+    if h * w <= max_pixels:
+        return 1, 1
+    fy = min(math.ceil(math.sqrt(h * w / max_pixels)), h)
+    rows = math.ceil(h / fy)
+    fx = max(math.ceil(w / max(max_pixels // rows, 1)), 1)
+    return fy, fx
+
+
+def block_reduce(z, fy, fx, how="mean"):
+    """Reduce each ``fy x fx`` block of the 2-D array *z* to one value.
+
+    *how* is ``'mean'``, ``'max'``, ``'min'`` or ``'first'``.  Full blocks are
+    reduced with a single strided reshape; a ragged last row/column of blocks
+    is reduced separately.  ``'first'`` and ``(1, 1)`` factors return views.
+    """
+    if fy == 1 and fx == 1:
+        return z
+    if how == "first":
+        return z[::fy, ::fx]
+    if how not in _REDUCERS:
+        raise ValueError(f"reduce must be one of 'mean', 'max', 'min', "
+                         f"'first', got {how!r}")
+
+    plain, nan_aware = _REDUCERS[how]
+    func = plain
+    if np.issubdtype(z.dtype, np.floating) and np.isnan(z).any():
+        func = nan_aware
+
+    h, w = z.shape
+    H, W = h - h % fy, w - w % fx
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN blocks
+        out = func(z[:H, :W].reshape(H // fy, fy, W // fx, fx), axis=(1, 3))
+        if W < w:
+            right = func(z[:H, W:].reshape(H // fy, fy, w - W), axis=(1, 2))
+            out = np.concatenate([out, right[:, None]], axis=1)
+        if H < h:
+            bottom = func(z[H:, :W].reshape(h - H, W // fx, fx), axis=(0, 2))
+            if W < w:
+                bottom = np.append(bottom, func(z[H:, W:]))
+            out = np.concatenate([out, bottom[None, :]], axis=0)
+    return out
+
+
+def reduce_coords(c, n, f, how="mean"):
+    """Coordinates matching a length-*n* axis reduced by blocks of *f*.
+
+    *c* may be ``None`` (implicit ``0..n-1``), ``n`` cell centres or
+    ``n + 1`` cell edges.  Centres become block centres (or the first
+    sample's coordinate for ``how='first'``); edges keep every *f*-th edge.
+    """
+    if f == 1:
+        return c
+    if c is None:
+        c = np.arange(n)
+    c = np.asarray(c)
+    if len(c) == n + 1:
+        edges = c[::f]
+        return edges if n % f == 0 else np.append(edges, c[-1])
+    if how == "first" or not np.issubdtype(c.dtype, np.number):
+        return c[::f]
+    return block_reduce(c[None, :].astype(float), 1, f, "mean")[0]
+
+
+def bin_points(x, y, width, height, x_range, y_range, c=None, how="count"):
+    """Aggregate scattered points onto a ``(height, width)`` grid.
+
+    *how* is ``'count'`` (points per cell), ``'mean'`` or ``'max'`` of *c*.
+    Points outside the ranges or with non-finite coordinates/values are
+    dropped; cells that receive no points are NaN.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    (x0, x1), (y0, y1) = x_range, y_range
+    sx = width / (x1 - x0) if x1 > x0 else 0.0
+    sy = height / (y1 - y0) if y1 > y0 else 0.0
+    with np.errstate(invalid="ignore"):  # NaN/inf are masked out below
+        ix = np.floor((x - x0) * sx).astype(np.intp)
+        iy = np.floor((y - y0) * sy).astype(np.intp)
+    # points exactly on the upper edge belong to the last cell
+    ix[x == x1] = width - 1
+    iy[y == y1] = height - 1
+    keep = (np.isfinite(x) & np.isfinite(y)
+            & (ix >= 0) & (ix < width) & (iy >= 0) & (iy < height))
+    if how != "count":
+        if c is None:
+            raise ValueError(f"how={how!r} needs values c")
+        c = np.asarray(c, dtype=float).ravel()
+        keep &= np.isfinite(c)
+        c = c[keep]
+    lin = iy[keep] * width + ix[keep]
+
+    size = width * height
+    counts = np.bincount(lin, minlength=size).astype(float)
+    if how == "count":
+        grid = counts
+    elif how == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            grid = np.bincount(lin, weights=c, minlength=size) / counts
+    elif how == "max":
+        grid = np.full(size, -np.inf)
+        np.maximum.at(grid, lin, c)
+    else:
+        raise ValueError(f"how must be 'count', 'mean' or 'max', got {how!r}")
+    grid[counts == 0] = np.nan
+    return grid.reshape(height, width)
+
+
+def cull_overlaps(x0, y0, x1, y1, order=None):
+    """Mask of the boxes ``[x0, x1] x [y0, y1]`` that survive greedy
+    overlap removal.
+
+    Boxes are visited in *order* (default: input order), and each is kept
+    only if it overlaps no box kept before it.  Kept boxes are indexed in a
+    uniform grid whose cells are as large as the largest box, so each test
+    only looks at the 3x3 cells around the box's corner.  Boxes with
+    non-finite coordinates are dropped.
+    """
+    x0, y0, x1, y1 = (np.asarray(a, dtype=float).ravel()
+                      for a in (x0, y0, x1, y1))
+    keep = np.zeros(x0.size, dtype=bool)
+    finite = np.isfinite(x0) & np.isfinite(y0) & np.isfinite(x1) & np.isfinite(y1)
+    if not finite.any():
+        return keep
+    cw = max(float(np.max((x1 - x0)[finite])), 1e-9)
+    ch = max(float(np.max((y1 - y0)[finite])), 1e-9)
+    with np.errstate(invalid="ignore"):
+        cx = np.floor(x0 / cw)
+        cy = np.floor(y0 / ch)
+    if order is None:
+        order = np.flatnonzero(finite)
+    else:
+        order = np.asarray(order)
+        order = order[finite[order]]
+
+    # plain lists: the loop is per box, and list indexing beats NumPy's
+    bx0, by0, bx1, by1 = x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()
+    gx, gy = cx.tolist(), cy.tolist()
+    grid = {}
+    for i in order.tolist():
+        a, b, c, d = bx0[i], by0[i], bx1[i], by1[i]
+        u, v = gx[i], gy[i]
+        if any(bx0[j] < c and a < bx1[j] and by0[j] < d and b < by1[j]
+               for du in (-1, 0, 1) for dv in (-1, 0, 1)
+               for j in grid.get((u + du, v + dv), ())):
+            continue
+        keep[i] = True
+        grid.setdefault((u, v), []).append(i)
+    return keep
+
+
+class M4:
+    """Running per-bucket first/min/max/last of a 1-D signal of length *n*.
+
+    The signal is fed in order, chunk by chunk, through :meth:`add`; state is
+    four values per bucket, so memory stays O(*buckets*) however long the
+    signal is.  :meth:`result` returns the (up to four per bucket) samples
+    whose polyline is pixel-identical to the full-resolution one when each
+    bucket maps to one pixel column.
+    """
+
+    def __init__(self, n, buckets):
+        self.n = int(n)
+        self.buckets = max(min(int(buckets), self.n), 1)
+        self._allocate(self.buckets)
+
+    def _allocate(self, b):
+        self.first_idx = np.full(b, -1, dtype=np.int64)
+        self.last_idx = np.full(b, -1, dtype=np.int64)
+        self.min_idx = np.full(b, -1, dtype=np.int64)
+        self.max_idx = np.full(b, -1, dtype=np.int64)
+        self.first_val = np.full(b, np.nan)
+        self.last_val = np.full(b, np.nan)
+        self.min_val = np.full(b, np.inf)
+        self.max_val = np.full(b, -np.inf)
+
+    def _bucket(self, idx):
+        return idx * self.buckets // self.n
+
+    def add(self, start, values):
+        """Feed samples ``start .. start + len(values) - 1``."""
+        values = np.asarray(values, dtype=float).ravel()
+        if not values.size:
+            return
+        bucket = self._bucket(np.arange(start, start + values.size,
+                                        dtype=np.int64))
+        # bucket ids are non-decreasing, so each bucket is one contiguous run
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(bucket)) + 1])
+        ends = np.append(starts[1:], values.size) - 1
+        ids = bucket[starts]
+        self._update(start, values, ids, starts, ends)
+
+    def _update(self, start, values, ids, starts, ends):
+        first = self.first_idx[ids] < 0
+        self.first_idx[ids[first]] = start + starts[first]
+        self.first_val[ids[first]] = values[starts[first]]
+        self.last_idx[ids] = start + ends
+        self.last_val[ids] = values[ends]
+
+        seg_of = np.repeat(np.arange(ids.size), ends - starts + 1)
+        for reducer, best_idx, best_val, better in (
+                (np.fmin, self.min_idx, self.min_val, np.less),
+                (np.fmax, self.max_idx, self.max_val, np.greater)):
+            seg = reducer.reduceat(values, starts)
+            valid = ~np.isnan(seg)
+            # first sample equal to the extreme value in each segment
+            hits = np.flatnonzero(values == seg[seg_of])
+            pos = hits[np.searchsorted(seg_of[hits], np.flatnonzero(valid))]
+            upd = better(seg[valid], best_val[ids[valid]])
+            target = ids[valid][upd]
+            best_idx[target] = start + pos[upd]
+            best_val[target] = seg[valid][upd]
+
+    def result(self):
+        """``(indices, values)`` of the retained samples in signal order."""
+        filled = self.first_idx >= 0
+        idx = np.stack([self.first_idx, self.min_idx,
+                        self.max_idx, self.last_idx], axis=1)[filled]
+        val = np.stack([self.first_val, self.min_val,
+                        self.max_val, self.last_val], axis=1)[filled]
+        # buckets with no finite samples have no min/max: reuse "first"
+        missing = idx < 0
+        idx[missing] = np.broadcast_to(idx[:, :1], idx.shape)[missing]
+        val[missing] = np.broadcast_to(val[:, :1], val.shape)[missing]
+        order = np.argsort(idx, axis=1, kind="stable")
+        idx = np.take_along_axis(idx, order, axis=1).ravel()
+        val = np.take_along_axis(val, order, axis=1).ravel()
+        keep = np.concatenate([[True], np.diff(idx) != 0])
+        return idx[keep], val[keep]
+
+
+class StreamEnvelope(M4):
+    """:class:`M4` for signals of unknown length, plus a per-bucket mean.
+
+    Buckets start one sample wide; whenever the signal outgrows
+    ``2 * pixels`` buckets, neighbouring pairs are merged and the width
+    doubles.  The final signal therefore spans between *pixels* and
+    ``2 * pixels`` buckets, and memory never depends on its length.
+    """
+
+    def __init__(self, pixels):
+        self.pixels = max(int(pixels), 1)
+        self.buckets = 2 * self.pixels
+        self.width = 1
+        self._allocate(self.buckets)
+        self.sum = np.zeros(self.buckets)
+        self.count = np.zeros(self.buckets, dtype=np.int64)
+
+    def _bucket(self, idx):
+        return idx // self.width
+
+    def add(self, start, values):
+        last = start + np.size(values) - 1
+        while last // self.width >= self.buckets:
+            self._merge()
+        super().add(start, values)
+
+    def _update(self, start, values, ids, starts, ends):
+        super()._update(start, values, ids, starts, ends)
+        finite = np.isfinite(values)
+        self.sum[ids] += np.add.reduceat(np.where(finite, values, 0), starts)
+        self.count[ids] += np.add.reduceat(finite.astype(np.int64), starts)
+
+    def _merge(self):
+        """Combine buckets pairwise and double the bucket width."""
+        half = self.buckets // 2
+
+        def collapse(arr, pick_right, empty):
+            pair = arr.reshape(half, 2)
+            merged = np.where(pick_right, pair[:, 1], pair[:, 0])
+            arr[:half] = merged
+            arr[half:] = empty
+
+        left_empty = self.first_idx.reshape(half, 2)[:, 0] < 0
+        collapse(self.first_idx, left_empty, -1)
+        collapse(self.first_val, left_empty, np.nan)
+        right_filled = self.last_idx.reshape(half, 2)[:, 1] >= 0
+        collapse(self.last_idx, right_filled, -1)
+        collapse(self.last_val, right_filled, np.nan)
+        for idx, val, better, empty in (
+                (self.min_idx, self.min_val, np.less, np.inf),
+                (self.max_idx, self.max_val, np.greater, -np.inf)):
+            pair = val.reshape(half, 2)
+            right = better(pair[:, 1], pair[:, 0])
+            collapse(idx, right, -1)
+            collapse(val, right, empty)
+        for acc in (self.sum, self.count):
+            pair = acc.reshape(half, 2).sum(axis=1)
+            acc[:half] = pair
+            acc[half:] = 0
+        self.width *= 2
+
+    def envelope(self):
+        """Per-bucket ``(first_idx, last_idx, min, max, mean)`` for the
+        buckets that received samples."""
+        filled = self.first_idx >= 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.sum[filled] / self.count[filled]
+        return (self.first_idx[filled], self.last_idx[filled],
+                self.min_val[filled], self.max_val[filled], mean)
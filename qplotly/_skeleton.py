@@ -0,0 +1,75 @@
+"""
+LRU cache of the layouts new :class:`qplotly.QFigure` objects start from.
+
+For the same ``(nrows, ncols, sharex, sharey, figsize, ...)`` arguments and
+style rcParams, the layout built by ``make_subplots`` plus the default
+styling never changes, so it is built once and later figures are created
+from the cached layout dict and subplot grid reference, skipping
+``make_subplots`` entirely.
+Subplot titles enter the key only by which cells have one; the text is
+filled in per figure.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+# Distinct argument combinations kept
+MAXSIZE = 64
+
+_lock = threading.Lock()
+_entries = OrderedDict()
+_hits = 0
+_misses = 0
+
+
+def freeze(value):
+    """Hashable form of a ``make_subplots`` argument; TypeError if there
+    is none."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+def get(key, build):
+    """Cached ``(layout, grid_ref, grid_str)`` for *key*, calling
+    ``build()`` to make it on a miss.  The entry is shared: don't mutate."""
+    global _hits, _misses
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            _hits += 1
+            return entry
+    entry = build()
+    with _lock:
+        _misses += 1
+        _entries[key] = entry
+        while len(_entries) > MAXSIZE:
+            _entries.popitem(last=False)
+    return entry
+
+
+def info():
+    """Hit/miss counters and current size of the cache."""
+    with _lock:
+        lookups = _hits + _misses
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "hit_rate": _hits / lookups if lookups else 0.0,
+            "size": len(_entries),
+            "maxsize": MAXSIZE,
+        }
+
+
+def clear():
+    """Drop every entry and reset the counters."""
+    global _hits, _misses
+    with _lock:
+        _entries.clear()
+        _hits = _misses = 0
@@ -0,0 +1,86 @@
+"""
+qplotly's default matplotlib-like look, as a named plotly template.
+
+Registering the style once as ``plotly.io.templates["qplotly"]`` lets every
+figure reference it instead of carrying its own copy: plotly.js applies
+``template.layout.xaxis``/``yaxis`` to all ``xaxisN``/``yaxisN`` and
+``template.data.<type>`` to every trace of that type, so per-axis and
+per-trace objects hold only what differs from the defaults.
+
+The template figures get is plotly's default template
+(``plotly.io.templates.default``, normally ``"plotly"``) with the qplotly
+overrides merged on top, as ``"plotly+qplotly"`` would be, so everything
+the style does not override - heatmap/contour colorscales,
+``autotypenumbers='strict'``, ... - behaves as in a plain plotly figure.
+
+Line width, marker size and font come from :data:`qplotly.rcParams`; the
+template is rebuilt (and re-registered) when they change.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from . import _rc
+
+TEMPLATE = "qplotly"
+
+_AXIS = dict(
+    showline=True,           # Show axis border (frame)
+    linewidth=2,             # Thicker frame line (like matplotlib)
+    linecolor="black",
+    mirror=True,             # Show frame on all sides
+    showgrid=True,           # Show grid
+    gridwidth=0.5,           # Thinner grid lines than frame
+    gridcolor="rgba(0, 0, 0, 0.5)",  # Black with 50% opacity
+    zeroline=False,          # Don't emphasize zero line
+    ticks="outside",         # Ticks extend outside plot frame
+    ticklen=5,               # Length of tick marks
+    tickwidth=1.5,           # Tick thickness
+    tickcolor="black",
+)
+
+_lock = threading.Lock()
+_template = None
+_key = None
+
+
+def key():
+    """The plotly default template and rc values the template is built
+    from."""
+    rc = _rc.rcParams
+    return (pio.templates.default, rc["lines.linewidth"],
+            rc["lines.markersize"], rc["font.family"], rc["font.size"])
+
+
+def template():
+    """Plotly's default template with the qplotly overrides for the current
+    rcParams on top.  The overrides alone are registered as ``"qplotly"``."""
+    global _template, _key
+    with _lock:
+        if _template is None or _key != key():
+            _key = key()
+            base, linewidth, markersize, family, size = _key
+            # Trace defaults the template supplies; plotting methods omit them
+            overrides = go.layout.Template(
+                layout=dict(
+                    plot_bgcolor="white",
+                    paper_bgcolor="white",
+                    font=dict(family=family, size=size, color="black"),
+                    xaxis=_AXIS,
+                    yaxis=_AXIS,
+                ),
+                data=dict(
+                    scatter=[go.Scatter(line=dict(width=linewidth),
+                                        marker=dict(size=markersize))],
+                    scattergl=[go.Scattergl(line=dict(width=linewidth),
+                                            marker=dict(size=markersize))],
+                ),
+            )
+            pio.templates[TEMPLATE] = overrides
+            _template = (pio.templates.merge_templates(base, overrides)
+                         if base else overrides)
+        return _template